@@ -1,180 +1,233 @@
 # app.py
-from flask import Flask, render_template, request, redirect, url_for, session, make_response, flash
+from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify, send_file
 import io
 import os
+import time
 import traceback
+from concurrent.futures import TimeoutError as FuturesTimeoutError, as_completed
 
-# Import the specific template files based on your project structure image
-# Assuming each template_X.py file contains a 'generate_pdf' function
-# You only need to import the templates you list in AVAILABLE_TEMPLATES
-# Let's import all shown in the image up to 20 for completeness in the AVAILABLE_TEMPLATES config
-from pdf_templates import (
-    template_1, template_2, template_3, template_4, template_5,
-    template_6, template_7, template_8, template_9, template_10,
-    template_11, template_12, template_14, template_15,
-    template_16, template_17, template_18, template_19, template_20
-)
+from werkzeug.exceptions import HTTPException
+
+from render_cache import RenderCache, cache_key, canonical_json
+from render_jobs import QueueFullError, RenderJobManager, render_thumbnail_bytes
+from render_metrics import RenderMetrics
+from resume_defaults import DEFAULT_SECTION_ORDER, REORDERABLE_SECTIONS, SAMPLE_RESUME_DATA
+from form_schema import parse_resume_form, validate_resume_data
+from session_store import ServerSideSessionInterface, create_session_store
+from warmup import WarmUp
+from zip_stream import stream_zip
+from pdf_templates.assets import asset_path
+from pdf_templates.registry import discover_templates
+from pdf_templates.rendering import RenderContext
 
 
 app = Flask(__name__)
 # IMPORTANT: Change this secret key for production!
 app.secret_key = os.urandom(24) # For session management and flash messages
 
+# --- Server-Side Sessions ---
+# resume_data lives on the server; the session cookie only carries an opaque id.
+# SESSION_BACKEND: 'sqlite' (the default; all workers on one host), 'redis' (several hosts) or
+# 'memory' (one process only, for development and tests: other workers would not see the session).
+app.session_interface = ServerSideSessionInterface(
+    create_session_store(
+        os.environ.get('SESSION_BACKEND', 'sqlite'),
+        sqlite_path=os.environ.get('SESSION_SQLITE_PATH', os.path.join(app.instance_path, 'sessions.sqlite3')),
+        redis_url=os.environ.get('SESSION_REDIS_URL'),
+        max_entries=int(os.environ.get('SESSION_MAX_ENTRIES', 10000)),
+    ),
+    ttl=int(os.environ.get('SESSION_TTL_SECONDS', 24 * 60 * 60)),
+)
+
+# --- Rendered PDF Cache ---
+# Repeat downloads of the same data + template are served from here instead of re-running ReportLab.
+# Set PDF_CACHE_DIR to add an on-disk tier shared by every worker on the host (PDF_CACHE_MAX_DISK_BYTES bounds
+# the directory as a whole; memory limits are per process).
+pdf_cache = RenderCache(
+    max_entries=int(os.environ.get('PDF_CACHE_MAX_ENTRIES', 256)),
+    max_bytes=int(os.environ.get('PDF_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+    disk_dir=os.environ.get('PDF_CACHE_DIR') or None,
+    max_disk_bytes=int(os.environ.get('PDF_CACHE_MAX_DISK_BYTES', 512 * 1024 * 1024)),
+)
+
+# --- Thumbnail Cache ---
+# Page-1 images served by /preview/<template_id>.png|.webp, keyed like the PDFs plus width and format.
+# With PDF_CACHE_DIR set they are also kept on disk, in its 'thumbnails' subdirectory.
+thumbnail_cache = RenderCache(
+    max_entries=int(os.environ.get('THUMBNAIL_CACHE_MAX_ENTRIES', 512)),
+    max_bytes=int(os.environ.get('THUMBNAIL_CACHE_MAX_BYTES', 32 * 1024 * 1024)),
+    disk_dir=os.path.join(os.environ['PDF_CACHE_DIR'], 'thumbnails') if os.environ.get('PDF_CACHE_DIR') else None,
+    max_disk_bytes=int(os.environ.get('THUMBNAIL_CACHE_MAX_DISK_BYTES', 128 * 1024 * 1024)),
+    suffix='.img',
+)
+THUMBNAIL_WIDTH = 400  # Pixels, when the request does not ask for a width
+THUMBNAIL_MIN_WIDTH = 100
+THUMBNAIL_MAX_WIDTH = 1200
+THUMBNAIL_WIDTH_STEP = 50  # Requested widths are rounded to this, so near-identical sizes share cache entries
+
+# --- Background Render Jobs ---
+# Renders submitted through /render-jobs run in a process pool, keeping request threads free.
+# RENDER_MAX_PENDING bounds unfinished jobs (429 beyond it); RENDER_JOB_TIMEOUT is per job, in seconds.
+# /download-all queues all its uncached templates at once or none, so keep the limit above the template count.
+# A job's id is its PDF cache key and the finished PDF goes into pdf_cache. With PDF_CACHE_DIR set, job
+# status records are kept in its 'jobs' subdirectory too, so any worker on the host can answer a poll.
+render_jobs = RenderJobManager(
+    max_workers=int(os.environ.get('RENDER_WORKERS', 0)) or None,  # 0 = one per CPU
+    max_pending=int(os.environ.get('RENDER_MAX_PENDING', 32)),
+    timeout=int(os.environ.get('RENDER_JOB_TIMEOUT', 60)),
+    result_ttl=int(os.environ.get('RENDER_RESULT_TTL', 600)),
+    on_complete=lambda job: pdf_cache.put(job.cache_key, job.result),
+    deterministic=True,  # Results are cached and served under the cache key as a strong ETag
+    status_cache=RenderCache(
+        max_entries=0, max_bytes=0,  # Disk only: records change, and other workers rewrite them there
+        disk_dir=os.path.join(os.environ['PDF_CACHE_DIR'], 'jobs'),
+        max_disk_bytes=int(os.environ.get('RENDER_JOB_STATUS_MAX_DISK_BYTES', 4 * 1024 * 1024)),
+        suffix='.json',
+    ) if os.environ.get('PDF_CACHE_DIR') else None,
+)
+
+# --- Render Metrics ---
+# Per-stage timings, page counts and sizes, served in Prometheus text format at /metrics.
+render_metrics = RenderMetrics()
+
+# --- JSON API ---
+# POST /api/render/<template_id> renders resume JSON without a session. Bodies over API_ASYNC_THRESHOLD_BYTES,
+# or sent with 'Prefer: respond-async', get a render job handle (202) instead of the PDF.
+API_ASYNC_THRESHOLD_BYTES = int(os.environ.get('API_ASYNC_THRESHOLD_BYTES', 256 * 1024))
+
 # --- Template Configuration ---
-# Update keys and generators to match the filenames template_X.py
-AVAILABLE_TEMPLATES = {
-    "template_1": {
-        "name": "Template 1",
-        "generator": template_1.generate_pdf, # Use generator from template_1.py
-        "preview_image": "images/classic_preview.png" # Keep preview image name
-    },
-    "template_2": {
-        "name": "Template 2",
-        "generator": template_2.generate_pdf,   # Use generator from template_2.py
-        "preview_image": "images/modern_preview.png" # Keep preview image name
-    },
-    "template_3": {
-        "name": "Template 3",
-        "generator": template_3.generate_pdf,   # Use generator from template_2.py
-        "preview_image": "images/modern_preview.png" # Keep preview image name
-    },
-     
-    "template_4": {
-        "name": "Template 4 (Alternative Modern)",
-        "generator": template_4.generate_pdf, # Use generator from template_4.py
-        "preview_image": "images/modern_preview.png" # Reusing preview
-    },
-    "template_5": {
-        "name": "Template 5 (Professional)",
-        "generator": template_5.generate_pdf, # Use generator from template_5.py
-        "preview_image": "images/professional_preview.png" # Keep preview image name
-    },
-    # Add placeholders for other templates shown in the image (6-20)
-    # You would need to add actual generator functions and preview images for these
-    # Assuming they also have a generate_pdf function in their respective files
-     "template_6": { "name": "Template 6 (With Photo)", "generator": template_6.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_7": { "name": "Template 7", "generator": template_7.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_8": { "name": "Template 8", "generator": template_8.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_9": { "name": "Template 9", "generator": template_9.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_10": { "name": "Template 10", "generator": template_10.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_11": { "name": "Template 11", "generator": template_11.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_12": { "name": "Template 12", "generator": template_12.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_14": { "name": "Template 14", "generator": template_14.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_15": { "name": "Template 15", "generator": template_15.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_16": { "name": "Template 16", "generator": template_16.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_17": { "name": "Template 17", "generator": template_17.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_18": { "name": "Template 18", "generator": template_18.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_19": { "name": "Template 19", "generator": template_19.generate_pdf, "preview_image": "images/modern_preview.png" },
-     "template_20": { "name": "Template 20", "generator": template_20.generate_pdf, "preview_image": "images/modern_preview.png" },
-}
-
-
-# --- Default Data & Structure ---
-SAMPLE_RESUME_DATA = {
-    'full_name': 'Maeve Delaney',
-    'title_subtitle': 'Strategic Sourcing Leader | Procurement Specialist | Team Management',
-    'email': 'help@enhancv.com',
-    'phone': '+1-(234)-555-1234',
-    'linkedin': 'linkedin.com/in/maevedelaney',
-    'location': 'Charlotte, North Carolina',
-    'id_number': '123-45-6789',  # New field
-    'nationality': 'American',
-    'birth_date': '1985-03-15',
-    'gender': 'Female',
-    'website': 'https://maevedelaney.com',
-    'address': '123 Main St, Charlotte, NC 28202',
-    'profile_image_path': 'static/images/sample_profile.jpg', # Ensure this image exists
-
-    'summary': 'Dynamic procurement specialist with over 5 years of experience in strategic sourcing and team management. Highly skilled in supply chain optimization and developing category strategies. Proven leader with an MBA and a solid track record in transformative sourcing initiatives, delivering significant cost savings and operational efficiencies.',
-
-    'key_achievements': [
-        {'title': 'Implemented Supplier Performance Management System', 'description': 'Successfully introduced a systematic approach to evaluating and improving supplier performance, elevating efficiency by 10%.'},
-        {'title': 'Managed $500M Indirect Spend Portfolio', 'description': 'Directed strategic allocation and cost-saving initiatives across diverse departments, optimizing the company\'s substantial indirect spend.'},
-        {'title': 'Achieved 15% Annual Cost Savings', 'description': 'Strategized and executed a category management plan for medical supplies that slashed annual costs significantly.'}
-    ],
-    'courses': [
-        {'title': 'Certified Professional in Supply Management', 'description': 'Intensive course covering strategic sourcing and supply chain management, provided by the Institute for Supply Management.'}
-    ],
-    'experiences': [
-        {
-            'title': 'Senior Sourcing Manager',
-            'company': 'Premier Inc.',
-            'location': 'Charlotte, NC',
-            'start_date': '2018-06', # YYYY-MM
-            'end_date': '',          # Empty if present
-            'is_present': True,
-            'description': '- Developed and executed category strategy for medical supplies, reducing annual costs by 15% through strategic supplier consolidation.\n- Led cross-functional teams in the successful negotiation of complex service contracts, yielding a 20% improvement in service level agreements.\n- Implemented a supplier performance management system, enhancing supplier quality and compliance, and resulting in a 10% increase in supplier scorecard performance.' # Newline separated points
-        },
-        {
-            'title': 'Category Manager',
-            'company': 'Honeywell',
-            'location': 'Fort Mill, SC',
-            'start_date': '2015-01',
-            'end_date': '2018-05',
-            'is_present': False,
-            'description': '- Executed multi-year growth plans for the electronics category, delivering a sustained 10% year-over-year cost reduction.\n- Conducted extensive market trends analysis leading to the early identification of cost-saving opportunities.'
-        },
-    ],
-    'education_entries': [
-        {
-            'degree': 'Master of Business Administration',
-            'institution': 'Duke University',
-            'edu_location': 'Durham, NC',
-            'start_date': '2007-01', # YYYY-MM
-            'end_date': '2009-01',   # YYYY-MM
-            'is_present': False,
-            'edu_details': 'Relevant coursework in strategic finance and operations management.'
-        },
-        {
-            'degree': 'Bachelor of Science in Supply Chain Management',
-            'institution': 'North Carolina State University',
-            'edu_location': 'Raleigh, NC',
-            'start_date': '2003-01',
-            'end_date': '2007-01',
-            'is_present': False,
-            'edu_details': 'Graduated with Honors.'
-        }
-    ],
-    'languages': [
-        {
-            'name': 'English',
-            'level': 'Native',
-            'reading': 'Native',
-            'writing': 'Native',
-            'speaking': 'Native'
-        },
-        {
-            'name': 'Spanish',
-            'level': 'Intermediate',
-            'reading': 'Good',
-            'writing': 'Basic',
-            'speaking': 'Good'
-        }
-    ],
-    'skills': 'Strategic Sourcing, Supply Chain Management, Team Leadership, Contract Negotiation, Cost Reduction, Supplier Management',
-    'hobbies': 'Photography, Hiking, Reading, Cooking',
-    'custom_fields': [],  # New field for custom sections
-    # section_order will be added dynamically
-}
-
-# Define the sections that can be reordered and their display names
-# NOTE: Adjust keys based on how they are handled in your templates (e.g., modern template has left/right col sections)
-REORDERABLE_SECTIONS = {
-    'summary': 'Professional Summary',
-    'experience': 'Professional Experience',
-    'education': 'Education',
-    'achievements': 'Key Achievements',
-    'courses': 'Courses',
-    'skills': 'Skills',
-    'hobbies': 'Hobbies',
-    'languages': 'Languages',
-    'additional_info': 'Additional Information',
-    'references': 'References',
-    'projects': 'Projects',
-}
-
-# Define a default order - adjust based on common preference
-DEFAULT_SECTION_ORDER = list(REORDERABLE_SECTIONS.keys())
+# Every pdf_templates/template_<n>.py with a generate_pdf() is picked up automatically;
+# its name and preview come from the module's TEMPLATE_NAME / PREVIEW_IMAGE constants.
+# Modules are imported on first render, except those warmed up at startup (see below).
+AVAILABLE_TEMPLATES = discover_templates()
+
+
+def sections_for(resume_data):
+    """The reorderable sections of one resume (key -> display name): the built-in ones plus its custom fields."""
+    sections = dict(REORDERABLE_SECTIONS)
+    for i, custom_field in enumerate(resume_data.get('custom_fields', [])):
+        sections[custom_field.get('section_key', f"custom_{i}")] = custom_field['title']
+    return sections
+
+
+# --- Warm-up & Readiness ---
+# Templates listed in TEMPLATE_WARMUP (comma-separated ids, or 'all') render SAMPLE_RESUME_DATA once in a
+# background thread, so imports, fonts, images and stylesheets are loaded before real traffic. It starts on the
+# worker's first request (point the readiness probe at /readyz), not at import, so scripts importing this module
+# and servers that import it before forking workers do not render in the wrong process.
+# /readyz answers 503 until it has finished (at once when TEMPLATE_WARMUP is empty).
+warmup = WarmUp(AVAILABLE_TEMPLATES, os.environ.get('TEMPLATE_WARMUP', ''), SAMPLE_RESUME_DATA, logger=app.logger)
+
+
+@app.before_request
+def start_warmup():
+    warmup.start()  # No-op once this process has started it
+
+
+# --- PDF Responses ---
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+# Browsers may keep a copy but must revalidate it (a cheap ETag compare) before reuse
+PDF_CACHE_CONTROL = 'private, no-cache'
+
+
+class MemoryChunks:
+    """Iterates bytes in fixed-size chunks sliced from a memoryview, so the data itself is never copied
+    (only one chunk at a time, since WSGI servers require bytes). Seekable, so Range requests start
+    at their first byte instead of reading up to it."""
+
+    def __init__(self, data, chunk_size=PDF_STREAM_CHUNK_SIZE):
+        self.view = memoryview(data)
+        self.chunk_size = chunk_size
+        self.position = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position >= len(self.view):
+            raise StopIteration
+        chunk = bytes(self.view[self.position:self.position + self.chunk_size])
+        self.position += len(chunk)
+        return chunk
+
+    def seekable(self):
+        return True
+
+    def seek(self, position):
+        self.position = position
+
+    def tell(self):
+        return self.position
+
+
+def pdf_response(pdf_bytes, download_name, etag=None):
+    """Streams an in-memory PDF as an attachment with Content-Length, answering
+    If-None-Match (304) and Range (206) requests when an ETag is given."""
+    response = app.response_class(MemoryChunks(pdf_bytes), mimetype='application/pdf', direct_passthrough=True)
+    response.content_length = len(pdf_bytes)
+    response.headers.set('Content-Disposition', 'attachment', filename=download_name)
+    if etag is None:
+        return response
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+    return response.make_conditional(request, accept_ranges=True, complete_length=len(pdf_bytes))
+
+
+def safe_file_stem(resume_data):
+    """Download filename stem from the resume's name."""
+    return (resume_data.get("full_name") or "resume").replace(" ", "_").replace("/", "_") # Basic sanitization
+
+
+def render_pdf_download(template_id, resume_data, download_name, context):
+    """Response for one resume's PDF: 304 if the client's copy is current, else from the cache or a fresh render.
+
+    The cache key doubles as a strong ETag: it changes whenever the data, template or template code does,
+    and deterministic rendering makes every render for a key byte-identical. Raises if rendering fails.
+    """
+    key = cache_key(resume_data, template_id, AVAILABLE_TEMPLATES[template_id]['version'])
+    if request.if_none_match.contains_weak(key):
+        render_metrics.observe_render(context, status='not_modified')
+        response = app.response_class(status=304)
+        response.set_etag(key)
+        response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+        return response
+
+    with context.span('cache'):
+        pdf_bytes, cached_path = pdf_cache.lookup(key)
+
+    response = None
+    if cached_path is not None:
+        # On-disk hit: served straight from the file (sendfile where the server supports it)
+        try:
+            with context.span('response'):
+                response = send_file(cached_path, mimetype='application/pdf', as_attachment=True,
+                                     download_name=download_name, etag=key, conditional=True)
+                response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+        except OSError:
+            app.logger.warning(f"Cached PDF {cached_path} vanished before it could be sent; re-rendering.")
+
+    if response is None and pdf_bytes is None:
+        context.input_bytes = len(canonical_json(resume_data).encode('utf-8'))
+        # The generator function MUST handle the section_order within resume_data
+        pdf_buffer = context.render(AVAILABLE_TEMPLATES[template_id]['generator'], resume_data)
+        with context.span('serialize'):
+            # getvalue() hands over the buffer's storage without copying (CPython); closing the
+            # buffer leaves this one bytes object, shared by the cache and the response
+            pdf_bytes = pdf_buffer.getvalue()
+            pdf_buffer.close()
+        context.output_bytes = len(pdf_bytes)
+        with context.span('cache'):
+            pdf_cache.put(key, pdf_bytes)
+        render_metrics.observe_render(context)
+        app.logger.info(f"Rendered PDF {context.log_fields()}")
+    else:
+        render_metrics.observe_render(context, status='cached')
+
+    if response is None:
+        with context.span('response'):
+            response = pdf_response(pdf_bytes, download_name, etag=key)
+    response.headers['Server-Timing'] = context.server_timing()
+    return response
 
 
 # --- Routes ---
@@ -189,182 +242,28 @@ def home():
 def resume_form():
     """Handles the resume data input form."""
     if request.method == 'POST':
+        parse_started = time.perf_counter()
         # Retrieve existing profile image path from session if available
         existing_profile_path = session.get('resume_data', {}).get('profile_image_path', SAMPLE_RESUME_DATA.get('profile_image_path'))
 
-        resume_data = {
-            'full_name': request.form.get('full_name', '').strip(),
-            'title_subtitle': request.form.get('title_subtitle', '').strip(),
-            'email': request.form.get('email', '').strip(),
-            'phone': request.form.get('phone', '').strip(),
-            'linkedin': request.form.get('linkedin', '').strip(),
-            'location': request.form.get('location', '').strip(),
-            'id_number': request.form.get('id_number', '').strip(),  # New field
-            'nationality': request.form.get('nationality', '').strip(),
-            'birth_date': request.form.get('birth_date', '').strip(),
-            'gender': request.form.get('gender', '').strip(),
-            'website': request.form.get('website', '').strip(),
-            'address': request.form.get('address', '').strip(),
-            'profile_image_path': existing_profile_path, # Keep existing image path for now
-            'summary': request.form.get('summary', '').strip(),
-            'place_of_birth': request.form.get('place_of_birth', '').strip(),  # Novo
-            'cargo': request.form.get('cargo', '').strip(),
-            'driving_license': request.form.get('driving_license', '').strip(),
-            'marital_status': request.form.get('marital_status', '').strip(),
-            'military_service': request.form.get('military_service', '').strip(),
-            'skills': request.form.get('skills', '').strip(),
-            'hobbies': request.form.get('hobbies', '').strip(),
-            'key_achievements': [],
-            'courses': [],
-            'experiences': [],
-            'education_entries': [],
-            'languages': [],
-            'additional_info': [],
-            'references': [],
-            'projects': [],
-            'custom_fields': [],  # New field
-        }
-
-        # --- Parsing logic for lists ---
-        # Key Achievements (dynamic number)
-        i = 0
-        while True:
-            ach_title_key = f'ach_title_{i}'
-            if ach_title_key not in request.form or not request.form[ach_title_key].strip():
-                break
-            resume_data['key_achievements'].append({
-                'title': request.form[ach_title_key].strip(),
-                'description': request.form.get(f'ach_description_{i}', '').strip()
-            })
-            i += 1
-
-        # Courses (fixed number - keeping original logic for backward compatibility)
-        for i in range(1, 3):
-            course_title = request.form.get(f'course_title_{i}', '').strip()
-            if course_title: # Only add if title is present
-                resume_data['courses'].append({
-                    'title': course_title,
-                    'description': request.form.get(f'course_description_{i}', '').strip()
-                })
-
-        # Experiences (dynamic number)
-        i = 0
-        while True:
-            title_key = f'exp_title[{i}]'
-            if title_key not in request.form or not request.form[title_key].strip():
-                break # Stop if title is missing or empty for this index
-            is_present_val = request.form.get(f'exp_present[{i}]') == 'on'
-            resume_data['experiences'].append({
-                'title': request.form[title_key].strip(),
-                'company': request.form.get(f'exp_company[{i}]', '').strip(),
-                'location': request.form.get(f'exp_location[{i}]', '').strip(),
-                'start_date': request.form.get(f'exp_start_date[{i}]', ''),
-                'end_date': request.form.get(f'exp_end_date[{i}]', '') if not is_present_val else '',
-                'is_present': is_present_val,
-                'description': request.form.get(f'exp_description[{i}]', '').strip(),
-                'achievements': request.form.get(f'exp_achievements[{i}]', '').strip(),
-                'responsibilities': request.form.get(f'exp_responsibilities[{i}]', '').strip(),
-            })
-            i += 1
-
-        # Education (dynamic number)
-        i = 0
-        while True:
-            degree_key = f'edu_degree[{i}]'
-            if degree_key not in request.form or not request.form[degree_key].strip():
-                break # Stop if degree is missing or empty for this index
-            is_present_val_edu = request.form.get(f'edu_present[{i}]') == 'on'
-            resume_data['education_entries'].append({
-                'degree': request.form[degree_key].strip(),
-                'institution': request.form.get(f'edu_institution[{i}]', '').strip(),
-                'edu_location': request.form.get(f'edu_location[{i}]', '').strip(),
-                'start_date': request.form.get(f'edu_start_date[{i}]', ''),
-                'end_date': request.form.get(f'edu_end_date[{i}]', '') if not is_present_val_edu else '',
-                'is_present': is_present_val_edu,
-                'edu_details': request.form.get(f'edu_details[{i}]', '').strip()
-            })
-            i += 1
-
-        # Languages (dynamic number) - Enhanced with proficiency levels
-        i = 0
-        while True:
-            lang_name_key = f'lang_name[{i}]'
-            if lang_name_key not in request.form or not request.form[lang_name_key].strip():
-                break
-            resume_data['languages'].append({
-                'name': request.form[lang_name_key].strip(),
-                'level': request.form.get(f'lang_level[{i}]', '').strip(),
-                'reading': request.form.get(f'lang_reading[{i}]', '').strip(),
-                'writing': request.form.get(f'lang_writing[{i}]', '').strip(),
-                'speaking': request.form.get(f'lang_speaking[{i}]', '').strip()
-            })
-            i += 1
-
-        # Additional Info (dynamic number)
-        i = 0
-        while True:
-            info_title_key = f'info_title[{i}]'
-            if info_title_key not in request.form or not request.form[info_title_key].strip():
-                break
-            resume_data['additional_info'].append({
-                'title': request.form[info_title_key].strip(),
-                'description': request.form.get(f'info_description[{i}]', '').strip()
-            })
-            i += 1
-
-        # References (dynamic number)
-        i = 0
-        while True:
-            ref_name_key = f'ref_name[{i}]'
-            if ref_name_key not in request.form or not request.form[ref_name_key].strip():
-                break
-            resume_data['references'].append({
-                'name': request.form[ref_name_key].strip(),
-                'title': request.form.get(f'ref_title[{i}]', '').strip(),
-                'phone': request.form.get(f'ref_phone[{i}]', '').strip(),
-                'description': request.form.get(f'ref_description[{i}]', '').strip()
-            })
-            i += 1
-
-        # Projects (dynamic number)
-        i = 0
-        while True:
-            proj_title_key = f'proj_title[{i}]'
-            if proj_title_key not in request.form or not request.form[proj_title_key].strip():
-                break
-            resume_data['projects'].append({
-                'title': request.form[proj_title_key].strip(),
-                'description': request.form.get(f'proj_description[{i}]', '').strip(),
-                'dates': request.form.get(f'proj_dates[{i}]', '').strip()
-            })
-            i += 1
-
-        # Custom Fields (dynamic number) - New feature
-        i = 0
-        while True:
-            custom_title_key = f'custom_title_{i}'
-            if custom_title_key not in request.form or not request.form[custom_title_key].strip():
-                break
-            custom_field = {
-                'title': request.form[custom_title_key].strip(),
-                'content': request.form.get(f'custom_content_{i}', '').strip(),
-                'section_key': f'custom_{i}'  # Generate a unique section key
-            }
-            resume_data['custom_fields'].append(custom_field)
-            
-            # Add to reorderable sections dynamically
-            REORDERABLE_SECTIONS[f'custom_{i}'] = custom_field['title']
-            i += 1
+        resume_data, truncated = parse_resume_form(request.form)
+        resume_data['profile_image_path'] = existing_profile_path # Keep existing image path for now
 
         # --- End of Parsing Logic ---
+        parse_seconds = time.perf_counter() - parse_started
+        render_metrics.observe_form_parse(parse_seconds, request.content_length)
 
         # Add default section order when saving data
         resume_data['section_order'] = session.get('resume_data', {}).get('section_order', DEFAULT_SECTION_ORDER)
         session['resume_data'] = resume_data
 
         # Redirect to the section ordering step
+        if truncated:
+            flash(f"Some entries were too long and have been shortened: {', '.join(truncated)}", "warning")
         flash("Resume details saved. Now, order your sections.", "success")
-        return redirect(url_for('order_sections'))
+        response = redirect(url_for('order_sections'))
+        response.headers['Server-Timing'] = f"parse;dur={parse_seconds * 1000:.1f}"
+        return response
 
     # GET request: display the form, pre-filled with session or sample data
     form_data = session.get('resume_data', SAMPLE_RESUME_DATA.copy())
@@ -383,21 +282,16 @@ def order_sections():
 
     resume_data = session['resume_data']
     current_order = resume_data.get('section_order', DEFAULT_SECTION_ORDER)
-
-    # Add custom fields to reorderable sections if they exist
-    if 'custom_fields' in resume_data:
-        for custom_field in resume_data['custom_fields']:
-            section_key = custom_field.get('section_key', f"custom_{len(REORDERABLE_SECTIONS)}")
-            REORDERABLE_SECTIONS[section_key] = custom_field['title']
+    sections = sections_for(resume_data)  # Built-in sections plus this resume's custom fields
 
     if request.method == 'POST':
         new_order_str = request.form.get('section_order')
         if new_order_str:
             # Get keys submitted, ensure they are valid section keys
-            submitted_keys = [key.strip() for key in new_order_str.split(',') if key.strip() in REORDERABLE_SECTIONS]
+            submitted_keys = [key.strip() for key in new_order_str.split(',') if key.strip() in sections]
 
             # Validate: Check if all reorderable sections are present exactly once
-            if set(submitted_keys) == set(REORDERABLE_SECTIONS.keys()) and len(submitted_keys) == len(REORDERABLE_SECTIONS):
+            if set(submitted_keys) == set(sections.keys()) and len(submitted_keys) == len(sections):
                 resume_data['section_order'] = submitted_keys  # Update order in data
                 session['resume_data'] = resume_data  # Save updated data to session
                 flash("Section order updated.", "success")
@@ -413,19 +307,19 @@ def order_sections():
     # Prepare sections for template based on the *current* order in session/default
     ordered_sections_for_template = []
     for key in current_order:
-        if key in REORDERABLE_SECTIONS:
-            ordered_sections_for_template.append((key, REORDERABLE_SECTIONS[key]))
+        if key in sections:
+            ordered_sections_for_template.append((key, sections[key]))
 
     # Check if any reorderable sections defined were missing from the current order (e.g., old session data)
     current_keys_set = set(current_order)
-    missing_keys = [key for key in REORDERABLE_SECTIONS if key not in current_keys_set]
+    missing_keys = [key for key in sections if key not in current_keys_set]
     for key in missing_keys:
-        ordered_sections_for_template.append((key, REORDERABLE_SECTIONS[key]))  # Append missing ones at the end
+        ordered_sections_for_template.append((key, sections[key]))  # Append missing ones at the end
     print("ordered_sections_for_template: ", ordered_sections_for_template) # for debugging
     return render_template('order_sections.html',
                            title="Order Resume Sections",
                            sections=ordered_sections_for_template,
-                           available_sections=REORDERABLE_SECTIONS)
+                           available_sections=sections)
 
 @app.route('/select-template', methods=['GET'])
 def select_pdf_template():
@@ -463,24 +357,372 @@ def download_resume(template_id):
         resume_data['section_order'] = DEFAULT_SECTION_ORDER
         app.logger.warning("section_order missing in session data for download, using default.")
 
+    safe_filename = safe_file_stem(resume_data)
+    download_name = f"{safe_filename}_{template_id}.pdf"
+
+    context = RenderContext(template_id, deterministic=True)
     try:
-        # The generator function MUST handle the section_order within resume_data
-        pdf_buffer = template_info['generator'](resume_data)
-
-        response = make_response(pdf_buffer.getvalue())
-        response.headers['Content-Type'] = 'application/pdf'
-        # Set Content-Disposition to 'attachment' to force download
-        safe_filename = resume_data.get("full_name", "resume").replace(" ", "_").replace("/", "_") # Basic sanitization
-        response.headers['Content-Disposition'] = \
-            f'attachment; filename="{safe_filename}_{template_id}.pdf"'
-        return response
+        return render_pdf_download(template_id, resume_data, download_name, context)
+    except HTTPException:
+        raise  # e.g. 416 for an unsatisfiable Range
     except Exception as e:
+        render_metrics.observe_render(context, status='error')
         app.logger.error(f"Error generating PDF for download (template {template_id}): {e}\n{traceback.format_exc()}")
         flash(f"An error occurred while generating the PDF for template '{template_info['name']}'. Please try again or choose another template.", "error")
         # Redirect back to template selection on error
         return redirect(url_for('select_pdf_template'))
 
 
+@app.route('/download-all', methods=['GET'])
+def download_all():
+    """Renders several templates in parallel and streams them back as one ZIP, adding each PDF as it finishes.
+
+    ?templates=template_1,template_5 picks a subset; by default every template is included.
+    """
+    if 'resume_data' not in session:
+        flash("Session expired or data missing. Please start over.", "error")
+        return redirect(url_for('resume_form'))
+    requested = request.args.get('templates', '')
+    template_ids = [t for t in requested.split(',') if t] if requested else list(AVAILABLE_TEMPLATES)
+    if not template_ids or any(t not in AVAILABLE_TEMPLATES for t in template_ids):
+        flash("Invalid template selected.", "error")
+        return redirect(url_for('select_pdf_template'))
+
+    # One snapshot of the data for every render
+    resume_data = dict(session['resume_data'])
+    resume_data.setdefault('section_order', DEFAULT_SECTION_ORDER)
+    safe_filename = safe_file_stem(resume_data)
+
+    cached = []  # (template_id, pdf bytes or None, cached file path or None)
+    renders = []  # (template_id, resume_data, cache key) for the pool
+    for template_id in dict.fromkeys(template_ids):
+        key = cache_key(resume_data, template_id, AVAILABLE_TEMPLATES[template_id]['version'])
+        pdf_bytes, cached_path = pdf_cache.lookup(key)
+        if pdf_bytes is not None or cached_path is not None:
+            cached.append((template_id, pdf_bytes, cached_path))
+        else:
+            renders.append((template_id, resume_data, key))
+    try:
+        # All or none, so a rejected request leaves no renders behind that nobody will collect
+        pending = render_jobs.submit_all(renders)
+    except QueueFullError as e:
+        app.logger.warning(f"Rejecting /download-all ({len(template_ids)} templates): {e}")
+        return _queue_full_response()
+
+    def entries():
+        failures = []
+        for template_id, pdf_bytes, cached_path in cached:
+            if pdf_bytes is None:
+                try:
+                    with open(cached_path, 'rb') as f:
+                        pdf_bytes = f.read()
+                except OSError as e:
+                    failures.append(f"{template_id}: cached PDF unavailable ({e})")
+                    continue
+            yield f"{safe_filename}_{template_id}.pdf", pdf_bytes
+
+        try:
+            for future in as_completed(pending, timeout=render_jobs.timeout):
+                job = pending.pop(future)
+                if future.cancelled():  # Timed out (reported by a status poll) before reaching a worker
+                    failures.append(f"{job.template_id}: not finished within {render_jobs.timeout} seconds")
+                    continue
+                error = future.exception()
+                if error is not None:
+                    app.logger.error(f"Render of {job.template_id} for /download-all failed: {error}")
+                    failures.append(f"{job.template_id}: {type(error).__name__}: {' '.join(str(error).split())}")
+                    continue
+                yield f"{safe_filename}_{job.template_id}.pdf", future.result()
+        except FuturesTimeoutError:
+            failures.extend(f"{job.template_id}: not finished within {render_jobs.timeout} seconds"
+                            for job in pending.values())
+        if failures:
+            yield "errors.txt", ("These templates could not be rendered:\n" + "\n".join(failures) + "\n").encode('utf-8')
+
+    response = app.response_class(stream_zip(entries()), mimetype='application/zip')
+    response.headers.set('Content-Disposition', 'attachment', filename=f"{safe_filename}_resumes.zip")
+    return response
+
+
+def preview_resume_data():
+    """The session's resume data for previews; the sample resume when there is none yet (template gallery)."""
+    resume_data = dict(session.get('resume_data') or SAMPLE_RESUME_DATA)
+    resume_data.setdefault('section_order', DEFAULT_SECTION_ORDER)
+    return resume_data
+
+
+def render_first_page(template_id, resume_data, context):
+    """Renders only page 1 of the resume (context.first_page_only) and returns its PDF bytes."""
+    context.input_bytes = len(canonical_json(resume_data).encode('utf-8'))
+    pdf_buffer = context.render(AVAILABLE_TEMPLATES[template_id]['generator'], resume_data)
+    pdf_bytes = pdf_buffer.getvalue()
+    pdf_buffer.close()
+    context.output_bytes = len(pdf_bytes)
+    render_metrics.observe_render(context)
+    return pdf_bytes
+
+
+@app.route('/preview/<template_id>', methods=['GET'])
+def preview_resume(template_id):
+    """First page of the resume as an inline PDF, for the template gallery and live preview.
+
+    Layout stops once page 1 is complete, so latency does not grow with the resume's length.
+    X-Has-More-Pages tells whether the full PDF continues past it.
+    """
+    if template_id not in AVAILABLE_TEMPLATES:
+        return "Unknown template.", 404
+    resume_data = preview_resume_data()
+    key = cache_key(resume_data, template_id, f"{AVAILABLE_TEMPLATES[template_id]['version']}/first-page")
+    if request.if_none_match.contains_weak(key):
+        response = app.response_class(status=304)
+        response.set_etag(key)
+        response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+        return response
+
+    context = RenderContext(template_id, deterministic=True, first_page_only=True)
+    try:
+        pdf_bytes = render_first_page(template_id, resume_data, context)
+    except Exception as e:
+        render_metrics.observe_render(context, status='error')
+        app.logger.error(f"Error rendering preview (template {template_id}): {e}\n{traceback.format_exc()}")
+        return "Preview could not be rendered.", 500
+    response = pdf_response(pdf_bytes, f"{safe_file_stem(resume_data)}_{template_id}_preview.pdf", etag=key)
+    response.headers.set('Content-Disposition', 'inline', filename=f"{safe_file_stem(resume_data)}_{template_id}_preview.pdf")
+    response.headers['X-Has-More-Pages'] = 'true' if context.has_more_pages else 'false'
+    response.headers['Server-Timing'] = context.server_timing()
+    return response
+
+
+def thumbnail_width(value):
+    """The image width for a ?width= value: rounded to THUMBNAIL_WIDTH_STEP and kept within the limits."""
+    try:
+        width = int(value)
+    except (TypeError, ValueError):
+        return THUMBNAIL_WIDTH
+    width = round(width / THUMBNAIL_WIDTH_STEP) * THUMBNAIL_WIDTH_STEP
+    return min(THUMBNAIL_MAX_WIDTH, max(THUMBNAIL_MIN_WIDTH, width))
+
+
+@app.route('/preview/<template_id>.<any(png, webp):image_format>', methods=['GET'])
+def preview_thumbnail(template_id, image_format):
+    """Page 1 of the resume as a PNG or WebP image (?width=, default THUMBNAIL_WIDTH pixels), for the template gallery.
+
+    The page is rendered as for /preview and drawn by page_raster, in a render pool worker. Images are cached
+    under the data, template code, width and format, so a gallery reload costs cache hits, not renders.
+    """
+    if template_id not in AVAILABLE_TEMPLATES:
+        return "Unknown template.", 404
+    width = thumbnail_width(request.args.get('width'))
+    resume_data = preview_resume_data()
+    key = cache_key(resume_data, template_id,
+                    f"{AVAILABLE_TEMPLATES[template_id]['version']}/first-page/{width}.{image_format}")
+    mimetype = f"image/{image_format}"
+    if request.if_none_match.contains_weak(key):
+        response = app.response_class(status=304)
+        response.set_etag(key)
+        response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+        return response
+
+    image_bytes, cached_path = thumbnail_cache.lookup(key)
+    if cached_path is not None:
+        try:
+            response = send_file(cached_path, mimetype=mimetype, etag=key, conditional=True)
+            response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+            return response
+        except OSError:
+            image_bytes = thumbnail_cache.get(key)  # Vanished: None, so it is drawn again
+
+    context = None
+    if image_bytes is None:
+        # Rendered and drawn in the render pool: a gallery load asks for every template at once
+        try:
+            future = render_jobs.submit_call(render_thumbnail_bytes, template_id, resume_data, width, image_format)
+        except QueueFullError as e:
+            app.logger.warning(f"Rejecting thumbnail for {template_id}: {e}")
+            return "Too many renders in progress.", 503, {'Retry-After': '5'}  # The gallery shows its static preview
+        try:
+            image_bytes, context = future.result(timeout=render_jobs.timeout)
+        except FuturesTimeoutError:
+            app.logger.error(f"Thumbnail for {template_id} not rendered within {render_jobs.timeout} seconds")
+            return "Thumbnail could not be rendered in time.", 504
+        except Exception as e:
+            render_metrics.observe_render(RenderContext(template_id, first_page_only=True), status='error')
+            app.logger.error(f"Error rendering thumbnail (template {template_id}): {e}\n{traceback.format_exc()}")
+            return "Thumbnail could not be rendered.", 500
+        context.input_bytes = len(canonical_json(resume_data).encode('utf-8'))
+        render_metrics.observe_render(context)
+        thumbnail_cache.put(key, image_bytes)
+
+    response = app.response_class(image_bytes, mimetype=mimetype)
+    response.set_etag(key)
+    response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+    if context is not None:
+        response.headers['X-Has-More-Pages'] = 'true' if context.has_more_pages else 'false'
+        response.headers['Server-Timing'] = context.server_timing()
+    return response.make_conditional(request)
+
+
+@app.route('/api/render/<template_id>', methods=['POST'])
+def api_render(template_id):
+    """Stateless render: the resume data as a JSON object (shaped like SAMPLE_RESUME_DATA) in, the PDF out."""
+    if template_id not in AVAILABLE_TEMPLATES:
+        return jsonify({'error': f"Unknown template '{template_id}'."}), 404
+    resume_data = request.get_json(silent=True)
+    problems = validate_resume_data(resume_data) or _api_resume_problems(resume_data)
+    if problems:
+        return jsonify({'error': 'Invalid resume data.', 'problems': problems}), 400
+    resume_data.setdefault('section_order', list(sections_for(resume_data)))
+
+    if 'respond-async' in request.headers.get('Prefer', '') or (request.content_length or 0) > API_ASYNC_THRESHOLD_BYTES:
+        return _render_job_response(template_id, resume_data)
+
+    context = RenderContext(template_id, deterministic=True)
+    try:
+        return render_pdf_download(template_id, resume_data, f"{safe_file_stem(resume_data)}_{template_id}.pdf", context)
+    except HTTPException:
+        raise
+    except Exception as e:
+        render_metrics.observe_render(context, status='error')
+        app.logger.error(f"Error rendering API request (template {template_id}): {e}\n{traceback.format_exc()}")
+        return jsonify({'error': f"Rendering with template '{template_id}' failed."}), 500
+
+
+def _api_resume_problems(resume_data):
+    """Checks the parts of API input that the form never lets users set directly."""
+    problems = []
+    section_order = resume_data.get('section_order')
+    if section_order is not None:
+        sections = sections_for(resume_data)
+        if not isinstance(section_order, list) or not all(isinstance(key, str) for key in section_order):
+            problems.append("'section_order' must be a list of section keys")
+        else:
+            problems.extend(f"'section_order' has unknown section '{key}'" for key in section_order if key not in sections)
+    # Image paths are read from the server's disk, so only files under static/ may be named. They are
+    # resolved the way the templates open them: relative to the project root, whatever the working directory.
+    static_root = os.path.realpath(app.static_folder)
+    for field, value in resume_data.items():
+        if field.endswith('_path') and value:
+            if (not isinstance(value, str) or '\0' in value
+                    or os.path.commonpath([static_root, os.path.realpath(asset_path(value))]) != static_root):
+                problems.append(f"'{field}' must name a file under static/")
+    return problems
+
+
+@app.route('/render-jobs/<template_id>', methods=['POST'])
+def submit_render_job(template_id):
+    """Queues a background render of the session's resume; returns 202 with the job id."""
+    if 'resume_data' not in session:
+        return jsonify({'error': 'Session expired or data missing.'}), 400
+    if template_id not in AVAILABLE_TEMPLATES:
+        return jsonify({'error': f"Unknown template '{template_id}'."}), 404
+
+    resume_data = dict(session['resume_data'])
+    resume_data.setdefault('section_order', DEFAULT_SECTION_ORDER)
+    return _render_job_response(template_id, resume_data)
+
+
+@app.route('/render-jobs/<job_id>', methods=['GET'])
+def render_job_status(job_id):
+    """Reports the state of a render job: queued, running, done, failed or timeout."""
+    job = render_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job.'}), 404
+    return jsonify(_render_job_payload(job))
+
+
+@app.route('/render-jobs/<job_id>/result', methods=['GET'])
+def render_job_result(job_id):
+    """Serves the finished PDF from the PDF cache; 202 while the job is still pending."""
+    job = render_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown or expired job.'}), 404
+    if job.status in ('queued', 'running'):
+        response = jsonify(_render_job_payload(job))
+        response.status_code = 202
+        response.headers['Retry-After'] = '1'
+        return response
+    if job.status == 'timeout':
+        return jsonify(_render_job_payload(job)), 504
+    if job.status == 'failed':
+        app.logger.error(f"Render job {job.id} (template {job.template_id}) failed: {job.error}")
+        return jsonify(_render_job_payload(job)), 500
+
+    download_name = f"resume_{job.template_id}.pdf"
+    pdf_bytes, cached_path = pdf_cache.lookup(job.cache_key)
+    if cached_path is not None:
+        try:
+            response = send_file(cached_path, mimetype='application/pdf', as_attachment=True,
+                                 download_name=download_name, etag=job.cache_key, conditional=True)
+            response.headers['Cache-Control'] = PDF_CACHE_CONTROL
+            return response
+        except OSError:
+            pdf_bytes = pdf_cache.get(job.cache_key)
+    if pdf_bytes is None:
+        # Evicted from the cache since the render finished
+        return jsonify({'error': 'The rendered PDF has expired. Please submit the render again.'}), 410
+    return pdf_response(pdf_bytes, download_name, etag=job.cache_key)
+
+
+def _render_job_response(template_id, resume_data):
+    """Queues a render (or registers the cached PDF as a finished job) and answers 202 with the job handle."""
+    key = cache_key(resume_data, template_id, AVAILABLE_TEMPLATES[template_id]['version'])
+    pdf_bytes, cached_path = pdf_cache.lookup(key)
+    if pdf_bytes is not None or cached_path is not None:
+        job = render_jobs.add_completed(template_id, key)
+    else:
+        try:
+            job = render_jobs.submit(template_id, resume_data, cache_key=key)
+        except QueueFullError as e:
+            app.logger.warning(f"Rejecting render job for {template_id}: {e}")
+            return _queue_full_response()
+
+    response = jsonify(_render_job_payload(job))
+    response.status_code = 202
+    response.headers['Location'] = url_for('render_job_status', job_id=job.id)
+    return response
+
+
+def _queue_full_response():
+    response = jsonify({'error': 'Too many renders in progress. Please retry shortly.'})
+    response.status_code = 429
+    response.headers['Retry-After'] = '5'
+    return response
+
+
+def _render_job_payload(job):
+    payload = job.to_dict()
+    payload['status_url'] = url_for('render_job_status', job_id=job.id)
+    if job.status == 'done':
+        payload['result_url'] = url_for('render_job_result', job_id=job.id)
+    return payload
+
+
+@app.route('/cache-stats', methods=['GET'])
+def cache_stats():
+    """Reports PDF cache hit/miss/eviction counters for sizing the cache."""
+    return jsonify(pdf_cache.stats())
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Render and form-parse metrics in Prometheus text format."""
+    return app.response_class(render_metrics.expose(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """Readiness probe: 200 once the startup warm-up has finished, 503 until then."""
+    response = jsonify(warmup.status())
+    response.status_code = 200 if warmup.ready else 503
+    return response
+
+
+@app.route('/render-jobs', methods=['GET'])
+def render_job_stats():
+    """Counts of render jobs by status, for watching queue depth."""
+    return jsonify(render_jobs.stats())
+
+
 if __name__ == '__main__':
     # Make sure this is set correctly for deployment environments
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,214 @@
+# batch_render.py
+"""Renders many resumes at once, e.g. a whole onboarding cohort from an HR export.
+
+Input is JSONL (one resume per line, shaped like resume_defaults.SAMPLE_RESUME_DATA) or
+CSV (one resume per row; scalar fields as plain columns, list fields such as
+`experiences` as JSON-encoded cells). Records are streamed from the file and
+fanned out to a process pool with a bounded number in flight, so memory stays
+flat however long the input is. A record may name its own `template`.
+
+    python batch_render.py cohort.jsonl --output out/ --template template_5
+    python batch_render.py cohort.csv --output cohort.zip --workers 8
+
+Failures do not stop the batch; each one is written to the error report
+(JSON lines, default <output>.errors.jsonl) and the exit status is 1.
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from resume_defaults import DEFAULT_SECTION_ORDER
+from render_jobs import render_pdf_bytes
+from pdf_templates.registry import discover_templates
+from pdf_templates.resume_model import ResumeDataError, normalize_resume
+
+LIST_FIELDS = ('key_achievements', 'courses', 'experiences', 'education_entries', 'languages',
+               'additional_info', 'references', 'projects', 'custom_fields', 'section_order')
+
+
+# --- Input ---
+
+def read_jsonl(f):
+    for line_number, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Each line must be a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def read_csv(f):
+    for row_number, row in enumerate(csv.DictReader(f), 2):  # Row 1 is the header
+        record = {key: value for key, value in row.items() if key}
+        try:
+            for field in LIST_FIELDS:
+                if record.get(field):
+                    record[field] = json.loads(record[field])
+        except ValueError as e:
+            yield row_number, None, f"Invalid JSON in column '{field}': {e}"
+            continue
+        yield row_number, record, None
+
+
+def read_records(path, input_format):
+    """Yields (line number, record or None, error or None) without loading the whole file."""
+    reader = read_csv if input_format == 'csv' else read_jsonl
+    if path == '-':
+        yield from reader(sys.stdin)
+        return
+    with open(path, newline='' if input_format == 'csv' else None, encoding='utf-8') as f:
+        yield from reader(f)
+
+
+# --- Output ---
+
+class DirectoryWriter:
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, name, data):
+        with open(os.path.join(self.path, name), 'wb') as f:
+            f.write(data)
+
+    def close(self):
+        pass
+
+
+class ZipWriter:
+    def __init__(self, path):
+        # PDF page streams are already compressed, so entries are stored rather than deflated again
+        self.archive = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED)
+
+    def write(self, name, data):
+        self.archive.writestr(name, data)
+
+    def close(self):
+        self.archive.close()
+
+
+def output_name(line_number, record, template_id):
+    base = record.get('id') or record.get('full_name') or 'resume'
+    safe_name = re.sub(r'[^A-Za-z0-9._-]+', '_', str(base)).strip('._') or 'resume'
+    return f"{line_number:06d}_{safe_name[:80]}_{template_id}.pdf"
+
+
+# --- Rendering ---
+
+def _quiet_worker():
+    """Worker initializer: templates print debug output for every render, which would flood the terminal."""
+    sys.stdout = open(os.devnull, 'w')
+
+
+def run_batch(records, writer, default_template, registry, errors_file, workers=None, max_in_flight=None, progress=True):
+    """Renders `records` through a process pool; returns (rendered, failed) counts."""
+    max_in_flight = max_in_flight or 4 * (workers or os.cpu_count() or 1)
+    rendered = failed = 0
+    started = time.time()
+    last_report = 0.0
+
+    def report_error(line_number, record, error):
+        nonlocal failed
+        failed += 1
+        entry = {'line': line_number, 'error': error}
+        if record is not None:
+            entry.update({key: record[key] for key in ('id', 'full_name', 'email') if record.get(key)})
+        errors_file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def collect(done):
+        nonlocal rendered
+        for future in done:
+            line_number, record, template_id = pending.pop(future)
+            try:
+                writer.write(output_name(line_number, record, template_id), future.result())
+                rendered += 1
+            except Exception as e:
+                report_error(line_number, record, f"{type(e).__name__}: {' '.join(str(e).split())}")
+
+    pending = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_quiet_worker) as executor:
+        for line_number, record, error in records:
+            if error:
+                report_error(line_number, None, error)
+                continue
+            template_id = record.pop('template', None) or default_template
+            if template_id not in registry:
+                report_error(line_number, record, f"Unknown template '{template_id}'")
+                continue
+            record.setdefault('section_order', DEFAULT_SECTION_ORDER)
+            try:
+                normalize_resume(record)  # Reject malformed records here rather than in a worker
+            except ResumeDataError as e:
+                report_error(line_number, record, str(e))
+                continue
+
+            while len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending[executor.submit(render_pdf_bytes, template_id, record)] = (line_number, record, template_id)
+
+            if progress and time.time() - last_report > 0.5:
+                last_report = time.time()
+                rate = rendered / max(last_report - started, 1e-6)
+                print(f"\r{rendered} rendered, {failed} failed, {len(pending)} in flight ({rate:.1f}/s)",
+                      end='', file=sys.stderr, flush=True)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+
+    if progress:
+        elapsed = time.time() - started
+        print(f"\r{rendered} rendered, {failed} failed in {elapsed:.1f}s ({rendered / max(elapsed, 1e-6):.1f}/s)"
+              + ' ' * 20, file=sys.stderr)
+    return rendered, failed
+
+
+def main(argv=None):
+    registry = discover_templates()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('input', help="JSONL or CSV file of resume records ('-' for stdin)")
+    parser.add_argument('--output', required=True, help="Output directory, or a path ending in .zip")
+    parser.add_argument('--format', choices=('jsonl', 'csv'), help="Input format (default: from the file extension)")
+    parser.add_argument('--template', default='template_1', choices=list(registry),
+                        help="Template for records without a 'template' field")
+    parser.add_argument('--workers', type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--max-in-flight', type=int, help="Records queued to workers at once (default: 4 per worker)")
+    parser.add_argument('--errors', help="Error report path (default: <output>.errors.jsonl)")
+    parser.add_argument('--quiet', action='store_true', help="No progress output")
+    args = parser.parse_args(argv)
+
+    input_format = args.format or ('csv' if args.input.lower().endswith('.csv') else 'jsonl')
+    output = args.output.rstrip('/' + os.sep)
+    writer = ZipWriter(output) if output.lower().endswith('.zip') else DirectoryWriter(output)
+    errors_path = args.errors or output + '.errors.jsonl'
+
+    try:
+        with open(errors_path, 'w', encoding='utf-8') as errors_file:
+            rendered, failed = run_batch(read_records(args.input, input_format), writer, args.template, registry,
+                                         errors_file, workers=args.workers, max_in_flight=args.max_in_flight,
+                                         progress=not args.quiet)
+    finally:
+        writer.close()
+
+    if failed:
+        print(f"{failed} record(s) failed; see {errors_path}", file=sys.stderr)
+        return 1
+    os.remove(errors_path)  # Nothing to report
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
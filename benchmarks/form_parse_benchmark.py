@@ -0,0 +1,230 @@
+# benchmarks/form_parse_benchmark.py
+"""Compares form_schema.parse_resume_form with the index loops it replaced, on forms of growing size.
+
+    python -m benchmarks.form_parse_benchmark
+    python -m benchmarks.form_parse_benchmark --entries 10,100,500 --repeat 50
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from werkzeug.datastructures import ImmutableMultiDict
+
+from form_schema import parse_resume_form
+
+
+def legacy_parse(form):
+    """The per-section `while True` index loops resume_form used before form_schema (reference only)."""
+    resume_data = {
+        'full_name': form.get('full_name', '').strip(),
+        'title_subtitle': form.get('title_subtitle', '').strip(),
+        'email': form.get('email', '').strip(),
+        'phone': form.get('phone', '').strip(),
+        'linkedin': form.get('linkedin', '').strip(),
+        'location': form.get('location', '').strip(),
+        'id_number': form.get('id_number', '').strip(),  # New field
+        'nationality': form.get('nationality', '').strip(),
+        'birth_date': form.get('birth_date', '').strip(),
+        'gender': form.get('gender', '').strip(),
+        'website': form.get('website', '').strip(),
+        'address': form.get('address', '').strip(),
+        'summary': form.get('summary', '').strip(),
+        'place_of_birth': form.get('place_of_birth', '').strip(),  # Novo
+        'cargo': form.get('cargo', '').strip(),
+        'driving_license': form.get('driving_license', '').strip(),
+        'marital_status': form.get('marital_status', '').strip(),
+        'military_service': form.get('military_service', '').strip(),
+        'skills': form.get('skills', '').strip(),
+        'hobbies': form.get('hobbies', '').strip(),
+        'key_achievements': [],
+        'courses': [],
+        'experiences': [],
+        'education_entries': [],
+        'languages': [],
+        'additional_info': [],
+        'references': [],
+        'projects': [],
+        'custom_fields': [],  # New field
+    }
+
+    # --- Parsing logic for lists ---
+    # Key Achievements (dynamic number)
+    i = 0
+    while True:
+        ach_title_key = f'ach_title_{i}'
+        if ach_title_key not in form or not form[ach_title_key].strip():
+            break
+        resume_data['key_achievements'].append({
+            'title': form[ach_title_key].strip(),
+            'description': form.get(f'ach_description_{i}', '').strip()
+        })
+        i += 1
+
+    # Courses (fixed number - keeping original logic for backward compatibility)
+    for i in range(1, 3):
+        course_title = form.get(f'course_title_{i}', '').strip()
+        if course_title: # Only add if title is present
+            resume_data['courses'].append({
+                'title': course_title,
+                'description': form.get(f'course_description_{i}', '').strip()
+            })
+
+    # Experiences (dynamic number)
+    i = 0
+    while True:
+        title_key = f'exp_title[{i}]'
+        if title_key not in form or not form[title_key].strip():
+            break # Stop if title is missing or empty for this index
+        is_present_val = form.get(f'exp_present[{i}]') == 'on'
+        resume_data['experiences'].append({
+            'title': form[title_key].strip(),
+            'company': form.get(f'exp_company[{i}]', '').strip(),
+            'location': form.get(f'exp_location[{i}]', '').strip(),
+            'start_date': form.get(f'exp_start_date[{i}]', ''),
+            'end_date': form.get(f'exp_end_date[{i}]', '') if not is_present_val else '',
+            'is_present': is_present_val,
+            'description': form.get(f'exp_description[{i}]', '').strip(),
+            'achievements': form.get(f'exp_achievements[{i}]', '').strip(),
+            'responsibilities': form.get(f'exp_responsibilities[{i}]', '').strip(),
+        })
+        i += 1
+
+    # Education (dynamic number)
+    i = 0
+    while True:
+        degree_key = f'edu_degree[{i}]'
+        if degree_key not in form or not form[degree_key].strip():
+            break # Stop if degree is missing or empty for this index
+        is_present_val_edu = form.get(f'edu_present[{i}]') == 'on'
+        resume_data['education_entries'].append({
+            'degree': form[degree_key].strip(),
+            'institution': form.get(f'edu_institution[{i}]', '').strip(),
+            'edu_location': form.get(f'edu_location[{i}]', '').strip(),
+            'start_date': form.get(f'edu_start_date[{i}]', ''),
+            'end_date': form.get(f'edu_end_date[{i}]', '') if not is_present_val_edu else '',
+            'is_present': is_present_val_edu,
+            'edu_details': form.get(f'edu_details[{i}]', '').strip()
+        })
+        i += 1
+
+    # Languages (dynamic number) - Enhanced with proficiency levels
+    i = 0
+    while True:
+        lang_name_key = f'lang_name[{i}]'
+        if lang_name_key not in form or not form[lang_name_key].strip():
+            break
+        resume_data['languages'].append({
+            'name': form[lang_name_key].strip(),
+            'level': form.get(f'lang_level[{i}]', '').strip(),
+            'reading': form.get(f'lang_reading[{i}]', '').strip(),
+            'writing': form.get(f'lang_writing[{i}]', '').strip(),
+            'speaking': form.get(f'lang_speaking[{i}]', '').strip()
+        })
+        i += 1
+
+    # Additional Info (dynamic number)
+    i = 0
+    while True:
+        info_title_key = f'info_title[{i}]'
+        if info_title_key not in form or not form[info_title_key].strip():
+            break
+        resume_data['additional_info'].append({
+            'title': form[info_title_key].strip(),
+            'description': form.get(f'info_description[{i}]', '').strip()
+        })
+        i += 1
+
+    # References (dynamic number)
+    i = 0
+    while True:
+        ref_name_key = f'ref_name[{i}]'
+        if ref_name_key not in form or not form[ref_name_key].strip():
+            break
+        resume_data['references'].append({
+            'name': form[ref_name_key].strip(),
+            'title': form.get(f'ref_title[{i}]', '').strip(),
+            'phone': form.get(f'ref_phone[{i}]', '').strip(),
+            'description': form.get(f'ref_description[{i}]', '').strip()
+        })
+        i += 1
+
+    # Projects (dynamic number)
+    i = 0
+    while True:
+        proj_title_key = f'proj_title[{i}]'
+        if proj_title_key not in form or not form[proj_title_key].strip():
+            break
+        resume_data['projects'].append({
+            'title': form[proj_title_key].strip(),
+            'description': form.get(f'proj_description[{i}]', '').strip(),
+            'dates': form.get(f'proj_dates[{i}]', '').strip()
+        })
+        i += 1
+
+    # Custom Fields (dynamic number) - New feature
+    i = 0
+    while True:
+        custom_title_key = f'custom_title_{i}'
+        if custom_title_key not in form or not form[custom_title_key].strip():
+            break
+        custom_field = {
+            'title': form[custom_title_key].strip(),
+            'content': form.get(f'custom_content_{i}', '').strip(),
+            'section_key': f'custom_{i}'  # Generate a unique section key
+        }
+        resume_data['custom_fields'].append(custom_field)
+        i += 1
+    return resume_data
+
+
+def make_form(n_entries):
+    """A submitted form with `n_entries` entries in every repeated section."""
+    items = [('full_name', 'Maeve Delaney'), ('email', 'maeve@example.com'), ('summary', 'Procurement specialist. ' * 20),
+             ('skills', 'Sourcing, Negotiation, SQL'), ('hobbies', 'Running, Chess')]
+    for i in range(n_entries):
+        items += [(f'ach_title_{i}', f'Achievement {i}'), (f'ach_description_{i}', 'Cut costs by 15%.'),
+                  (f'exp_title[{i}]', f'Manager {i}'), (f'exp_company[{i}]', 'Premier Inc.'),
+                  (f'exp_location[{i}]', 'Charlotte, NC'), (f'exp_start_date[{i}]', '2018-06'),
+                  (f'exp_end_date[{i}]', '2021-05'), (f'exp_description[{i}]', '- Led sourcing.\n- Cut costs.'),
+                  (f'edu_degree[{i}]', 'MBA'), (f'edu_institution[{i}]', 'UNC'), (f'edu_start_date[{i}]', '2014-08'),
+                  (f'edu_end_date[{i}]', '2016-05'), (f'edu_details[{i}]', 'Supply chain focus.'),
+                  (f'lang_name[{i}]', f'Language {i}'), (f'lang_level[{i}]', 'Fluent'),
+                  (f'info_title[{i}]', f'Info {i}'), (f'info_description[{i}]', 'Details.'),
+                  (f'ref_name[{i}]', f'Referee {i}'), (f'ref_title[{i}]', 'Director'), (f'ref_phone[{i}]', '555-0100'),
+                  (f'proj_title[{i}]', f'Project {i}'), (f'proj_description[{i}]', 'Built a thing.'),
+                  (f'proj_dates[{i}]', '2020'), (f'custom_title_{i}', f'Custom {i}'), (f'custom_content_{i}', 'Text.')]
+    items += [('course_title_1', 'Six Sigma'), ('course_description_1', 'Green belt.')]
+    return ImmutableMultiDict(items)
+
+
+def time_parser(parse, form, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(form)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', default='1,10,100,300', help="Comma-separated entries per repeated section")
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args(argv)
+
+    print(f"{'entries':>8} {'inputs':>8} {'loops':>12} {'schema':>12} {'speedup':>8}")
+    for n_entries in (int(n) for n in args.entries.split(',')):
+        form = make_form(n_entries)
+        legacy, (parsed, _) = legacy_parse(form), parse_resume_form(form)
+        if any(legacy[key] != parsed[key] for key in legacy):
+            print(f"{n_entries:>8} parsers disagree", file=sys.stderr)
+            return 1
+        old = time_parser(legacy_parse, form, args.repeat)
+        new = time_parser(parse_resume_form, form, args.repeat)
+        print(f"{n_entries:>8} {len(form):>8} {old * 1000:9.2f} ms {new * 1000:9.2f} ms {old / new:7.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+# benchmarks/render_benchmark.py
+"""Measures generate_pdf for every registered template across resume sizes.
+
+Each case (template x size x photo) runs in a freshly spawned process, so the
+peak RSS reported for it is not inflated by earlier cases. Usage, from the
+repository root:
+
+    python -m benchmarks.render_benchmark --output bench.json
+    python -m benchmarks.render_benchmark --templates template_1,template_12 --sizes 1,20 --baseline bench.json
+
+--check-determinism additionally renders each case twice in deterministic
+mode and fails the run if the two PDFs differ.
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks.resume_fixtures import RESUME_SIZES, ROOT_DIR
+
+PAGE_OBJECT_PATTERN = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+
+def count_pages(pdf_bytes):
+    """Counts page objects in an uncompressed-xref PDF (what ReportLab writes)."""
+    return len(PAGE_OBJECT_PATTERN.findall(pdf_bytes))
+
+
+def _peak_rss_kb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reports bytes, Linux kilobytes
+
+
+def run_case(template_id, n_experiences, with_photo, repeat, check_determinism=False):
+    """Renders one case `repeat` times (after a cold first render) and returns its measurements."""
+    os.chdir(ROOT_DIR)  # Templates resolve static/ paths relative to the working directory
+    from benchmarks.resume_fixtures import make_resume
+    from pdf_templates.registry import discover_templates
+    from pdf_templates.rendering import RenderContext
+
+    result = {'template': template_id, 'experiences': n_experiences, 'photo': with_photo}
+    data = make_resume(n_experiences, with_photo=with_photo)
+    entry = discover_templates()[template_id]
+    baseline_rss = _peak_rss_kb()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # Templates print debug output while rendering
+            start = time.perf_counter()
+            generator = entry.generator
+            result['import_seconds'] = round(time.perf_counter() - start, 4)
+
+            start = time.perf_counter()
+            pdf_bytes = generator(data).getvalue()
+            result['cold_seconds'] = round(time.perf_counter() - start, 4)
+
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                pdf_bytes = generator(data).getvalue()
+                timings.append(time.perf_counter() - start)
+
+            if check_determinism:
+                first, second = (generator(data, context=RenderContext(template_id, deterministic=True)).getvalue()
+                                 for _ in range(2))
+                result['deterministic'] = first == second
+    except Exception as e:
+        message = ' '.join(str(e).split())  # ReportLab layout errors span several lines
+        result.update(status='error', error=f"{type(e).__name__}: {message}"[:500])
+        return result
+
+    result.update(
+        status='ok',
+        wall_seconds=round(statistics.median(timings), 4) if timings else result['cold_seconds'],
+        min_seconds=round(min(timings), 4) if timings else result['cold_seconds'],
+        peak_rss_kb=_peak_rss_kb(),
+        rss_growth_kb=_peak_rss_kb() - baseline_rss,
+        pages=count_pages(pdf_bytes),
+        output_bytes=len(pdf_bytes),
+    )
+    return result
+
+
+def case_key(result):
+    return f"{result['template']}/{result['experiences']}/{'photo' if result['photo'] else 'nophoto'}"
+
+
+def environment_info():
+    import reportlab
+    info = {'python': platform.python_version(), 'platform': platform.platform(), 'reportlab': reportlab.Version}
+    try:
+        info['git_commit'] = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR, capture_output=True,
+                                            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return info
+
+
+def format_row(result, baseline=None):
+    label = f"{result['template']:<12} {result['experiences']:>4} {'photo' if result['photo'] else '-':<6}"
+    if result['status'] != 'ok':
+        return f"{label} ERROR {result['error']}"
+    row = (f"{label} {result['wall_seconds'] * 1000:9.1f} ms {result['peak_rss_kb'] / 1024:8.1f} MB "
+           f"{result['pages']:5d} pp {result['output_bytes'] / 1024:9.1f} KB")
+    if result.get('deterministic') is False:
+        row += "   NOT DETERMINISTIC"
+    previous = (baseline or {}).get(case_key(result))
+    if previous and previous.get('status') == 'ok' and previous['wall_seconds']:
+        change = (result['wall_seconds'] - previous['wall_seconds']) / previous['wall_seconds'] * 100
+        size_change = result['output_bytes'] - previous['output_bytes']
+        row += f"   time {change:+6.1f}%  bytes {size_change:+d}"
+    return row
+
+
+def main(argv=None):
+    from pdf_templates.registry import discover_templates
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--templates', help="Comma-separated template ids (default: every registered template)")
+    parser.add_argument('--sizes', default=','.join(map(str, RESUME_SIZES)), help="Comma-separated experience counts")
+    parser.add_argument('--photo', choices=('both', 'with', 'without'), default='both')
+    parser.add_argument('--repeat', type=int, default=3, help="Timed renders per case after the cold one")
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    parser.add_argument('--baseline', help="Earlier JSON output to compare against")
+    parser.add_argument('--check-determinism', action='store_true',
+                        help="Also check that deterministic renders of each case are byte-identical")
+    args = parser.parse_args(argv)
+
+    registry = discover_templates()
+    template_ids = args.templates.split(',') if args.templates else list(registry)
+    unknown = [t for t in template_ids if t not in registry]
+    if unknown:
+        parser.error(f"Unknown templates: {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(',')]
+    photos = {'both': (False, True), 'with': (True,), 'without': (False,)}[args.photo]
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {case_key(r): r for r in json.load(f)['results']}
+
+    print(f"{'template':<12} {'exp':>4} {'photo':<6} {'median':>12} {'peak RSS':>11} {'pages':>8} {'size':>12}")
+    results = []
+    spawn = multiprocessing.get_context('spawn')
+    for template_id in template_ids:
+        for size in sizes:
+            for with_photo in photos:
+                with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+                    result = executor.submit(run_case, template_id, size, with_photo, args.repeat,
+                                             args.check_determinism).result()
+                results.append(result)
+                print(format_row(result, baseline), flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'environment': environment_info(), 'repeat': args.repeat, 'results': results}, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+    return 1 if any(r['status'] != 'ok' or r.get('deterministic') is False for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+# benchmarks/resume_fixtures.py
+"""Synthetic resumes of increasing size, grown from resume_defaults.SAMPLE_RESUME_DATA."""
+import copy
+import os
+
+from resume_defaults import DEFAULT_SECTION_ORDER, SAMPLE_RESUME_DATA
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_PHOTO_PATH = 'static/images/profile.jpg'  # Relative to ROOT_DIR, like paths stored by the form
+
+RESUME_SIZES = (1, 5, 20, 100)  # Number of experiences
+
+LANGUAGE_NAMES = ['English', 'Spanish', 'Portuguese', 'French', 'German', 'Italian', 'Dutch',
+                  'Japanese', 'Mandarin', 'Arabic', 'Hindi', 'Russian']
+LEVELS = ['Native', 'Fluent', 'Advanced', 'Intermediate', 'Basic']
+
+
+def _long_description(entry, index, bullets):
+    """Repeats the sample bullets, numbered so every entry's text (and cache key) is distinct."""
+    lines = [line.lstrip('- ').strip() for line in entry['description'].split('\n') if line.strip()]
+    return '\n'.join(f"- {lines[i % len(lines)]} (initiative {index + 1}.{i + 1})" for i in range(bullets))
+
+
+def make_resume(n_experiences, with_photo=False):
+    """Returns resume data with `n_experiences` experiences and proportionally more of everything else."""
+    data = copy.deepcopy(SAMPLE_RESUME_DATA)
+    n_extra = max(1, n_experiences // 4)
+
+    sample_experiences = SAMPLE_RESUME_DATA['experiences']
+    data['experiences'] = []
+    for i in range(n_experiences):
+        experience = dict(sample_experiences[i % len(sample_experiences)])
+        experience['company'] = f"{experience['company']} #{i + 1}"
+        experience['description'] = _long_description(experience, i, bullets=3 + i % 5)
+        data['experiences'].append(experience)
+
+    sample_education = SAMPLE_RESUME_DATA['education_entries']
+    data['education_entries'] = [dict(sample_education[i % len(sample_education)]) for i in range(1 + n_extra)]
+
+    data['languages'] = [
+        {'name': LANGUAGE_NAMES[i % len(LANGUAGE_NAMES)], 'level': LEVELS[i % len(LEVELS)],
+         'reading': LEVELS[(i + 1) % len(LEVELS)], 'writing': LEVELS[(i + 2) % len(LEVELS)],
+         'speaking': LEVELS[(i + 3) % len(LEVELS)]}
+        for i in range(min(len(LANGUAGE_NAMES), 2 + n_extra))
+    ]
+    data['key_achievements'] = [dict(SAMPLE_RESUME_DATA['key_achievements'][i % 3]) for i in range(3 + n_extra)]
+    data['projects'] = [
+        {'title': f'Project {i + 1}', 'dates': '2020 - 2021',
+         'description': 'Led a cross-functional sourcing initiative across three business units. ' * (1 + i % 3)}
+        for i in range(n_extra)
+    ]
+    data['additional_info'] = [{'title': f'Certification {i + 1}', 'description': 'Issued by the Institute for Supply Management.'}
+                               for i in range(n_extra)]
+    data['references'] = [{'name': f'Reference {i + 1}', 'title': 'Director of Procurement', 'phone': '+1-(234)-555-0000',
+                            'description': 'Former manager.'} for i in range(min(n_extra, 5))]
+    data['custom_fields'] = [{'title': f'Custom Section {i + 1}', 'content': 'Volunteer work and community leadership. ' * 3,
+                              'section_key': f'custom_{i}'} for i in range(min(n_extra, 5))]
+    data['skills'] = ', '.join([SAMPLE_RESUME_DATA['skills']] * (1 + n_extra // 5))
+
+    data['profile_image_path'] = SAMPLE_PHOTO_PATH if with_photo else ''
+    data['section_order'] = list(DEFAULT_SECTION_ORDER) + [field['section_key'] for field in data['custom_fields']]
+    return data
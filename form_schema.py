@@ -0,0 +1,258 @@
+# form_schema.py
+"""Declarative description of the resume form and a single-pass parser for it.
+
+Repeated entries are posted as `prefix[i]` (experiences, education, ...) or
+`prefix_i` (achievements, courses, custom fields). parse_resume_form() scans
+the submitted form once, routes every key to its section/entry/field through
+one dict lookup, and then keeps the entries whose required field is filled,
+in index order. Removing an entry in the browser leaves a gap in the indexes;
+entries after the gap are kept.
+
+Adding a section means adding a ListSection here (and its inputs to
+form.html); nothing in app.py needs to change.
+"""
+from pdf_templates.page_fit import MAX_FIT_PAGES, page_target
+
+SHORT_TEXT = 200    # Names, titles, dates, contact details
+LONG_TEXT = 5000    # Free-text descriptions
+
+
+class ListSection:
+    """A repeated group of form inputs that becomes a list of dicts in the resume data.
+
+    `fields` maps each input's name prefix to (resume field, max length);
+    `checkboxes` maps prefixes to boolean fields. Entries whose `required`
+    field is empty are dropped. `finish(entry, position)` may adjust each
+    kept entry.
+    """
+
+    def __init__(self, key, fields, required, checkboxes=None, finish=None):
+        self.key = key
+        self.fields = fields
+        self.required = required
+        self.checkboxes = checkboxes or {}
+        self.finish = finish
+
+
+def _clear_end_date_if_present(entry, position):
+    if entry['is_present']:
+        entry['end_date'] = ''
+
+
+def _assign_section_key(entry, position):
+    entry['section_key'] = f'custom_{position}'  # Its id in section_order
+
+
+# Single-valued inputs: name -> max length
+SCALAR_FIELDS = {
+    'full_name': SHORT_TEXT,
+    'title_subtitle': SHORT_TEXT,
+    'email': SHORT_TEXT,
+    'phone': SHORT_TEXT,
+    'linkedin': SHORT_TEXT,
+    'location': SHORT_TEXT,
+    'id_number': SHORT_TEXT,
+    'nationality': SHORT_TEXT,
+    'birth_date': SHORT_TEXT,
+    'gender': SHORT_TEXT,
+    'website': SHORT_TEXT,
+    'address': SHORT_TEXT,
+    'summary': LONG_TEXT,
+    'place_of_birth': SHORT_TEXT,
+    'cargo': SHORT_TEXT,
+    'driving_license': SHORT_TEXT,
+    'marital_status': SHORT_TEXT,
+    'military_service': SHORT_TEXT,
+    'skills': LONG_TEXT,
+    'hobbies': LONG_TEXT,
+    'fit_to_pages': SHORT_TEXT,  # Page budget for shrink-to-fit; '' for none
+}
+
+LIST_SECTIONS = (
+    ListSection('key_achievements', {
+        'ach_title': ('title', SHORT_TEXT),
+        'ach_description': ('description', LONG_TEXT),
+    }, required='title'),
+    ListSection('courses', {
+        'course_title': ('title', SHORT_TEXT),
+        'course_description': ('description', LONG_TEXT),
+    }, required='title'),
+    ListSection('experiences', {
+        'exp_title': ('title', SHORT_TEXT),
+        'exp_company': ('company', SHORT_TEXT),
+        'exp_location': ('location', SHORT_TEXT),
+        'exp_start_date': ('start_date', SHORT_TEXT),
+        'exp_end_date': ('end_date', SHORT_TEXT),
+        'exp_description': ('description', LONG_TEXT),
+        'exp_achievements': ('achievements', LONG_TEXT),
+        'exp_responsibilities': ('responsibilities', LONG_TEXT),
+    }, required='title', checkboxes={'exp_present': 'is_present'}, finish=_clear_end_date_if_present),
+    ListSection('education_entries', {
+        'edu_degree': ('degree', SHORT_TEXT),
+        'edu_institution': ('institution', SHORT_TEXT),
+        'edu_location': ('edu_location', SHORT_TEXT),
+        'edu_start_date': ('start_date', SHORT_TEXT),
+        'edu_end_date': ('end_date', SHORT_TEXT),
+        'edu_details': ('edu_details', LONG_TEXT),
+    }, required='degree', checkboxes={'edu_present': 'is_present'}, finish=_clear_end_date_if_present),
+    ListSection('languages', {
+        'lang_name': ('name', SHORT_TEXT),
+        'lang_level': ('level', SHORT_TEXT),
+        'lang_reading': ('reading', SHORT_TEXT),
+        'lang_writing': ('writing', SHORT_TEXT),
+        'lang_speaking': ('speaking', SHORT_TEXT),
+    }, required='name'),
+    ListSection('additional_info', {
+        'info_title': ('title', SHORT_TEXT),
+        'info_description': ('description', LONG_TEXT),
+    }, required='title'),
+    ListSection('references', {
+        'ref_name': ('name', SHORT_TEXT),
+        'ref_title': ('title', SHORT_TEXT),
+        'ref_phone': ('phone', SHORT_TEXT),
+        'ref_description': ('description', LONG_TEXT),
+    }, required='name'),
+    ListSection('projects', {
+        'proj_title': ('title', SHORT_TEXT),
+        'proj_description': ('description', LONG_TEXT),
+        'proj_dates': ('dates', SHORT_TEXT),
+    }, required='title'),
+    ListSection('custom_fields', {
+        'custom_title': ('title', SHORT_TEXT),
+        'custom_content': ('content', LONG_TEXT),
+    }, required='title', finish=_assign_section_key),
+)
+
+# Input name prefix -> (section, resume field, max length or None for a checkbox)
+_PREFIXES = {}
+for _section in LIST_SECTIONS:
+    for _prefix, (_field, _max_length) in _section.fields.items():
+        _PREFIXES[_prefix] = (_section, _field, _max_length)
+    for _prefix, _field in _section.checkboxes.items():
+        _PREFIXES[_prefix] = (_section, _field, None)
+
+
+# Input name -> (section, field, max length, index), or None for inputs that are not part of a list section.
+# The same few hundred names arrive with every submission, so each is split once per process.
+_ROUTES = {}
+MAX_CACHED_ROUTES = 20000
+
+
+def _route(name):
+    """Where 'exp_title[3]' or 'ach_title_3' goes: (section, field, max length, 3); None if nowhere."""
+    if name.endswith(']'):
+        prefix, _, index = name[:-1].partition('[')
+    else:
+        prefix, _, index = name.rpartition('_')
+    target = _PREFIXES.get(prefix)
+    if target is None or not index.isdigit():
+        return None
+    return target + (int(index),)
+
+
+def parse_resume_form(form):
+    """Builds resume data from a submitted form (any mapping of input name -> value).
+
+    Returns (resume_data, truncated): values longer than their field's limit
+    are cut to it and their input names listed in `truncated`. Unknown inputs
+    are ignored.
+    """
+    truncated = []
+    resume_data = {}
+    for name, max_length in SCALAR_FIELDS.items():
+        value = form.get(name, '').strip()
+        if len(value) > max_length:
+            value = value[:max_length]
+            truncated.append(name)
+        resume_data[name] = value
+
+    raw_entries = {section.key: {} for section in LIST_SECTIONS}  # section -> index -> {field: value}
+    for name, value in form.items():
+        try:
+            route = _ROUTES[name]
+        except KeyError:
+            route = _route(name)
+            if len(_ROUTES) < MAX_CACHED_ROUTES:
+                _ROUTES[name] = route
+        if route is None:
+            continue
+        section, field, max_length, index = route
+        entry = raw_entries[section.key].setdefault(index, {})
+        if max_length is None:
+            entry[field] = value == 'on'
+            continue
+        value = value.strip()
+        if len(value) > max_length:
+            value = value[:max_length]
+            truncated.append(name)
+        entry[field] = value
+
+    for section in LIST_SECTIONS:
+        entries = resume_data[section.key] = []
+        for index in sorted(raw_entries[section.key]):
+            values = raw_entries[section.key][index]
+            if not values.get(section.required):
+                continue
+            entry = {field: values.get(field, '') for field, _ in section.fields.values()}
+            for field in section.checkboxes.values():
+                entry[field] = values.get(field, False)
+            if section.finish is not None:
+                section.finish(entry, len(entries))
+            entries.append(entry)
+    return resume_data, truncated
+
+
+def _check_text(problems, label, value, max_length):
+    if not isinstance(value, str):
+        problems.append(f"'{label}' must be a string")
+    elif len(value) > max_length:
+        problems.append(f"'{label}' is longer than {max_length} characters")
+
+
+def validate_resume_data(data):
+    """Checks resume data posted as JSON against the form's fields; returns a list of problems (empty if valid).
+
+    Known fields must have the form's types and fit its length limits (skills
+    and hobbies may also be lists, fit_to_pages a number, a custom section's
+    section_key a string); fields the form does not have are allowed and
+    passed to the templates as they are.
+    """
+    if not isinstance(data, dict):
+        return ["The request body must be a JSON object"]
+    problems = []
+    for name, max_length in SCALAR_FIELDS.items():
+        value = data.get(name)
+        if value is None:
+            continue
+        if name == 'fit_to_pages':
+            if value != '' and (isinstance(value, bool) or page_target(value) is None):
+                problems.append(f"'fit_to_pages' must be a page count from 1 to {MAX_FIT_PAGES}")
+        elif name in ('skills', 'hobbies') and isinstance(value, list):
+            for i, item in enumerate(value):
+                _check_text(problems, f"{name}[{i}]", item, SHORT_TEXT)
+        else:
+            _check_text(problems, name, value, max_length)
+
+    for section in LIST_SECTIONS:
+        entries = data.get(section.key)
+        if entries is None:
+            continue
+        if not isinstance(entries, list):
+            problems.append(f"'{section.key}' must be a list")
+            continue
+        for i, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                problems.append(f"'{section.key}[{i}]' must be an object")
+                continue
+            if not entry.get(section.required):
+                problems.append(f"'{section.key}[{i}].{section.required}' is required")
+            for field, max_length in section.fields.values():
+                if entry.get(field) is not None:
+                    _check_text(problems, f"{section.key}[{i}].{field}", entry[field], max_length)
+            for field in section.checkboxes.values():
+                if entry.get(field) is not None and not isinstance(entry[field], bool):
+                    problems.append(f"'{section.key}[{i}].{field}' must be true or false")
+            if section.finish is _assign_section_key and entry.get('section_key') is not None:
+                # Set by the form; API input may supply its own, used as a key in section_order
+                _check_text(problems, f"{section.key}[{i}].section_key", entry['section_key'], SHORT_TEXT)
+    return problems
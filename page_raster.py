@@ -0,0 +1,660 @@
+# page_raster.py
+"""Draws the first page of a rendered resume PDF as an image, in pure Python with Pillow.
+
+No PDF rasterizer is among the dependencies, and previews must not call out to
+another service, so this reads the PDF and paints page 1 itself. It is not a
+general PDF renderer. It understands what ReportLab writes for these
+templates: ASCII85/Flate streams, the standard 14 fonts, filled and stroked
+paths, clipping, fill alpha, images and form XObjects. Other operators are
+skipped. Text is set in the Type 1 versions of the standard fonts that ship
+with ReportLab, so it has the PDF's metrics and line breaks.
+
+The page is painted at SUPERSAMPLE times the requested width and then scaled
+down, which smooths edges and text. Glyphs are rasterized once per font and
+size and kept across renders.
+"""
+import base64
+import io
+import math
+import os
+import re
+import zlib
+from functools import lru_cache
+
+import reportlab
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+SUPERSAMPLE = 2
+WEBP_QUALITY = 80
+CURVE_SEGMENTS = 12
+
+FONT_DIR = os.path.join(os.path.dirname(reportlab.__file__), 'fonts')
+# Standard font -> ReportLab's Type 1 file for it
+STANDARD_FONT_FILES = {
+    'Helvetica': '_a______.pfb',
+    'Helvetica-Bold': '_ab_____.pfb',
+    'Helvetica-Oblique': '_ai_____.pfb',
+    'Helvetica-BoldOblique': '_abi____.pfb',
+    'Times-Roman': '_er_____.pfb',
+    'Times-Bold': '_eb_____.pfb',
+    'Times-Italic': '_ei_____.pfb',
+    'Times-BoldItalic': '_ebi____.pfb',
+    'Courier': 'com_____.pfb',
+    'Courier-Bold': 'cob_____.pfb',
+    'Courier-Oblique': 'coo_____.pfb',
+    'Courier-BoldOblique': 'cobo____.pfb',
+    'Symbol': 'sy______.pfb',
+    'ZapfDingbats': 'zd______.pfb',
+}
+SYMBOLIC_FONTS = ('Symbol', 'ZapfDingbats')  # Text is glyph codes in the font's own encoding, not WinAnsi
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+class RasterError(ValueError):
+    """Raised when the PDF is not one this module can draw."""
+
+
+# --- PDF objects ---
+
+class Name(str):
+    """A PDF name (/Helvetica); plain strings are bytes."""
+
+
+class Ref:
+    __slots__ = ('number',)
+
+    def __init__(self, number):
+        self.number = number
+
+
+class Stream:
+    __slots__ = ('dict', 'raw')
+
+    def __init__(self, dictionary, raw):
+        self.dict = dictionary
+        self.raw = raw
+
+    @property
+    def filters(self):
+        filters = self.dict.get('Filter', [])
+        return tuple(filters) if isinstance(filters, list) else (filters,)
+
+    def decoded(self):
+        """The stream's data with ASCII85 and Flate undone (DCT, i.e. JPEG, is left to the image decoder)."""
+        return _unfilter(self.raw, self.filters)
+
+
+def _unfilter(data, filters):
+    for name in filters:
+        if name == 'ASCII85Decode':
+            data = data.strip()
+            if data.endswith(b'~>'):
+                data = data[:-2]
+            data = base64.a85decode(data)
+        elif name == 'FlateDecode':
+            data = zlib.decompress(data)
+    return data
+
+
+@lru_cache(maxsize=32)
+def _image_pixels(raw, filters, width, height, color_space, bits):
+    """An image XObject's pixels as an RGB or L image, kept across renders: the photo recurs in every template."""
+    data = _unfilter(raw, filters)
+    if 'DCTDecode' in filters:
+        image = Image.open(io.BytesIO(data))
+        image.load()
+    else:
+        mode = '1' if bits == 1 else {'DeviceGray': 'L', 'DeviceCMYK': 'CMYK'}.get(color_space, 'RGB')
+        image = Image.frombytes(mode, (width, height), data)
+    return image if image.mode in ('RGB', 'L') else image.convert('RGB')
+
+
+_TOKEN = re.compile(rb'''
+    (?P<skip>(?:[\x00\t\n\x0c\r ]+|%[^\r\n]*)+)
+  | (?P<dict><<|>>)
+  | (?P<array>[\[\]])
+  | (?P<name>/[^\x00\t\n\x0c\r ()<>\[\]{}/%]*)
+  | (?P<hex><[0-9A-Fa-f\x00\t\n\x0c\r ]*>)
+  | (?P<string>\()
+  | (?P<number>[+-]?(?:\d+\.?\d*|\.\d+))
+  | (?P<keyword>[^\x00\t\n\x0c\r ()<>\[\]{}/%]+)
+''', re.X)
+_STRING_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b', ord('f'): b'\f'}
+_END = object()
+
+
+class _Lexer:
+    """Reads PDF values and operators from `data`, starting at `pos`."""
+
+    def __init__(self, data, pos=0):
+        self.data = data
+        self.pos = pos
+
+    def token(self):
+        """The next token: a value, '<<', '>>', '[', ']', an operator (str), or _END."""
+        while True:
+            match = _TOKEN.match(self.data, self.pos)
+            if match is None:
+                if self.pos >= len(self.data):
+                    return _END
+                self.pos += 1  # A stray byte (e.g. a lone '}'): skip it
+                continue
+            self.pos = match.end()
+            kind = match.lastgroup
+            if kind == 'skip':
+                continue
+            text = match.group(kind)
+            if kind == 'number':
+                return float(text) if b'.' in text else int(text)
+            if kind == 'name':
+                return Name(re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), text[1:]).decode('latin-1'))
+            if kind == 'string':
+                return self._literal_string()
+            if kind == 'hex':
+                digits = re.sub(rb'[^0-9A-Fa-f]', b'', text)
+                return bytes.fromhex((digits + b'0' * (len(digits) % 2)).decode('ascii'))
+            return text.decode('latin-1')  # '<<', '>>', '[', ']', an operator, true/false/null or R
+
+    def _literal_string(self):
+        data, pos, depth = self.data, self.pos, 1
+        out = bytearray()
+        while pos < len(data):
+            byte = data[pos]
+            pos += 1
+            if byte == 0x5C:  # Backslash
+                escaped = data[pos]
+                pos += 1
+                if escaped in _STRING_ESCAPES:
+                    out += _STRING_ESCAPES[escaped]
+                elif 0x30 <= escaped <= 0x37:  # Up to three octal digits
+                    digits = bytes([escaped])
+                    while len(digits) < 3 and pos < len(data) and 0x30 <= data[pos] <= 0x37:
+                        digits += data[pos:pos + 1]
+                        pos += 1
+                    out.append(int(digits, 8) & 0xFF)
+                elif escaped == 0x0D:  # Line continuation
+                    if data[pos:pos + 1] == b'\n':
+                        pos += 1
+                elif escaped != 0x0A:
+                    out.append(escaped)
+            elif byte == 0x28:
+                depth += 1
+                out.append(byte)
+            elif byte == 0x29:
+                depth -= 1
+                if depth == 0:
+                    break
+                out.append(byte)
+            else:
+                out.append(byte)
+        self.pos = pos
+        return bytes(out)
+
+    def value(self, token=None):
+        """Parses one complete value (dictionaries and arrays included, 'n g R' as a Ref)."""
+        token = self.token() if token is None else token
+        if token == '<<':
+            result = {}
+            while True:
+                key = self.token()
+                if key == '>>' or key is _END:
+                    return result
+                result[key] = self.value()
+        if token == '[':
+            items = []
+            while True:
+                item = self.token()
+                if item == ']' or item is _END:
+                    return items
+                if item == 'R' and len(items) >= 2:
+                    items[-2:] = [Ref(items[-2])]
+                    continue
+                items.append(self.value(item))
+        if isinstance(token, int):
+            # Possibly the start of 'n g R'
+            saved = self.pos
+            generation, marker = self.token(), self.token()
+            if isinstance(generation, int) and marker == 'R':
+                return Ref(token)
+            self.pos = saved
+        if token == 'true':
+            return True
+        if token == 'false':
+            return False
+        if token == 'null':
+            return None
+        return token
+
+
+_OBJECT = re.compile(rb'(\d+)\s+\d+\s+obj\b')
+_STREAM = re.compile(rb'\s*stream\r?\n')
+
+
+class PdfFile:
+    """The objects of a PDF written front to back by ReportLab (no incremental updates or object streams)."""
+
+    def __init__(self, data):
+        self.data = data
+        self.objects = {}
+        pos = 0
+        while True:
+            match = _OBJECT.search(data, pos)
+            if match is None:
+                break
+            lexer = _Lexer(data, match.end())
+            value = lexer.value()
+            pos = lexer.pos
+            stream = _STREAM.match(data, pos) if isinstance(value, dict) else None
+            if stream is not None:
+                length = self.resolve(value.get('Length'))
+                start = stream.end()
+                end = start + length if isinstance(length, int) else data.index(b'endstream', start)
+                value = Stream(value, data[start:end])
+                pos = end
+            self.objects[int(match.group(1))] = value
+        trailer = data.rfind(b'trailer')
+        if trailer < 0:
+            raise RasterError("No trailer")
+        self.trailer = _Lexer(data, trailer + len(b'trailer')).value()
+
+    def resolve(self, value):
+        while isinstance(value, Ref):
+            value = self.objects.get(value.number)
+        return value
+
+    def first_page(self):
+        node = self.resolve(self.resolve(self.trailer.get('Root', {})).get('Pages'))
+        inherited = {}
+        while isinstance(node, dict) and node.get('Type') == 'Pages':
+            for key in ('Resources', 'MediaBox'):
+                if key in node:
+                    inherited[key] = node[key]
+            kids = self.resolve(node.get('Kids')) or []
+            if not kids:
+                break
+            node = self.resolve(kids[0])
+        if not isinstance(node, dict) or node.get('Type') != 'Page':
+            raise RasterError("No page found")
+        return {**inherited, **node}
+
+
+# --- Drawing ---
+
+def _multiply(m, n):
+    """The matrix product m x n (PDF's row-vector convention: apply m, then n)."""
+    a, b, c, d, e, f = m
+    A, B, C, D, E, F = n
+    return (a * A + b * C, a * B + b * D, c * A + d * C, c * B + d * D, e * A + f * C + E, e * B + f * D + F)
+
+
+def _apply(m, x, y):
+    return m[0] * x + m[2] * y + m[4], m[1] * x + m[3] * y + m[5]
+
+
+def _color(components):
+    components = [min(1.0, max(0.0, float(v))) for v in components]
+    if len(components) == 1:
+        components *= 3
+    elif len(components) == 4:  # CMYK
+        c, m, y, k = components
+        components = [(1 - c) * (1 - k), (1 - m) * (1 - k), (1 - y) * (1 - k)]
+    return tuple(round(v * 255) for v in components[:3])
+
+
+@lru_cache(maxsize=256)
+def _font(base_font, pixel_size):
+    encoding = 'ADBC' if base_font in SYMBOLIC_FONTS else ''  # Symbolic fonts are indexed by glyph code
+    return ImageFont.truetype(os.path.join(FONT_DIR, STANDARD_FONT_FILES[base_font]), pixel_size, encoding=encoding)
+
+
+@lru_cache(maxsize=8192)
+def _glyph(base_font, pixel_size, char):
+    """(mask, left, top) for one character, offset from its baseline origin; None for blank ones.
+
+    FreeType rasterizes Type 1 outlines slowly and Pillow keeps no glyph
+    cache, so each glyph is drawn once per font and size and then pasted.
+    """
+    font = _font(base_font, pixel_size)
+    left, top, right, bottom = font.getbbox(char, anchor='ls')
+    if right <= left or bottom <= top:
+        return None
+    mask = Image.new('L', (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), char, fill=255, font=font, anchor='ls')
+    return mask, left, top
+
+
+@lru_cache(maxsize=4096)
+def _char_width(base_font, char):
+    """Advance width of `char` at size 1: ReportLab's metrics, or the font file's for symbolic fonts."""
+    if base_font in SYMBOLIC_FONTS:
+        return _font(base_font, 1000).getlength(char) / 1000
+    return stringWidth(char, base_font, 1)
+
+
+class _GraphicsState:
+    __slots__ = ('ctm', 'fill', 'stroke', 'fill_alpha', 'stroke_alpha', 'line_width', 'clip',
+                 'font', 'font_size', 'leading', 'char_spacing', 'word_spacing', 'horizontal_scale', 'rise')
+
+    def __init__(self, ctm):
+        self.ctm = ctm
+        self.fill = self.stroke = (0, 0, 0)
+        self.fill_alpha = self.stroke_alpha = 1.0
+        self.line_width = 1.0
+        self.clip = None  # 'L' mask of the device, or None for no clipping
+        self.font = 'Helvetica'
+        self.font_size = 12.0
+        self.leading = 0.0
+        self.char_spacing = 0.0
+        self.word_spacing = 0.0
+        self.horizontal_scale = 1.0
+        self.rise = 0.0
+
+    def copy(self):
+        state = _GraphicsState.__new__(_GraphicsState)
+        for slot in self.__slots__:
+            setattr(state, slot, getattr(self, slot))
+        return state
+
+
+class _PageRasterizer:
+    """Paints one page's content stream onto a Pillow image."""
+
+    def __init__(self, pdf, page, width):
+        self.pdf = pdf
+        x0, y0, x1, y1 = [float(v) for v in pdf.resolve(page.get('MediaBox', [0, 0, 612, 792]))]
+        scale = width / (x1 - x0)
+        self.size = (max(1, round(width)), max(1, round((y1 - y0) * scale)))
+        self.image = Image.new('RGB', self.size, 'white')
+        self.draw = ImageDraw.Draw(self.image)
+        self.state = _GraphicsState((scale, 0.0, 0.0, -scale, -x0 * scale, y1 * scale))  # y grows downwards
+        self.stack = []
+
+    def run(self, content, resources):
+        lexer = _Lexer(content)
+        operands = []
+        path, subpath, pending_clip = [], None, None
+        text_matrix = line_matrix = IDENTITY
+        while True:
+            token = lexer.token()
+            if token is _END:
+                break
+            if not isinstance(token, str) or isinstance(token, Name) or token in ('true', 'false', 'null'):
+                operands.append(token)
+                continue
+            if token in ('[', '<<'):
+                operands.append(lexer.value(token))
+                continue
+            op, args = token, operands
+            operands = []
+            state = self.state
+            try:
+                # Graphics state
+                if op == 'q':
+                    self.stack.append(state.copy())
+                elif op == 'Q':
+                    if self.stack:
+                        self.state = self.stack.pop()
+                elif op == 'cm':
+                    state.ctm = _multiply(tuple(float(v) for v in args[-6:]), state.ctm)
+                elif op == 'w':
+                    state.line_width = float(args[-1])
+                elif op == 'rg' or op == 'g' or op == 'k':
+                    state.fill = _color(args)
+                elif op == 'RG' or op == 'G' or op == 'K':
+                    state.stroke = _color(args)
+                elif op == 'gs':
+                    ext = self.pdf.resolve(self.pdf.resolve(resources.get('ExtGState', {})).get(args[-1], {}))
+                    state.fill_alpha = float(ext.get('ca', state.fill_alpha))
+                    state.stroke_alpha = float(ext.get('CA', state.stroke_alpha))
+                # Path construction
+                elif op == 'm':
+                    subpath = [_apply(state.ctm, float(args[-2]), float(args[-1]))]
+                    path.append(subpath)
+                elif op == 'l' and subpath is not None:
+                    subpath.append(_apply(state.ctm, float(args[-2]), float(args[-1])))
+                elif op in ('c', 'v', 'y') and subpath is not None:
+                    self._curve(op, [float(v) for v in args], subpath)
+                elif op == 'h' and subpath:
+                    subpath.append(subpath[0])
+                elif op == 're':
+                    x, y, w, h = [float(v) for v in args[-4:]]
+                    subpath = [_apply(state.ctm, px, py) for px, py in ((x, y), (x + w, y), (x + w, y + h), (x, y + h), (x, y))]
+                    path.append(subpath)
+                elif op in ('W', 'W*'):
+                    pending_clip = op == 'W*'
+                # Path painting
+                elif op in ('f', 'F', 'f*', 'S', 's', 'B', 'B*', 'b', 'b*', 'n'):
+                    if op in ('s', 'b', 'b*'):
+                        for points in path:
+                            points.append(points[0])
+                    if op not in ('S', 's', 'n'):
+                        self._fill(path, op.endswith('*'))
+                    if op in ('S', 's', 'B', 'B*', 'b', 'b*'):
+                        self._stroke(path)
+                    if pending_clip is not None:
+                        mask = self._path_mask(path, pending_clip)
+                        state.clip = mask if state.clip is None else ImageChops.multiply(state.clip, mask)
+                    path, subpath, pending_clip = [], None, None
+                # Text
+                elif op == 'BT':
+                    text_matrix = line_matrix = IDENTITY
+                elif op == 'Tf':
+                    font = self.pdf.resolve(self.pdf.resolve(resources.get('Font', {})).get(args[-2], {}))
+                    base_font = str(font.get('BaseFont', ''))
+                    state.font = base_font if base_font in STANDARD_FONT_FILES else 'Helvetica'  # Embedded fonts: nearest stand-in
+                    state.font_size = float(args[-1])
+                elif op == 'TL':
+                    state.leading = float(args[-1])
+                elif op == 'Tc':
+                    state.char_spacing = float(args[-1])
+                elif op == 'Tw':
+                    state.word_spacing = float(args[-1])
+                elif op == 'Tz':
+                    state.horizontal_scale = float(args[-1]) / 100
+                elif op == 'Ts':
+                    state.rise = float(args[-1])
+                elif op in ('Td', 'TD'):
+                    tx, ty = float(args[-2]), float(args[-1])
+                    if op == 'TD':
+                        state.leading = -ty
+                    text_matrix = line_matrix = _multiply((1, 0, 0, 1, tx, ty), line_matrix)
+                elif op == 'Tm':
+                    text_matrix = line_matrix = tuple(float(v) for v in args[-6:])
+                elif op in ('T*', "'", '"'):
+                    if op == '"':
+                        state.word_spacing, state.char_spacing = float(args[-3]), float(args[-2])
+                    text_matrix = line_matrix = _multiply((1, 0, 0, 1, 0, -state.leading), line_matrix)
+                    if op != 'T*':
+                        text_matrix = self._show(args[-1], text_matrix)
+                elif op == 'Tj':
+                    text_matrix = self._show(args[-1], text_matrix)
+                elif op == 'TJ':
+                    for item in args[-1]:
+                        if isinstance(item, bytes):
+                            text_matrix = self._show(item, text_matrix)
+                        else:
+                            shift = -float(item) / 1000 * state.font_size * state.horizontal_scale
+                            text_matrix = _multiply((1, 0, 0, 1, shift, 0), text_matrix)
+                # XObjects
+                elif op == 'Do':
+                    xobjects = self.pdf.resolve(resources.get('XObject', {}))
+                    self._do(self.pdf.resolve(xobjects.get(args[-1])), resources)
+            except (IndexError, TypeError, ValueError, KeyError, ZeroDivisionError):
+                operands = []  # Malformed operands: skip the operator
+
+    def _curve(self, op, args, subpath):
+        ctm = self.state.ctm
+        if op == 'c':
+            x1, y1, x2, y2, x3, y3 = args[-6:]
+            p1, p2 = _apply(ctm, x1, y1), _apply(ctm, x2, y2)
+        elif op == 'v':
+            x2, y2, x3, y3 = args[-4:]
+            p1, p2 = subpath[-1], _apply(ctm, x2, y2)
+        else:
+            x1, y1, x3, y3 = args[-4:]
+            p1 = _apply(ctm, x1, y1)
+            p2 = _apply(ctm, x3, y3)
+        p0, p3 = subpath[-1], _apply(ctm, x3, y3)
+        for i in range(1, CURVE_SEGMENTS + 1):
+            t = i / CURVE_SEGMENTS
+            u = 1 - t
+            subpath.append((u * u * u * p0[0] + 3 * u * u * t * p1[0] + 3 * u * t * t * p2[0] + t * t * t * p3[0],
+                            u * u * u * p0[1] + 3 * u * u * t * p1[1] + 3 * u * t * t * p2[1] + t * t * t * p3[1]))
+
+    def _path_mask(self, path, even_odd):
+        mask = Image.new('L', self.size, 0)
+        if even_odd and len(path) > 1:
+            for points in path:
+                if len(points) >= 3:
+                    single = Image.new('L', self.size, 0)
+                    ImageDraw.Draw(single).polygon(points, fill=255)
+                    mask = ImageChops.logical_xor(mask.convert('1'), single.convert('1')).convert('L')
+        else:
+            draw = ImageDraw.Draw(mask)
+            for points in path:
+                if len(points) >= 3:
+                    draw.polygon(points, fill=255)
+        return mask
+
+    def _paint(self, color, alpha, mask):
+        """Paints `color` through `mask` ('L', device-sized), limited to the clip and scaled by `alpha`."""
+        if self.state.clip is not None:
+            mask = ImageChops.multiply(mask, self.state.clip)
+        if alpha < 1:
+            mask = mask.point(lambda v: round(v * alpha))
+        self.image.paste(color, (0, 0), mask)
+
+    def _fill(self, path, even_odd):
+        polygons = [points for points in path if len(points) >= 3]
+        if not polygons:
+            return
+        state = self.state
+        if len(polygons) == 1 and state.clip is None and state.fill_alpha >= 1:
+            self.draw.polygon(polygons[0], fill=state.fill)
+        else:
+            self._paint(state.fill, state.fill_alpha, self._path_mask(polygons, even_odd))
+
+    def _stroke(self, path):
+        state = self.state
+        a, b, c, d = state.ctm[:4]
+        width = max(1, round(state.line_width * math.sqrt(abs(a * d - b * c))))
+        lines = [points for points in path if len(points) >= 2]
+        if not lines:
+            return
+        if state.clip is None and state.stroke_alpha >= 1:
+            for points in lines:
+                self.draw.line(points, fill=state.stroke, width=width)
+            return
+        mask = Image.new('L', self.size, 0)
+        draw = ImageDraw.Draw(mask)
+        for points in lines:
+            draw.line(points, fill=255, width=width)
+        self._paint(state.stroke, state.stroke_alpha, mask)
+
+    def _show(self, data, text_matrix):
+        """Draws a text string at the text matrix; returns the matrix advanced past it."""
+        state = self.state
+        if state.font in SYMBOLIC_FONTS:
+            text = data.decode('latin-1')
+        else:
+            # WinAnsiEncoding shows its unused codes (ReportLab writes 0x7F for some bullets) as a bullet
+            text = data.decode('cp1252', errors='replace').replace('\ufffd', '•').replace('\x7f', '•')
+        device = _multiply(text_matrix, state.ctm)
+        pixel_size = round(state.font_size * math.hypot(device[2], device[3]) * 4) / 4
+        glyphs = []  # (glyph, device x, device y)
+        x = 0.0
+        for char in text:
+            if pixel_size >= 1 and not char.isspace():
+                glyph = _glyph(state.font, pixel_size, char)
+                if glyph is not None:
+                    glyphs.append((glyph, *_apply(device, x, state.rise)))
+            width = _char_width(state.font, char) * state.font_size + state.char_spacing
+            if char == ' ':
+                width += state.word_spacing
+            x += width * state.horizontal_scale
+        if glyphs:
+            self._text(glyphs)
+        return _multiply((1, 0, 0, 1, x, 0), text_matrix)
+
+    def _text(self, glyphs):
+        state = self.state
+        direct = state.clip is None and state.fill_alpha >= 1
+        target = self.image if direct else Image.new('L', self.size, 0)
+        color = state.fill if direct else 255
+        for (mask, left, top), x, y in glyphs:
+            target.paste(color, (round(x) + left, round(y) + top), mask)
+        if not direct:
+            self._paint(state.fill, state.fill_alpha, target)
+
+    def _do(self, xobject, resources):
+        if not isinstance(xobject, Stream):
+            return
+        subtype = xobject.dict.get('Subtype')
+        if subtype == 'Form':
+            self.stack.append(self.state.copy())
+            matrix = xobject.dict.get('Matrix')
+            if matrix:
+                self.state.ctm = _multiply(tuple(float(v) for v in matrix), self.state.ctm)
+            self.run(xobject.decoded(), self.pdf.resolve(xobject.dict.get('Resources')) or resources)
+            self.state = self.stack.pop()
+        elif subtype == 'Image':
+            self._image(xobject)
+
+    def _decode_image(self, xobject):
+        info = xobject.dict
+        image = _image_pixels(xobject.raw, xobject.filters, int(info['Width']), int(info['Height']),
+                              str(self.pdf.resolve(info.get('ColorSpace'))), info.get('BitsPerComponent', 8))
+        smask = self.pdf.resolve(info.get('SMask'))
+        if isinstance(smask, Stream):
+            alpha = self._decode_image(smask).convert('L')
+            if alpha.size != image.size:
+                alpha = alpha.resize(image.size)
+            image = image.convert('RGB')  # A copy: the cached pixels stay as they are
+            image.putalpha(alpha)
+        return image
+
+    def _image(self, xobject):
+        image = self._decode_image(xobject)
+        ctm = self.state.ctm
+        corners = [_apply(ctm, x, y) for x, y in ((0, 0), (1, 0), (0, 1), (1, 1))]
+        left, top = math.floor(min(x for x, _ in corners)), math.floor(min(y for _, y in corners))
+        right, bottom = math.ceil(max(x for x, _ in corners)), math.ceil(max(y for _, y in corners))
+        if right - left < 1 or bottom - top < 1:
+            return
+        image = image.resize((right - left, bottom - top), Image.LANCZOS)
+        if ctm[3] > 0:  # Unit square's top edge drawn at the bottom
+            image = image.transpose(Image.FLIP_TOP_BOTTOM)
+        if ctm[0] < 0:
+            image = image.transpose(Image.FLIP_LEFT_RIGHT)
+        mask = image.getchannel('A') if image.mode == 'RGBA' else Image.new('L', image.size, 255)
+        if self.state.clip is not None:
+            mask = ImageChops.multiply(mask, self.state.clip.crop((left, top, right, bottom)))
+        if self.state.fill_alpha < 1:
+            mask = mask.point(lambda v: round(v * self.state.fill_alpha))
+        self.image.paste(image.convert('RGB'), (left, top), mask)
+
+
+def rasterize_first_page(pdf_bytes, width):
+    """Page 1 of `pdf_bytes` as an RGB Pillow image `width` pixels wide (height follows the page's proportions)."""
+    pdf = PdfFile(pdf_bytes)
+    page = pdf.first_page()
+    rasterizer = _PageRasterizer(pdf, page, width * SUPERSAMPLE)
+    resources = pdf.resolve(page.get('Resources')) or {}
+    contents = pdf.resolve(page.get('Contents'))
+    for stream in contents if isinstance(contents, list) else [contents]:
+        stream = pdf.resolve(stream)
+        if isinstance(stream, Stream):
+            rasterizer.run(stream.decoded(), resources)
+    return rasterizer.image.reduce(SUPERSAMPLE)  # Box filter over each SUPERSAMPLE x SUPERSAMPLE block
+
+
+def encode_image(image, image_format):
+    """PNG or WebP bytes for a Pillow image."""
+    out = io.BytesIO()
+    if image_format == 'webp':
+        image.save(out, format='WEBP', quality=WEBP_QUALITY)
+    else:
+        image.save(out, format='PNG', optimize=False)
+    return out.getvalue()
@@ -0,0 +1,108 @@
+# pdf_templates/assets.py
+"""Bundled image assets (section icons, logos), decoded once per process.
+
+Templates used to hand ReportLab a relative file path on every use, which
+depends on the working directory and makes ReportLab open and decode the PNG
+again for each Image flowable and each page it is drawn on. load_image_asset()
+resolves the path against the project root, decodes the image once and keeps
+the result. canvas.drawImage() names image XObjects by a digest of their pixel
+data, so every use of an asset within a document points at a single embedded
+copy.
+
+A missing or unreadable asset is reported once and load_image_asset() returns
+None, so templates can fall back to drawing without it.
+"""
+import functools
+import io
+import os
+import threading
+
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_CACHED_ASSETS = 64
+
+_lock = threading.Lock()
+_assets = {}  # (absolute path, mtime, size) -> ImageAsset
+_reported = set()  # Paths already reported as missing or unreadable
+
+
+class ImageAsset:
+    """A decoded image whose ImageReader can be shared by all renders.
+
+    The reader's pixel data (and alpha mask) are decoded up front; after that
+    ReportLab only reads them, so one reader is safe to use from any thread.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.reader = ImageReader(io.BytesIO(data))
+        self.width, self.height = self.reader.getSize()
+        self.reader.getRGBData()  # drawImage digests it to name the XObject
+        if self.reader._dataA is not None:  # Alpha channel, drawn as a soft mask
+            self.reader._dataA.getRGBData()
+        if self.reader.jpeg_fh():
+            # JPEGs are embedded as-is from a file object; give each document its own instead of the shared one
+            self.reader.jpeg_fh = functools.partial(io.BytesIO, data)
+
+    def width_for_height(self, height):
+        return height * self.width / self.height
+
+
+class AssetImage(Flowable):
+    """Platypus flowable drawing an ImageAsset at a fixed size."""
+
+    def __init__(self, asset, width, height, hAlign='CENTER'):
+        Flowable.__init__(self)
+        self.asset = asset
+        self.width = width
+        self.height = height
+        self.hAlign = hAlign
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.asset.reader, 0, 0, self.width, self.height, mask='auto')
+
+
+def asset_path(path):
+    """Absolute path for `path`; relative paths are taken from the project root, not the working directory."""
+    return os.path.join(PROJECT_ROOT, path)
+
+
+def _report(path, message):
+    with _lock:
+        if path in _reported:
+            return
+        _reported.add(path)
+    print(f"Image asset {path} not used: {message}")
+
+
+def load_image_asset(path):
+    """The ImageAsset for `path`, decoded on first use; None if there is no path or the file is unusable."""
+    if not path:
+        return None
+    path = asset_path(path)
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        _report(path, e.strerror or e)
+        return None
+    key = (path, st.st_mtime_ns, st.st_size)
+    asset = _assets.get(key)
+    if asset is not None:
+        return asset
+    try:
+        asset = ImageAsset(path)
+    except Exception as e:
+        _report(path, e)
+        return None
+    with _lock:
+        if len(_assets) >= MAX_CACHED_ASSETS:
+            _assets.pop(next(iter(_assets)))
+        _assets[key] = asset
+    return asset
@@ -0,0 +1,97 @@
+# pdf_templates/images.py
+"""Profile photo preprocessing shared by the photo templates.
+
+Uploaded photos are usually far larger than the slot they are drawn into
+(the bundled sample is 1.5 MB for a 1.4 inch circle), and ReportLab decodes
+and embeds the original in every PDF. Here each photo is resampled once to
+PROFILE_IMAGE_DPI for the largest slot any template uses, re-encoded, and
+kept in a small LRU keyed by the hash of the original file's contents.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from PIL import Image as PILImage, ImageOps
+from reportlab.lib.utils import ImageReader
+
+# Largest profile slot across the templates (template_12 draws a 1.8 inch circle)
+PROFILE_SLOT_INCHES = 1.8
+PROFILE_IMAGE_DPI = 300
+PROFILE_IMAGE_PX = int(PROFILE_SLOT_INCHES * PROFILE_IMAGE_DPI)
+JPEG_QUALITY = 85
+MAX_CACHED_IMAGES = int(os.environ.get('PROFILE_IMAGE_CACHE_SIZE', 32))
+
+_lock = threading.Lock()
+_images = OrderedDict()  # content hash -> resampled, encoded bytes
+_hashes = {}  # (path, mtime, size) -> content hash, so unchanged files are not re-hashed
+
+
+def _content_hash(path):
+    st = os.stat(path)
+    stamp = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    with _lock:
+        digest = _hashes.get(stamp)
+    if digest is None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        with _lock:
+            _hashes[stamp] = digest
+            if len(_hashes) > MAX_CACHED_IMAGES * 4:
+                _hashes.pop(next(iter(_hashes)))
+    return digest
+
+
+def _resample(path):
+    """Scales the photo so its shorter side covers the slot at PROFILE_IMAGE_DPI (never upscales)."""
+    with PILImage.open(path) as img:
+        img = ImageOps.exif_transpose(img)
+        has_alpha = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+        scale = PROFILE_IMAGE_PX / min(img.size)
+        if scale < 1:
+            new_size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+            img = img.resize(new_size, PILImage.LANCZOS)
+        out = io.BytesIO()
+        if has_alpha:
+            img.save(out, format='PNG', optimize=True)
+        else:
+            # JPEG bytes are embedded as-is by ReportLab (DCTDecode), so the PDF carries the small file
+            img.save(out, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        return out.getvalue()
+
+
+def prepared_image_bytes(path):
+    """Returns the resampled, encoded photo for `path`, or None if it is missing or unreadable."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        digest = _content_hash(path)
+        with _lock:
+            data = _images.get(digest)
+            if data is not None:
+                _images.move_to_end(digest)
+                return data
+        data = _resample(path)
+    except Exception as e:
+        print(f"Could not prepare profile image {path}: {e}")
+        return None
+    with _lock:
+        _images[digest] = data
+        while len(_images) > MAX_CACHED_IMAGES:
+            _images.popitem(last=False)
+    return data
+
+
+def profile_image_reader(path):
+    """Ready-to-embed ImageReader for canvas.drawImage, or None when there is no usable photo."""
+    data = prepared_image_bytes(path)
+    # A fresh reader per call: readers hold a file position, so they are not shared across threads
+    return ImageReader(io.BytesIO(data)) if data is not None else None
+
+
+def profile_image_file(path):
+    """File-like object with the prepared photo, for platypus Image flowables; None if unusable."""
+    data = prepared_image_bytes(path)
+    return io.BytesIO(data) if data is not None else None
@@ -0,0 +1,149 @@
+# pdf_templates/page_fit.py
+"""Shrink-to-fit: lay a resume out at the largest scale that fits a page budget.
+
+The story is laid out in a frame enlarged by 1/scale and drawn scaled down by
+`scale` into the template's real frame, so fonts, spacing, rules and images
+all shrink together while the page margins stay put.
+
+Finding the scale does not take a full build per guess. A page-count estimate
+only wraps the story's top-level flowables at the candidate width: no
+splitting, drawing or PDF output. A binary search over that estimate picks
+the scale, and a real build confirms it; when page breaks fall worse than
+estimated, the scale is lowered a step and the story built again. A typical fit
+costs about one render plus a few wrap passes.
+
+The estimate runs a little high, so a resume whose full-size estimate is
+within FULL_SIZE_TOLERANCE of the budget is first built at full size, and only
+searched for a smaller scale if that build really is too long.
+
+Only single-frame SimpleDocTemplate documents can be scaled this way; other
+documents are built as they are.
+"""
+import math
+
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+from reportlab.platypus.flowables import PageBreak
+
+MAX_FIT_PAGES = 10
+MIN_SCALE = 0.7       # Below this the text is too small to read
+SEARCH_STEPS = 5      # Page estimates per fit, at most
+SEARCH_TOLERANCE = 0.02
+RETRY_STEP = 0.03     # Scale reduction when the real build needs more pages than estimated
+MAX_BUILDS = 3
+FULL_SIZE_TOLERANCE = 0.05  # Estimates this far over the budget get a full-size build first
+FRAME_PADDING = 6     # SimpleDocTemplate's frame padding on each side
+
+
+def page_target(value):
+    """The page count requested by `value` (2 or '2'); None if fitting is off or the value is not a valid count."""
+    try:
+        pages = int(value)
+    except (TypeError, ValueError):
+        return None
+    return pages if 1 <= pages <= MAX_FIT_PAGES else None
+
+
+def can_fit(doc):
+    """True if `doc` is a single-frame SimpleDocTemplate (its page templates are only made by build)."""
+    return isinstance(doc, SimpleDocTemplate) and not doc.pageTemplates
+
+
+def estimate_pages(story, width, height):
+    """Pages `story` needs in a width x height frame, estimated from its flowables' wrapped heights.
+
+    Fractional: 2.25 means two full pages and a quarter of a third.
+    """
+    width -= 2 * FRAME_PADDING
+    height -= 2 * FRAME_PADDING
+    pages, used = 0, 0.0
+    for flowable in story:
+        if isinstance(flowable, PageBreak):
+            pages, used = pages + 1, 0.0
+            continue
+        needed = flowable.wrap(width, height)[1] + flowable.getSpaceAfter()
+        if used:
+            needed += flowable.getSpaceBefore()
+        if used + needed <= height:
+            used += needed
+        elif needed > height or isinstance(flowable, (Paragraph, Table)):
+            # Splits across pages: fills the rest of this one and continues
+            pages, used = pages + int((used + needed) // height), (used + needed) % height
+        else:
+            pages, used = pages + 1, needed
+    return pages + used / height
+
+
+def _search_scale(story, width, height, pages):
+    """Largest scale (to about 1%) whose estimate fits in `pages`; MIN_SCALE if none does.
+
+    Shrinking by `scale` widens and lengthens the frame by 1/scale, so the
+    content needs roughly scale**2 as many pages. Each guess follows that and
+    is kept between the largest scale known to fit and the smallest known not to.
+    """
+    fits, too_big = MIN_SCALE, 1.0
+    scale = 1.0
+    for _ in range(SEARCH_STEPS):
+        needed = estimate_pages(story, width / scale, height / scale)
+        if needed <= pages:
+            fits = scale
+            if scale == 1.0 or needed >= pages * (1 - SEARCH_TOLERANCE):
+                return scale
+        else:
+            too_big = scale
+        scale *= math.sqrt(pages * (1 - SEARCH_TOLERANCE / 2) / needed)
+        if not fits < scale < too_big:
+            scale = (fits + too_big) / 2
+        if too_big - fits < SEARCH_TOLERANCE:
+            break
+    return fits
+
+
+def _scaled_page(scale, left, bottom):
+    def on_page(canvas, doc):
+        canvas.translate(left, bottom)
+        canvas.scale(scale, scale)
+        canvas.translate(-left, -bottom)
+    return on_page
+
+
+def _rewind(output):
+    if hasattr(output, 'truncate'):  # An earlier attempt already wrote to the buffer
+        output.seek(0)
+        output.truncate()
+
+
+def build_to_fit(doc, story, pages, build, **build_kwargs):
+    """build(story) at the largest scale (down to MIN_SCALE) that fits `pages` pages; returns the scale used.
+
+    `build` is doc.build or a wrapper around it.
+    """
+    doc._calc()
+    left, bottom, width, height = doc.leftMargin, doc.bottomMargin, doc.width, doc.height
+    right, top = doc.rightMargin, doc.topMargin
+    if estimate_pages(story, width, height) <= pages * (1 + FULL_SIZE_TOLERANCE):
+        scale = 1.0
+    else:
+        scale = _search_scale(story, width, height, pages)
+    try:
+        for attempt in range(MAX_BUILDS):
+            if attempt:
+                _rewind(doc.filename)
+            doc.pageTemplates = []
+            doc.rightMargin = doc.pagesize[0] - left - width / scale
+            doc.topMargin = doc.pagesize[1] - bottom - height / scale
+            if scale < 1:
+                on_page = _scaled_page(scale, left, bottom)
+                build_kwargs.update(onFirstPage=on_page, onLaterPages=on_page)
+            build(list(story), **build_kwargs)
+            if doc.page <= pages or scale <= MIN_SCALE:
+                break
+            if scale == 1.0:  # Too long at full size after all
+                scale = _search_scale(story, width, height, pages)
+                if scale == 1.0:
+                    scale = 1.0 - RETRY_STEP
+            else:
+                scale = max(MIN_SCALE, scale - RETRY_STEP)
+    finally:
+        doc.rightMargin, doc.topMargin = right, top
+        doc._calc()
+    return scale
@@ -0,0 +1,30 @@
+# pdf_templates/page_forms.py
+"""Page decoration recorded once per document and stamped on every page.
+
+Several templates draw the same chrome on every page from an onPage callback:
+background panels, a circular clip with the profile photo, footer rules and
+logos. Drawn directly, each page repeats the whole operator stream. A
+@page_form callback instead records its drawing the first time it runs in a
+document as a PDF form XObject, and every page, the first included, places
+that form with a single "Do" operator.
+
+Only decorate callbacks whose output is identical on every page of a
+document (no page numbers, nothing that depends on the page's content).
+"""
+import functools
+
+
+def page_form(draw):
+    """Decorator for an onPage callback, `draw(canvas, doc)` or a method `draw(self, canvas, doc)`."""
+    name = f"Chrome_{draw.__name__}"  # Unique within a document: one template's callbacks share a canvas
+
+    @functools.wraps(draw)
+    def stamp(*args):
+        canvas = args[-2]
+        if not canvas.hasForm(name):
+            canvas.beginForm(name)
+            draw(*args)
+            canvas.endForm()
+        canvas.doForm(name)
+
+    return stamp
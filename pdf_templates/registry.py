@@ -0,0 +1,151 @@
+# pdf_templates/registry.py
+"""Discovers the resume templates in this package without importing them.
+
+Every pdf_templates/template_*.py that defines generate_pdf() is a template.
+Its display name and preview image come from the module-level TEMPLATE_NAME
+and PREVIEW_IMAGE constants, read from the source with `ast`; the module
+itself (and with it ReportLab's platypus machinery) is only imported the
+first time its generator is used, or up front via warm_up().
+"""
+import ast
+import glob
+import hashlib
+import importlib
+import os
+import re
+import threading
+from collections.abc import Mapping
+
+import reportlab
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_FILE_PATTERN = re.compile(r'^template_(\d+)\.py$')
+METADATA_FIELDS = {'TEMPLATE_NAME': 'name', 'PREVIEW_IMAGE': 'preview_image'}
+
+
+def shared_code_version(package_dir=PACKAGE_DIR):
+    """Hash of the package's shared (non-template) modules and the ReportLab version.
+
+    Every template's output depends on these too, so they are part of each template's version.
+    """
+    digest = hashlib.sha1(reportlab.Version.encode('utf-8'))
+    for path in sorted(glob.glob(os.path.join(package_dir, '*.py'))):
+        if TEMPLATE_FILE_PATTERN.match(os.path.basename(path)):
+            continue
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def read_template_metadata(path, shared_version=''):
+    """Parses a template's source and returns its metadata, or None if it has no generate_pdf()."""
+    with open(path, 'rb') as f:
+        source = f.read()
+    tree = ast.parse(source, filename=path)
+    metadata = {'version': hashlib.sha1(source + shared_version.encode('ascii')).hexdigest()[:12]}
+    has_generator = False
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == 'generate_pdf':
+            has_generator = True
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id in METADATA_FIELDS:
+                    metadata[METADATA_FIELDS[target.id]] = node.value.value
+    return metadata if has_generator else None
+
+
+class TemplateEntry(Mapping):
+    """One template's metadata; also readable as the dict app.py used to hardcode.
+
+    Keys: 'name', 'preview_image', 'version' and 'generator'. Looking up the
+    generator imports the template module on first use.
+    """
+
+    KEYS = ('name', 'preview_image', 'version', 'generator')
+
+    def __init__(self, template_id, module_name, name=None, preview_image=None, version=''):
+        self.id = template_id
+        self.module_name = module_name
+        self.name = name or template_id.replace('_', ' ').title()
+        self.preview_image = preview_image
+        self.version = version  # Hash of the template source and shared code, used in render cache keys
+        self._lock = threading.Lock()
+        self._generator = None
+
+    @property
+    def loaded(self):
+        return self._generator is not None
+
+    @property
+    def generator(self):
+        if self._generator is None:
+            with self._lock:
+                if self._generator is None:
+                    module = importlib.import_module(self.module_name)
+                    self._generator = module.generate_pdf
+        return self._generator
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __repr__(self):
+        return f"<TemplateEntry {self.id} {self.name!r}{' loaded' if self.loaded else ''}>"
+
+
+class TemplateRegistry(Mapping):
+    """Template id -> TemplateEntry, in template number order."""
+
+    def __init__(self, entries):
+        self._entries = {entry.id: entry for entry in entries}
+
+    def __getitem__(self, template_id):
+        return self._entries[template_id]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def warm_up(self, template_ids):
+        """Imports the given templates now ('all' for every one); unknown ids are reported and skipped."""
+        if isinstance(template_ids, str):
+            template_ids = [t.strip() for t in template_ids.split(',') if t.strip()]
+        if 'all' in template_ids:
+            template_ids = list(self._entries)
+        for template_id in template_ids:
+            entry = self._entries.get(template_id)
+            if entry is None:
+                print(f"Warning: Cannot warm up unknown template '{template_id}'.")
+                continue
+            entry.generator
+        return [self._entries[t] for t in template_ids if t in self._entries]
+
+
+def discover_templates(package_dir=PACKAGE_DIR, package=__package__):
+    """Scans `package_dir` for template_<n>.py files and returns a TemplateRegistry."""
+    found = []
+    shared_version = shared_code_version(package_dir)
+    for path in glob.glob(os.path.join(package_dir, 'template_*.py')):
+        match = TEMPLATE_FILE_PATTERN.match(os.path.basename(path))
+        if not match:
+            continue
+        try:
+            metadata = read_template_metadata(path, shared_version)
+        except (OSError, SyntaxError) as e:
+            print(f"Warning: Skipping template {path}: {e}")
+            continue
+        if metadata is None:
+            continue  # No generate_pdf(), e.g. a helper module or a work-in-progress template
+        template_id = os.path.splitext(os.path.basename(path))[0]
+        found.append((int(match.group(1)), TemplateEntry(template_id, f'{package}.{template_id}', **metadata)))
+    return TemplateRegistry(entry for _, entry in sorted(found, key=lambda item: item[0]))
@@ -0,0 +1,149 @@
+# pdf_templates/rendering.py
+"""Per-render context and the single place every template hands its story to ReportLab.
+
+Callers create a RenderContext and pass it to generate_pdf(data, context);
+templates finish with build_document(doc, story, context). When a context is
+given, the render is split into timed stages:
+
+  * story     - everything the template does before doc.build (styles, flowables)
+  * layout    - doc.build's wrap/split/draw pass over the story
+  * serialize - writing the PDF objects out (canvas.save)
+
+and the resulting page count is recorded. Without a context, build_document
+is a plain doc.build.
+
+RenderContext(deterministic=True) makes the output a pure function of the
+data: ReportLab otherwise stamps each PDF with the current time and a random
+document ID, so identical renders differ byte-for-byte and cannot be
+deduplicated or served under a strong ETag.
+
+RenderContext(first_page_only=True) stops layout as soon as page 1 is
+complete and emits a one-page PDF, for previews whose cost should not grow
+with the resume; context.has_more_pages tells whether the full document
+continues. The page is laid out exactly as in the full render.
+
+build_document(..., fit_to_pages=N) shrinks the layout until it fits on N
+pages (see page_fit.py); the scale used is recorded on the context.
+"""
+import functools
+import time
+from contextlib import contextmanager
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus.doctemplate import ActionFlowable
+
+from .page_fit import build_to_fit, can_fit, page_target
+
+# Display order for Server-Timing; callers may add their own stages (e.g. cache lookup)
+STAGE_ORDER = ('parse', 'cache', 'story', 'layout', 'serialize', 'response')
+
+
+class RenderContext:
+    """Options and measurements for one render, shared between the caller and the template."""
+
+    def __init__(self, template_id=None, deterministic=False, first_page_only=False):
+        self.template_id = template_id
+        self.deterministic = deterministic
+        self.first_page_only = first_page_only
+        self.spans = {}  # stage -> seconds
+        self.pages = None
+        self.has_more_pages = None  # Set by first_page_only renders
+        self.scale = None  # Set when the render was shrunk to fit a page count
+        self.input_bytes = None
+        self.output_bytes = None
+
+    @contextmanager
+    def span(self, stage):
+        """Adds the time spent inside the block to `stage`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[stage] = self.spans.get(stage, 0.0) + time.perf_counter() - start
+
+    def render(self, generator, data):
+        """Runs `generator(data, context=self)` and attributes its time to story/layout/serialize."""
+        start = time.perf_counter()
+        buffer = generator(data, context=self)
+        total = time.perf_counter() - start
+        self.spans['story'] = max(0.0, total - self.spans.get('layout', 0.0) - self.spans.get('serialize', 0.0))
+        return buffer
+
+    def ordered_spans(self):
+        rank = {stage: i for i, stage in enumerate(STAGE_ORDER)}
+        return sorted(self.spans.items(), key=lambda item: rank.get(item[0], len(rank)))
+
+    def server_timing(self):
+        """Value for a Server-Timing response header (durations in milliseconds)."""
+        return ', '.join(f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self.ordered_spans())
+
+    def log_fields(self):
+        """Flat key=value summary for structured log lines."""
+        fields = {'template': self.template_id, 'pages': self.pages, 'scale': self.scale,
+                  'input_bytes': self.input_bytes, 'output_bytes': self.output_bytes}
+        fields.update({f"{stage}_ms": round(seconds * 1000, 1) for stage, seconds in self.ordered_spans()})
+        return ' '.join(f"{key}={value}" for key, value in fields.items() if value is not None)
+
+
+class InstrumentedCanvas(Canvas):
+    """Canvas that reports its save() time and final page count to a RenderContext."""
+
+    render_context = None
+
+    def save(self):
+        with self.render_context.span('serialize'):
+            Canvas.save(self)
+        self.render_context.pages = self.getPageNumber() - 1
+
+
+def _build_first_page(doc, context, flowables, **build_kwargs):
+    """doc.build that stops once page 1 is complete, noting in `context` whether any content was left over."""
+    after_page = doc.afterPage
+
+    def stop_after_page():
+        after_page()
+        # Whatever the page could not hold is back on the list by now; dropping it ends build's
+        # loop, and the next page is only begun for a further flowable
+        context.has_more_pages = any(not isinstance(f, ActionFlowable) for f in flowables)
+        del flowables[:]
+
+    doc.afterPage = stop_after_page
+    try:
+        doc.build(flowables, **build_kwargs)
+    finally:
+        del doc.afterPage
+
+
+def build_document(doc, story, context=None, fit_to_pages=None, **build_kwargs):
+    """Runs doc.build(story, **build_kwargs), timing layout and serialization into `context`.
+
+    `fit_to_pages` (a page count, or None) scales single-frame documents down to fit; see page_fit.py.
+    """
+    if context is not None and context.deterministic:
+        # Fixed creation/modification dates and a document ID derived from the content
+        doc.invariant = 1
+    pages = page_target(fit_to_pages)
+    fit = pages is not None and can_fit(doc)
+    if context is None:
+        if fit:
+            build_to_fit(doc, story, pages, doc.build, **build_kwargs)
+        else:
+            doc.build(story, **build_kwargs)
+        return doc
+    build = functools.partial(_build_first_page, doc, context) if context.first_page_only else doc.build
+
+    def canvasmaker(*args, **kwargs):
+        canv = InstrumentedCanvas(*args, **kwargs)
+        canv.render_context = context
+        return canv
+
+    serialize_before = context.spans.get('serialize', 0.0)
+    start = time.perf_counter()
+    if fit:
+        context.scale = round(build_to_fit(doc, story, pages, build, canvasmaker=canvasmaker, **build_kwargs), 3)
+    else:
+        build(story, canvasmaker=canvasmaker, **build_kwargs)
+    elapsed = time.perf_counter() - start
+    serialize = context.spans.get('serialize', 0.0) - serialize_before
+    context.spans['layout'] = context.spans.get('layout', 0.0) + elapsed - serialize
+    return doc
@@ -0,0 +1,151 @@
+# pdf_templates/resume_model.py
+"""Normalized resume data, built once per render instead of re-tokenized by every template.
+
+The form (and the JSON/CSV inputs of batch_render) produce a plain dict whose
+free-text fields templates used to split themselves on every render:
+descriptions into lines with '-'/'*'/'•' bullet detection, skills and hobbies
+on commas, 'YYYY-MM' dates through strptime. normalize_resume() does that work
+once and checks the shape of the data on the way.
+
+The model is read-only and mapping-compatible: resume['summary'],
+resume.get('experiences') and exp['company'] behave as they did on the dict
+(list sections come back as model objects), so template code that only reads
+fields keeps working. to_dict() returns the original dict, which stays the
+form that is stored in the session and hashed for cache keys.
+"""
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+
+BULLET_MARKERS = ('-', '*', '•')
+
+
+class ResumeDataError(ValueError):
+    """Raised by normalize_resume when the data does not have the expected shape."""
+
+
+@dataclass(frozen=True, slots=True)
+class DescriptionLine:
+    """One non-empty line of a free-text description."""
+    text: str    # The stripped line, including its bullet marker
+    marker: str  # '-', '*' or '•' when the line is a bullet, else ''
+
+    @property
+    def content(self):
+        """The line without its bullet marker."""
+        return self.text[1:].strip() if self.marker else self.text
+
+
+class _Record(Mapping):
+    """Dict-style read access to a record's raw fields, with model fields taking precedence."""
+
+    __slots__ = ()
+    _model_fields = ()
+
+    def __getitem__(self, key):
+        if key in self._model_fields:
+            return getattr(self, key)
+        return self.raw[key]
+
+    def __iter__(self):
+        return iter(self.raw)
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __contains__(self, key):
+        return key in self.raw
+
+    def to_dict(self):
+        return self.raw
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Experience(_Record):
+    raw: dict
+    description_lines: tuple
+    start: date = None  # None when the date is missing or not 'YYYY-MM'
+    end: date = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Education(_Record):
+    raw: dict
+    detail_lines: tuple
+    start: date = None
+    end: date = None
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Resume(_Record):
+    raw: dict
+    experiences: tuple
+    education_entries: tuple
+    skill_list: tuple
+    hobby_list: tuple
+
+    _model_fields = ('experiences', 'education_entries')
+
+
+def split_lines(text):
+    """Splits a description into its non-empty lines, detecting bullet markers."""
+    lines = []
+    for line in str(text or '').split('\n'):
+        line = line.strip()
+        if line:
+            lines.append(DescriptionLine(line, line[0] if line.startswith(BULLET_MARKERS) else ''))
+    return tuple(lines)
+
+
+def split_list(value):
+    """Skills/hobbies as a tuple of items: a comma-separated string or an already split list."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.split(',')
+    elif not isinstance(value, (list, tuple)):
+        raise ResumeDataError(f"expected a string or a list, got {type(value).__name__}")
+    return tuple(item for item in (str(item).strip() for item in value) if item)
+
+
+def parse_year_month(value):
+    """Parses the 'YYYY-MM' the form's month inputs send; returns None for anything else."""
+    if not isinstance(value, str) or len(value) != 7 or value[4] != '-':
+        return None
+    try:
+        return date(int(value[:4]), int(value[5:]), 1)
+    except ValueError:
+        return None
+
+
+def _entries(data, field):
+    entries = data.get(field) or []
+    if not isinstance(entries, (list, tuple)) or not all(isinstance(entry, Mapping) for entry in entries):
+        raise ResumeDataError(f"'{field}' must be a list of objects")
+    return entries
+
+
+def normalize_resume(data):
+    """Builds the Resume model for `data` (a resume dict); returns `data` itself if it already is one."""
+    if isinstance(data, Resume):
+        return data
+    if not isinstance(data, Mapping):
+        raise ResumeDataError(f"Resume data must be an object, got {type(data).__name__}")
+    for field in ('key_achievements', 'courses', 'languages', 'additional_info', 'references', 'projects'):
+        _entries(data, field)
+    lists = {}
+    for field in ('skills', 'hobbies'):
+        try:
+            lists[field] = split_list(data.get(field))
+        except ResumeDataError as e:
+            raise ResumeDataError(f"'{field}': {e}") from None
+
+    experiences = tuple(
+        Experience(exp, split_lines(exp.get('description')),
+                   parse_year_month(exp.get('start_date')), parse_year_month(exp.get('end_date')))
+        for exp in _entries(data, 'experiences'))
+    education_entries = tuple(
+        Education(edu, split_lines(edu.get('edu_details')),
+                  parse_year_month(edu.get('start_date')), parse_year_month(edu.get('end_date')))
+        for edu in _entries(data, 'education_entries'))
+    return Resume(data, experiences, education_entries, lists['skills'], lists['hobbies'])
@@ -0,0 +1,55 @@
+# pdf_templates/styles.py
+"""Build-once stylesheets shared by every render of a template.
+
+Each template declares its custom ParagraphStyles in a function decorated with
+@template_stylesheet. The first call builds the stylesheet (sample styles plus
+the template's own); every later call, from any thread, returns that same
+read-only instance instead of re-running getSampleStyleSheet() and a dozen
+styles.add() calls per PDF.
+"""
+import functools
+import threading
+
+from reportlab.lib.styles import StyleSheet1, getSampleStyleSheet
+
+
+class TemplateStyleSheet(StyleSheet1):
+    """ReportLab's sample stylesheet extended by one template; frozen once built."""
+
+    def __init__(self):
+        StyleSheet1.__init__(self)
+        sample = getSampleStyleSheet()
+        self.byName.update(sample.byName)
+        self.byAlias.update(sample.byAlias)
+        self._frozen = False
+
+    def add(self, style, alias=None):
+        if self._frozen:
+            raise TypeError(f"Stylesheet is shared between renders and cannot be modified (adding '{style.name}')")
+        # Templates may redefine a sample style such as 'Normal' or 'BodyText'; their definition wins
+        self.byName.pop(style.name, None)
+        if alias:
+            self.byAlias.pop(alias, None)
+        StyleSheet1.add(self, style, alias)
+
+    def freeze(self):
+        self._frozen = True
+        return self
+
+
+def template_stylesheet(define_styles):
+    """Decorator turning `define_styles(styles)` into a zero-argument getter of the built stylesheet."""
+    lock = threading.Lock()
+    built = []
+
+    @functools.wraps(define_styles)
+    def get_styles():
+        if not built:
+            with lock:
+                if not built:  # Another thread may have built it while we waited
+                    styles = TemplateStyleSheet()
+                    define_styles(styles)
+                    built.append(styles.freeze())
+        return built[0]
+
+    return get_styles
@@ -1,21 +1,23 @@
 import io
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, gray, white
 from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .styles import template_stylesheet
 
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 1'
+PREVIEW_IMAGE = 'images/classic_preview.png'
 
-def generate_pdf(data):
-    """Gera um currículo em PDF usando ReportLab, considerando a ordem das seções e incluindo todos os dados do formulário."""
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
-                            rightMargin=0.75 * inch, leftMargin=0.75 * inch,
-                            topMargin=0.75 * inch, bottomMargin=0.75 * inch)
-
-    styles = getSampleStyleSheet()
 
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Estilos Customizados ---
     styles.add(ParagraphStyle(name='MainTitle',
                               fontName='Helvetica-Bold',
@@ -78,6 +80,17 @@ def generate_pdf(data):
                               alignment=TA_JUSTIFY,
                               spaceAfter=0.05 * inch))
 
+
+def generate_pdf(data, context=None):
+    """Gera um currículo em PDF usando ReportLab, considerando a ordem das seções e incluindo todos os dados do formulário."""
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                            rightMargin=0.75 * inch, leftMargin=0.75 * inch,
+                            topMargin=0.75 * inch, bottomMargin=0.75 * inch)
+
+    styles = get_styles()
+
     story = []
 
     # --- Título Principal ---
@@ -87,7 +100,7 @@ def generate_pdf(data):
     story.append(Paragraph("Detalhes Pessoais", styles['SectionTitle']))
 
     if data.get('full_name'):
-        story.append(Paragraph(data['full_name'].upper(), styles['NameHeader']))
+        story.append(TextParagraph(data['full_name'].upper(), styles['NameHeader']))
 
     contact_info = []
     if data.get('email'): contact_info.append(f"Email: {data['email']}")
@@ -98,7 +111,7 @@ def generate_pdf(data):
     if data.get('address'): contact_info.append(f"Endereço: {data['address']}")
 
     if contact_info:
-        story.append(Paragraph(" | ".join(contact_info), styles['ContactHeader']))
+        story.append(TextParagraph(" | ".join(contact_info), styles['ContactHeader']))
 
     additional_personal_details = []
 
@@ -113,20 +126,21 @@ def generate_pdf(data):
 
     if additional_personal_details:
         for detail in additional_personal_details:
-            story.append(Paragraph(detail, styles['PersonalDetails']))
+            story.append(TextParagraph(detail, styles['PersonalDetails']))
 
     story.append(Spacer(1, 0.1 * inch))
     story.append(HRFlowable(width="100%", thickness=0.5, color=gray, spaceBefore=0.1 * inch, spaceAfter=0.1 * inch))
 
     # --- Ordenação das Seções ---
     section_order = data.get('section_order', ['summary', 'experience', 'education', 'achievements', 'courses', 'skills', 'hobbies', 'languages', 'additional_info', 'references', 'projects'])
-    # Iterar pelas seções ordenadas
 
-    for section_key in section_order:
+    def build_section(section_key):
+        """Flowables for one section."""
+        story = []
         if section_key == 'summary':
             if data.get('summary'):
                 story.append(Paragraph("Resumo", styles['SectionTitle']))
-                story.append(Paragraph(data['summary'], styles['NormalJustified']))
+                story.append(TextParagraph(data['summary'], styles['NormalJustified']))
                 story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'achievements':
@@ -135,9 +149,9 @@ def generate_pdf(data):
                 story.append(Paragraph("Principais Conquistas", styles['SectionTitle']))
                 for achievement in key_achievements:
                     if achievement.get('title'):
-                        story.append(Paragraph(achievement['title'], styles['JobTitle']))
+                        story.append(TextParagraph(achievement['title'], styles['JobTitle']))
                         if achievement.get('description'):
-                            story.append(Paragraph(achievement['description'], styles['NormalIndented']))
+                            story.append(TextParagraph(achievement['description'], styles['NormalIndented']))
                         story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'experience':
@@ -146,7 +160,7 @@ def generate_pdf(data):
                 story.append(Paragraph("Experiência Profissional", styles['SectionTitle']))
                 for exp in experiences:
                     if exp.get('title') and exp.get('company'):
-                        story.append(Paragraph(exp['title'], styles['JobTitle']))
+                        story.append(TextParagraph(exp['title'], styles['JobTitle']))
                         company_date_str = f"{exp['company']}"
                         if exp.get('start_date'):
                             company_date_str += f" | {exp.get('start_date')}"
@@ -156,15 +170,13 @@ def generate_pdf(data):
                             if exp.get("is_present"):
                                 company_date_str += " - Presente"
 
-                        story.append(Paragraph(company_date_str, styles['CompanyDate']))
+                        story.append(TextParagraph(company_date_str, styles['CompanyDate']))
                         if exp.get('description'):
-                            desc_lines = exp['description'].split('\n')
-                            for line in desc_lines:
-                                line = line.strip()
-                                if line.startswith(('-', '*', '•')):
-                                    story.append(Paragraph(line, styles['BulletPoint'], bulletText=line[0]))
-                                elif line:
-                                    story.append(Paragraph(line, styles['NormalIndented']))
+                            for line in exp.description_lines:
+                                if line.marker:
+                                    story.append(TextParagraph(line.text, styles['BulletPoint'], bulletText=line.marker))
+                                else:
+                                    story.append(TextParagraph(line.text, styles['NormalIndented']))
                         story.append(Spacer(1, 0.15 * inch))
 
         elif section_key == 'education':
@@ -173,7 +185,7 @@ def generate_pdf(data):
                 story.append(Paragraph("Formação Acadêmica", styles['SectionTitle']))
                 for edu in education_entries:
                     if edu.get('degree') and edu.get('institution'):
-                        story.append(Paragraph(edu['degree'], styles['JobTitle']))
+                        story.append(TextParagraph(edu['degree'], styles['JobTitle']))
                         edu_dates_str = f"{edu['institution']}"
                         if edu.get('start_date'):
                             edu_dates_str += f" | {edu.get('start_date')}"
@@ -182,10 +194,10 @@ def generate_pdf(data):
                         else:
                             if edu.get("is_present"):
                                 edu_dates_str += " - Presente"
-                        story.append(Paragraph(edu_dates_str, styles['CompanyDate']))
+                        story.append(TextParagraph(edu_dates_str, styles['CompanyDate']))
 
                         if edu.get('edu_details'):
-                            story.append(Paragraph(edu['edu_details'], styles['NormalIndented']))
+                            story.append(TextParagraph(edu['edu_details'], styles['NormalIndented']))
                         story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'courses':
@@ -194,21 +206,21 @@ def generate_pdf(data):
                 story.append(Paragraph("Cursos/Certificações", styles['SectionTitle']))
                 for course in courses:
                     if course.get('title'):
-                        story.append(Paragraph(course['title'], styles['JobTitle']))
+                        story.append(TextParagraph(course['title'], styles['JobTitle']))
                         if course.get('description'):
-                            story.append(Paragraph(course['description'], styles['NormalIndented']))
+                            story.append(TextParagraph(course['description'], styles['NormalIndented']))
                         story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'skills':
             if data.get('skills'):
                 story.append(Paragraph("Habilidades", styles['SectionTitle']))
-                story.append(Paragraph(data['skills'], styles['NormalJustified']))
+                story.append(TextParagraph(', '.join(data.skill_list), styles['NormalJustified']))
                 story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'hobbies':
             if data.get('hobbies'):
                 story.append(Paragraph("Hobbies", styles['SectionTitle']))
-                story.append(Paragraph(data['hobbies'], styles['NormalJustified']))
+                story.append(TextParagraph(', '.join(data.hobby_list), styles['NormalJustified']))
                 story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'languages':
@@ -244,9 +256,9 @@ def generate_pdf(data):
                 story.append(Paragraph("Informações Adicionais", styles['SectionTitle']))
                 for info in additional_info:
                     if info.get('title'):
-                        story.append(Paragraph(info['title'], styles['JobTitle']))
+                        story.append(TextParagraph(info['title'], styles['JobTitle']))
                         if info.get('description'):
-                            story.append(Paragraph(info['description'], styles['NormalIndented']))
+                            story.append(TextParagraph(info['description'], styles['NormalIndented']))
                         story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'references':
@@ -255,12 +267,12 @@ def generate_pdf(data):
                 story.append(Paragraph("Referências", styles['SectionTitle']))
                 for ref in references:
                     if ref.get('name'):
-                        story.append(Paragraph(ref['name'], styles['JobTitle']))
-                        story.append(Paragraph(f"{ref.get('title', 'N/A')}", styles['CompanyDate']))
+                        story.append(TextParagraph(ref['name'], styles['JobTitle']))
+                        story.append(TextParagraph(f"{ref.get('title', 'N/A')}", styles['CompanyDate']))
                         if ref.get('phone'):
-                            story.append(Paragraph(f"Telefone: {ref['phone']}", styles['NormalIndented']))
+                            story.append(TextParagraph(f"Telefone: {ref['phone']}", styles['NormalIndented']))
                         if ref.get('description'):
-                            story.append(Paragraph(ref['description'], styles['NormalIndented']))
+                            story.append(TextParagraph(ref['description'], styles['NormalIndented']))
                         story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'projects':
@@ -269,13 +281,18 @@ def generate_pdf(data):
                 story.append(Paragraph("Projetos", styles['SectionTitle']))
                 for project in projects:
                     if project.get('title'):
-                        story.append(Paragraph(project['title'], styles['JobTitle']))
+                        story.append(TextParagraph(project['title'], styles['JobTitle']))
                         if project.get('description'):
-                            story.append(Paragraph(project['description'], styles['NormalIndented']))
+                            story.append(TextParagraph(project['description'], styles['NormalIndented']))
                         if project.get('dates'):
-                            story.append(Paragraph(f"Datas: {project['dates']}", styles['CompanyDate']))
+                            story.append(TextParagraph(f"Datas: {project['dates']}", styles['CompanyDate']))
                         story.append(Spacer(1, 0.1 * inch))
+        return story
+
+    # Iterar pelas seções ordenadas
+    for section_key in section_order:
+        story.extend(build_section(section_key))
 
-    doc.build(story)
+    build_document(doc, story, context, fit_to_pages=data.get('fit_to_pages'))
     buffer.seek(0)
     return buffer
\ No newline at end of file
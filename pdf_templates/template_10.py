@@ -1,32 +1,40 @@
 import io
 from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, PageBreak, FrameBreak
 from reportlab.platypus.flowables import KeepInFrame
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, gray, lightgrey
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.pagesizes import letter
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph, escape_markup
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 10'
+PREVIEW_IMAGE = 'images/modern_preview.png'
 
 def build_frame_story(data, styles, frame_name):
     story = []
     if frame_name == 'left_col':
         story.append(Paragraph("Contact", styles['SectionTitleLeft']))
         if data.get('email'):
-            story.append(Paragraph(data['email'], styles['ContactLeft']))
+            story.append(TextParagraph(data['email'], styles['ContactLeft']))
         if data.get('phone'):
-            story.append(Paragraph(data['phone'], styles['ContactLeft']))
+            story.append(TextParagraph(data['phone'], styles['ContactLeft']))
         if data.get('linkedin'):
-            story.append(Paragraph(f"<u><font color='blue'>{data['linkedin']}</font></u>", styles['LinkLeft']))
+            story.append(Paragraph(f"<u><font color='blue'>{escape_markup(data['linkedin'])}</font></u>", styles['LinkLeft']))
         if data.get('github'):
-            story.append(Paragraph(f"<u><font color='blue'>{data['github']}</font></u>", styles['LinkLeft']))
+            story.append(Paragraph(f"<u><font color='blue'>{escape_markup(data['github'])}</font></u>", styles['LinkLeft']))
         story.append(Spacer(1, 0.2 * inch))
 
         if data.get('skills'):
             story.append(Paragraph("Skills", styles['SectionTitleLeft']))
-            skills_list = [s.strip() for s in data['skills'].split(',')]
+            skills_list = data.skill_list
             for skill in skills_list:
                 if skill:
-                    story.append(Paragraph(f"• {skill}", styles['BulletLeft']))
+                    story.append(TextParagraph(f"• {skill}", styles['BulletLeft']))
             story.append(Spacer(1, 0.2 * inch))
 
         education_entries = data.get('education_entries', [])
@@ -34,31 +42,31 @@ def build_frame_story(data, styles, frame_name):
             story.append(Paragraph("Education", styles['SectionTitleLeft']))
             for edu in education_entries:
                 if edu.get('degree'):
-                    story.append(Paragraph(edu['degree'], styles['DegreeLeft']))
+                    story.append(TextParagraph(edu['degree'], styles['DegreeLeft']))
                 if edu.get('institution'):
-                    story.append(Paragraph(edu['institution'], styles['InstitutionLeft']))
+                    story.append(TextParagraph(edu['institution'], styles['InstitutionLeft']))
                 if edu.get('edu_dates'):
-                    story.append(Paragraph(edu['edu_dates'], styles['DatesLeft']))
+                    story.append(TextParagraph(edu['edu_dates'], styles['DatesLeft']))
                 if edu.get('edu_details'):
-                    story.append(Paragraph(edu['edu_details'], styles['DetailsLeft']))
+                    story.append(TextParagraph(edu['edu_details'], styles['DetailsLeft']))
                 story.append(Spacer(1, 0.1 * inch))
             story.append(Spacer(1, 0.2 * inch))
 
         if data.get('hobbies'):
             story.append(Paragraph("Hobbies", styles['SectionTitleLeft']))
-            hobbies_list = [h.strip() for h in data['hobbies'].split(',')]
+            hobbies_list = data.hobby_list
             for hobby in hobbies_list:
                 if hobby:
-                    story.append(Paragraph(f"• {hobby}", styles['BulletLeft']))
+                    story.append(TextParagraph(f"• {hobby}", styles['BulletLeft']))
 
     elif frame_name == 'right_col':
         if data.get('full_name'):
-            story.append(Paragraph(data['full_name'].upper(), styles['NameHeaderRight']))
+            story.append(TextParagraph(data['full_name'].upper(), styles['NameHeaderRight']))
         story.append(Spacer(1, 0.1 * inch))
 
         if data.get('summary'):
             story.append(Paragraph("Summary", styles['SectionTitleRight']))
-            story.append(Paragraph(data['summary'], styles['BodyTextRight']))
+            story.append(TextParagraph(data['summary'], styles['BodyTextRight']))
             story.append(Spacer(1, 0.2 * inch))
 
         experiences = data.get('experiences', [])
@@ -66,21 +74,19 @@ def build_frame_story(data, styles, frame_name):
             story.append(Paragraph("Experience", styles['SectionTitleRight']))
             for exp in experiences:
                 if exp.get('title'):
-                    story.append(Paragraph(exp['title'], styles['JobTitleRight']))
+                    story.append(TextParagraph(exp['title'], styles['JobTitleRight']))
                 if exp.get('company') or exp.get('dates'):
                     company_date_line = []
                     if exp.get('company'): company_date_line.append(exp['company'])
                     if exp.get('dates'): company_date_line.append(exp['dates'])
-                    story.append(Paragraph(" | ".join(company_date_line), styles['CompanyDateRight']))
+                    story.append(TextParagraph(" | ".join(company_date_line), styles['CompanyDateRight']))
 
                 if exp.get('description'):
-                    desc_lines = exp['description'].split('\n')
-                    for line in desc_lines:
-                        line = line.strip()
-                        if line.startswith(('-', '*', '•')):
-                            story.append(Paragraph(line, styles['BulletRight'], bulletText=line[0]))
-                        elif line:
-                            story.append(Paragraph(line, styles['BodyTextRightIndented']))
+                    for line in exp.description_lines:
+                        if line.marker:
+                            story.append(TextParagraph(line.text, styles['BulletRight'], bulletText=line.marker))
+                        else:
+                            story.append(TextParagraph(line.text, styles['BodyTextRightIndented']))
                 story.append(Spacer(1, 0.15 * inch))
     return story
 
@@ -105,14 +111,9 @@ class TwoColumnDocTemplate(BaseDocTemplate):
     def afterFlowable(self, flowable):
         pass
 
-def generate_pdf(data):
-    buffer = io.BytesIO()
-
-    margin = 0.75 * inch
-    doc = TwoColumnDocTemplate(buffer, pagesize=letter, leftMargin=margin, rightMargin=margin, topMargin=margin, bottomMargin=margin)
-
-    styles = getSampleStyleSheet()
-
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     styles.add(ParagraphStyle(name='SectionTitleLeft', fontName='Helvetica-Bold', fontSize=11, spaceBefore=6, spaceAfter=3, textColor=HexColor('#2c5282')))
     styles.add(ParagraphStyle(name='ContactLeft', fontName='Helvetica', fontSize=9, leading=11, spaceAfter=2))
     styles.add(ParagraphStyle(name='LinkLeft', parent=styles['ContactLeft'], textColor=HexColor('#2b6cb0')))
@@ -131,6 +132,16 @@ def generate_pdf(data):
     styles.add(ParagraphStyle(name='BodyTextRightIndented', parent=styles['BodyTextRight'], leftIndent=15))
     styles.add(ParagraphStyle(name='BulletRight', parent=styles['BodyTextRight'], bulletIndent=10, leftIndent=20, firstLineIndent=0, spaceAfter=2))
 
+
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+
+    margin = 0.75 * inch
+    doc = TwoColumnDocTemplate(buffer, pagesize=letter, leftMargin=margin, rightMargin=margin, topMargin=margin, bottomMargin=margin)
+
+    styles = get_styles()
+
     side_story_content = build_frame_story(data, styles, 'left_col')
     main_story_content = build_frame_story(data, styles, 'right_col')
 
@@ -139,6 +150,6 @@ def generate_pdf(data):
     final_platypus_story.append(FrameBreak())
     final_platypus_story.extend(main_story_content)
 
-    doc.build(final_platypus_story)
+    build_document(doc, final_platypus_story, context)
     buffer.seek(0)
     return buffer
@@ -1,7 +1,7 @@
 # pdf_templates/modern_template.py
 import io
 from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Image, Table, TableStyle, FrameBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch, cm
 from reportlab.lib.colors import HexColor, black, white, transparent
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
@@ -9,7 +9,16 @@ from reportlab.lib.pagesizes import A4 # <-- USE A4
 from reportlab.graphics.shapes import Circle
 # from reportlab.lib.utils import ImageReader # Not strictly needed if using canvas.drawImage
 import os
-from datetime import datetime
+from .images import profile_image_reader
+from .page_forms import page_form
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph, escape_markup
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 12'
+PREVIEW_IMAGE = 'images/modern_preview.png'
 
 # --- Color Palette ---
 COLOR_PRIMARY_GREEN = HexColor('#36A083')
@@ -35,6 +44,8 @@ class ModernDocTemplate(BaseDocTemplate):
         # Set A4 page size directly here
         kwargs['pagesize'] = A4
         BaseDocTemplate.__init__(self, filename, **kwargs)
+        # Downscaled once and reused on every page instead of embedding the original photo
+        self.profile_image = profile_image_reader(self.profile_image_path)
 
         # Define frames based on A4 dimensions (adjust widths/gaps if needed)
         # A4 dimensions: 8.27 x 11.69 inches
@@ -55,6 +66,7 @@ class ModernDocTemplate(BaseDocTemplate):
         main_page_template = PageTemplate(id='MainPage', frames=[frame_left, frame_right], onPage=self.draw_page_background)
         self.addPageTemplates([main_page_template])
 
+    @page_form
     def draw_page_background(self, canvas, doc):
         """Draws the static background elements like colored areas and profile pic circle"""
         canvas.saveState()
@@ -76,7 +88,7 @@ class ModernDocTemplate(BaseDocTemplate):
         canvas.circle(img_center_x - 0.8*inch, img_center_y + 0.7*inch, 0.4*inch, stroke=0, fill=1) # Example position
 
         # --- Profile Image (Circular) ---
-        if self.profile_image_path and os.path.exists(self.profile_image_path):
+        if self.profile_image:
             try:
                 img_size = 1.8 * inch # Diameter of the image
                 img_radius = img_size / 2
@@ -89,7 +101,7 @@ class ModernDocTemplate(BaseDocTemplate):
                 canvas.clipPath(path, stroke=0, fill=0)
 
                 # Draw the image within the clipped circle
-                canvas.drawImage(self.profile_image_path, img_draw_x, img_draw_y,
+                canvas.drawImage(self.profile_image, img_draw_x, img_draw_y,
                                  width=img_size, height=img_size, mask='auto')
                 # IMPORTANT: Must restore state after clipping if other drawing happens later
                 # canvas.restoreState() # Don't restore here, restore outside the if/else
@@ -129,28 +141,16 @@ def create_section_header(icon_char, title_text, style, icon_color=COLOR_PRIMARY
     return Paragraph(f'<font name="{icon_font_name}" color="{icon_color.hexval()}">{icon_char}</font>  {title_text.upper()}', style)
 
 
-def format_month_year(date_str_yyyy_mm):
-    """Formats YYYY-MM to MM/YYYY. Returns original on error."""
-    if not date_str_yyyy_mm: return ""
-    try:
-        dt_obj = datetime.strptime(date_str_yyyy_mm, "%Y-%m")
-        return dt_obj.strftime("%m/%Y") # Output: MM/YYYY
-    except ValueError:
-        return date_str_yyyy_mm # Return original if parsing fails
+def format_month_year(parsed_date, date_str_yyyy_mm):
+    """Formats a date parsed from YYYY-MM as MM/YYYY. Returns the original string if it did not parse."""
+    if parsed_date is None:
+        return date_str_yyyy_mm or ""
+    return parsed_date.strftime("%m/%Y") # Output: MM/YYYY
 
 # --- PDF Generation Function ---
-def generate_pdf(data):
-    buffer = io.BytesIO()
-
-    margin_val = 0.6 * inch # Re-evaluate margins visually for A4
-    doc = ModernDocTemplate(buffer,
-                            # pagesize=A4 is now set in ModernDocTemplate class
-                            leftMargin=margin_val, rightMargin=margin_val,
-                            topMargin=margin_val, bottomMargin=margin_val,
-                            profile_image_path=data.get('profile_image_path'),
-                            title=f"Resume - {data.get('full_name', 'Applicant')}") # Set PDF title metadata
-
-    styles = getSampleStyleSheet()
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Define Styles (Adjust font sizes/leading slightly if needed for A4) ---
     styles.add(ParagraphStyle(name='FullName', fontName='Helvetica-Bold', fontSize=26, textColor=COLOR_TEXT_BLACK, spaceBefore=0.15*inch, leading=30, alignment=TA_LEFT))
     styles.add(ParagraphStyle(name='JobTitle', fontName='Helvetica', fontSize=10.5, textColor=white, leading=13, spaceBefore=0, spaceAfter=0.1*inch, alignment=TA_LEFT))
@@ -174,6 +174,20 @@ def generate_pdf(data):
     styles.add(ParagraphStyle(name='EduDetails', parent=styles['RightColBody'], fontSize=8, leading=10.5, spaceBefore=2)) # Style for Edu details
 
 
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+
+    margin_val = 0.6 * inch # Re-evaluate margins visually for A4
+    doc = ModernDocTemplate(buffer,
+                            # pagesize=A4 is now set in ModernDocTemplate class
+                            leftMargin=margin_val, rightMargin=margin_val,
+                            topMargin=margin_val, bottomMargin=margin_val,
+                            profile_image_path=data.get('profile_image_path'),
+                            title=f"Resume - {data.get('full_name', 'Applicant')}") # Set PDF title metadata
+
+    styles = get_styles()
+
     # --- Section Building Functions (Encapsulated Logic) ---
     # These functions return a list of flowables for a given section
 
@@ -182,15 +196,15 @@ def generate_pdf(data):
         story = []
         # Using simple unicode symbols as icons for better font compatibility
         story.append(create_section_header('☎', 'CONTACTS', styles['LeftColH1'])) # Phone icon
-        if data.get('phone'): story.append(Paragraph(data['phone'], styles['LeftColText']))
-        if data.get('email'): story.append(Paragraph(data['email'], styles['LeftColText']))
+        if data.get('phone'): story.append(TextParagraph(data['phone'], styles['LeftColText']))
+        if data.get('email'): story.append(TextParagraph(data['email'], styles['LeftColText']))
         if data.get('linkedin'):
              # Attempt basic link creation (PDF viewers may auto-link)
              link = data['linkedin']
              if not link.startswith(('http://', 'https://')):
                  link = 'https://' + link
-             story.append(Paragraph(f'<link href="{link}">{data["linkedin"]}</link>', styles['LeftColText']))
-        if data.get('location'): story.append(Paragraph(data['location'], styles['LeftColText']))
+             story.append(Paragraph(f'<link href="{escape_markup(link)}">{escape_markup(data["linkedin"])}</link>', styles['LeftColText']))
+        if data.get('location'): story.append(TextParagraph(data['location'], styles['LeftColText']))
         story.append(Spacer(1, 0.2*inch))
         return story
 
@@ -200,8 +214,8 @@ def generate_pdf(data):
         if data.get('key_achievements'):
             story.append(create_section_header('★', 'KEY ACHIEVEMENTS', styles['LeftColH1'])) # Star icon
             for ach in data['key_achievements']:
-                story.append(Paragraph(ach['title'], styles['LeftColItemTitle']))
-                story.append(Paragraph(ach['description'], styles['LeftColItemDesc']))
+                story.append(TextParagraph(ach['title'], styles['LeftColItemTitle']))
+                story.append(TextParagraph(ach['description'], styles['LeftColItemDesc']))
                 story.append(Spacer(1, 0.08*inch)) # Slightly more space between items
             story.append(Spacer(1, 0.2*inch))
         return story
@@ -212,8 +226,8 @@ def generate_pdf(data):
         if data.get('courses'):
             story.append(create_section_header('📄', 'COURSES & CERTIFICATIONS', styles['LeftColH1'])) # Document icon
             for course in data['courses']:
-                story.append(Paragraph(course['title'], styles['LeftColItemTitle']))
-                story.append(Paragraph(course['description'], styles['LeftColItemDesc']))
+                story.append(TextParagraph(course['title'], styles['LeftColItemTitle']))
+                story.append(TextParagraph(course['description'], styles['LeftColItemDesc']))
                 story.append(Spacer(1, 0.08*inch))
             story.append(Spacer(1, 0.2*inch))
         return story
@@ -223,7 +237,7 @@ def generate_pdf(data):
         story = []
         story.append(create_section_header('👤', 'SUMMARY', styles['RightColH1'])) # Person icon
         if data.get('summary'):
-            story.append(Paragraph(data['summary'], styles['RightColBody']))
+            story.append(TextParagraph(data['summary'], styles['RightColBody']))
         story.append(Spacer(1, 0.2*inch))
         return story
 
@@ -234,13 +248,13 @@ def generate_pdf(data):
             story.append(create_section_header('💼', 'EXPERIENCE', styles['RightColH1'])) # Briefcase icon
             for exp in data['experiences']:
                 # Header Table (Title | Dates)
-                start_date_f = format_month_year(exp.get('start_date'))
-                end_date_f = format_month_year(exp.get('end_date')) if not exp.get('is_present') else 'Present'
+                start_date_f = format_month_year(exp.start, exp.get('start_date'))
+                end_date_f = format_month_year(exp.end, exp.get('end_date')) if not exp.get('is_present') else 'Present'
                 date_range = f"{start_date_f} - {end_date_f}" if start_date_f else end_date_f # Handle missing start date
 
                 exp_header_data = [[
-                    Paragraph(exp['title'], styles['ExpJobTitle']),
-                    Paragraph(date_range, styles['ExpDates'])
+                    TextParagraph(exp['title'], styles['ExpJobTitle']),
+                    TextParagraph(date_range, styles['ExpDates'])
                 ]]
                 exp_header_table = Table(exp_header_data, colWidths=['70%', '30%'], style=TableStyle([
                     ('VALIGN', (0,0), (-1,-1), 'TOP'),
@@ -253,15 +267,15 @@ def generate_pdf(data):
                 # Company & Location Line
                 company_line = exp.get('company', '')
                 if exp.get('location'): company_line += f" | {exp['location']}"
-                if company_line: story.append(Paragraph(company_line, styles['ExpCompanyLocation']))
+                if company_line: story.append(TextParagraph(company_line, styles['ExpCompanyLocation']))
 
                 # Description Bullet Points
                 description_text = exp.get('description', '')
                 if description_text:
                     # Split by newline, filter empty, remove leading hyphens/bullets
-                    points = [p.strip().lstrip('-*• ') for p in description_text.split('\n') if p.strip()]
+                    points = [line.text.lstrip('-*• ') for line in exp.description_lines]
                     for point in points:
-                        story.append(Paragraph(f"• {point}", styles['ExpBullet'])) # Use standard bullet
+                        story.append(TextParagraph(f"• {point}", styles['ExpBullet'])) # Use standard bullet
                 story.append(Spacer(1, 0.15*inch)) # Space between experiences
             # story.append(Spacer(1, 0.1*inch)) # Optional spacer after the whole section
         return story
@@ -273,13 +287,13 @@ def generate_pdf(data):
             story.append(create_section_header('🎓', 'EDUCATION', styles['RightColH1'])) # Graduation cap icon
             for edu in data['education_entries']:
                  # Header Table (Degree | Dates)
-                start_date_f = format_month_year(edu.get('start_date'))
-                end_date_f = format_month_year(edu.get('end_date')) if not edu.get('is_present') else 'Present'
+                start_date_f = format_month_year(edu.start, edu.get('start_date'))
+                end_date_f = format_month_year(edu.end, edu.get('end_date')) if not edu.get('is_present') else 'Present'
                 date_range = f"{start_date_f} - {end_date_f}" if start_date_f else end_date_f
 
                 edu_header_data = [[
-                    Paragraph(edu['degree'], styles['EduDegree']),
-                    Paragraph(date_range, styles['EduLocationDates'])
+                    TextParagraph(edu['degree'], styles['EduDegree']),
+                    TextParagraph(date_range, styles['EduLocationDates'])
                 ]]
                 edu_header_table = Table(edu_header_data, colWidths=['70%', '30%'], style=TableStyle([
                     ('VALIGN', (0,0), (-1,-1), 'TOP'),
@@ -292,11 +306,11 @@ def generate_pdf(data):
                 # Institution & Location Line
                 institution_line = edu.get('institution', '')
                 if edu.get('edu_location'): institution_line += f" | {edu['edu_location']}"
-                if institution_line: story.append(Paragraph(institution_line, styles['EduInstitution']))
+                if institution_line: story.append(TextParagraph(institution_line, styles['EduInstitution']))
 
                 # Education Details
                 if edu.get('edu_details'):
-                    story.append(Paragraph(edu['edu_details'], styles['EduDetails'])) # Use specific style if needed
+                    story.append(TextParagraph(edu['edu_details'], styles['EduDetails'])) # Use specific style if needed
                 story.append(Spacer(1, 0.15*inch)) # Space between education entries
         return story
 
@@ -326,8 +340,8 @@ def generate_pdf(data):
 
     # Add Name/Title Block to Right Column (fixed position)
     story_right.append(Spacer(1, 0.1*inch)) # Align with top of green name background
-    if data.get('full_name'): story_right.append(Paragraph(data['full_name'], styles['FullName']))
-    if data.get('title_subtitle'): story_right.append(Paragraph(data['title_subtitle'], styles['JobTitle']))
+    if data.get('full_name'): story_right.append(TextParagraph(data['full_name'], styles['FullName']))
+    if data.get('title_subtitle'): story_right.append(TextParagraph(data['title_subtitle'], styles['JobTitle']))
     story_right.append(Spacer(1, 0.35*inch)) # Space below name block
 
     # Iterate through the desired section order and build stories
@@ -357,7 +371,7 @@ def generate_pdf(data):
 
     # --- Build the PDF Document ---
     try:
-        doc.build(full_story)
+        build_document(doc, full_story, context)
     except Exception as e:
         print(f"Error during doc.build: {e}")
         # Consider raising the exception or returning an error indicator
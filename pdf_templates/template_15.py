@@ -1,12 +1,33 @@
 import io
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import mm
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph, escape_markup
+from .styles import template_stylesheet
 
-def generate_pdf(resume_data):
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 15'
+PREVIEW_IMAGE = 'images/modern_preview.png'
+
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
+    # Define custom styles
+    styles.add(ParagraphStyle(name='Normal', fontName='Helvetica', fontSize=10, leading=12))
+    styles.add(ParagraphStyle(name='Heading1', parent=styles['Heading1'], fontName='Helvetica-Bold', fontSize=16, leading=18, spaceAfter=2 * mm))
+    styles.add(ParagraphStyle(name='Heading2', parent=styles['Heading2'], fontName='Helvetica-Bold', fontSize=14, leading=16, spaceBefore=5 * mm, spaceAfter=1 * mm))
+    styles.add(ParagraphStyle(name='Heading3', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=12, leading=14, spaceBefore=2 * mm))
+    styles.add(ParagraphStyle(name='Detail', parent=styles['Normal'], fontSize=9, textColor=colors.darkgrey))
+    styles.add(ParagraphStyle(name='Bullet', parent=styles['Normal'], leftIndent=5 * mm, bulletText='•'))
+
+
+def generate_pdf(resume_data, context=None):
     """Generates a professional-style PDF resume using ReportLab."""
+    resume_data = normalize_resume(resume_data)
 
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -18,24 +39,16 @@ def generate_pdf(resume_data):
         bottomMargin=15 * mm
     )
 
-    styles = getSampleStyleSheet()
-
-    # Define custom styles
-    styles.add(ParagraphStyle(name='Normal', fontName='Helvetica', fontSize=10, leading=12))
-    styles.add(ParagraphStyle(name='Heading1', parent=styles['Heading1'], fontName='Helvetica-Bold', fontSize=16, leading=18, spaceAfter=2 * mm))
-    styles.add(ParagraphStyle(name='Heading2', parent=styles['Heading2'], fontName='Helvetica-Bold', fontSize=14, leading=16, spaceBefore=5 * mm, spaceAfter=1 * mm))
-    styles.add(ParagraphStyle(name='Heading3', parent=styles['Normal'], fontName='Helvetica-Bold', fontSize=12, leading=14, spaceBefore=2 * mm))
-    styles.add(ParagraphStyle(name='Detail', parent=styles['Normal'], fontSize=9, textColor=colors.darkgrey))
-    styles.add(ParagraphStyle(name='Bullet', parent=styles['Normal'], leftIndent=5 * mm, bulletText='•'))
+    styles = get_styles()
 
     story = []
 
     # Header Section
     header_parts = []
     if resume_data.get('full_name'):
-        header_parts.append(Paragraph(resume_data['full_name'], styles['Heading1']))
+        header_parts.append(TextParagraph(resume_data['full_name'], styles['Heading1']))
     if resume_data.get('title_subtitle'):
-        header_parts.append(Paragraph(resume_data['title_subtitle'], styles['Heading3']))
+        header_parts.append(TextParagraph(resume_data['title_subtitle'], styles['Heading3']))
     if header_parts:
         story.extend(header_parts)
         story.append(Spacer(1, 2 * mm))
@@ -52,7 +65,7 @@ def generate_pdf(resume_data):
         contact_info.append(f"Location: {resume_data['location']}")
 
     if contact_info:
-        story.append(Paragraph(" | ".join(contact_info), styles['Detail']))
+        story.append(TextParagraph(" | ".join(contact_info), styles['Detail']))
         story.append(Spacer(1, 8 * mm))
 
     # Body Sections based on order
@@ -61,52 +74,52 @@ def generate_pdf(resume_data):
     for section in section_order:
         if section == 'summary' and resume_data.get('summary'):
             story.append(Paragraph("Summary", styles['Heading2']))
-            story.append(Paragraph(resume_data['summary'], styles['Normal']))
+            story.append(TextParagraph(resume_data['summary'], styles['Normal']))
             story.append(Spacer(1, 10 * mm))
         elif section == 'experience' and resume_data.get('experiences'):
             story.append(Paragraph("Experience", styles['Heading2']))
             for exp in resume_data['experiences']:
-                title_company = f"{exp['title']}, <font name='Helvetica-Bold'>{exp['company']}</font>"
+                title_company = f"{escape_markup(exp['title'])}, <font name='Helvetica-Bold'>{escape_markup(exp['company'])}</font>"
                 if exp.get('location'):
-                    title_company += f", {exp['location']}"
+                    title_company += f", {escape_markup(exp['location'])}"
                 story.append(Paragraph(title_company, styles['Normal']))
-                date_range = f"<font size='9'>{exp['start_date']} - {exp['end_date'] if not exp.get('is_present') else 'Present'}</font>"
+                date_range = f"<font size='9'>{escape_markup(exp['start_date'])} - {escape_markup(exp['end_date']) if not exp.get('is_present') else 'Present'}</font>"
                 story.append(Paragraph(date_range, styles['Detail']))
                 if exp.get('description'):
-                    for item in exp['description'].split('\n'):
-                        story.append(Paragraph(item.strip(), styles['Bullet']))
+                    for line in exp.description_lines:
+                        story.append(TextParagraph(line.text, styles['Bullet']))
                 story.append(Spacer(1, 5 * mm))
             story.append(Spacer(1, 10 * mm))
         elif section == 'education' and resume_data.get('education_entries'):
             story.append(Paragraph("Education", styles['Heading2']))
             for edu in resume_data['education_entries']:
-                degree_institution = f"{edu['degree']}, <font name='Helvetica-Bold'>{edu['institution']}</font>"
+                degree_institution = f"{escape_markup(edu['degree'])}, <font name='Helvetica-Bold'>{escape_markup(edu['institution'])}</font>"
                 if edu.get('edu_location'):
-                    degree_institution += f", {edu['edu_location']}"
+                    degree_institution += f", {escape_markup(edu['edu_location'])}"
                 story.append(Paragraph(degree_institution, styles['Normal']))
-                date_range = f"<font size='9'>{edu['start_date']} - {edu['end_date'] if not edu.get('is_present') else 'Present'}</font>"
+                date_range = f"<font size='9'>{escape_markup(edu['start_date'])} - {escape_markup(edu['end_date']) if not edu.get('is_present') else 'Present'}</font>"
                 story.append(Paragraph(date_range, styles['Detail']))
                 if edu.get('edu_details'):
-                    story.append(Paragraph(edu['edu_details'], styles['Detail']))
+                    story.append(TextParagraph(edu['edu_details'], styles['Detail']))
                 story.append(Spacer(1, 5 * mm))
             story.append(Spacer(1, 10 * mm))
         elif section == 'achievements' and resume_data.get('key_achievements'):
             story.append(Paragraph("Key Achievements", styles['Heading2']))
             for ach in resume_data['key_achievements']:
                 if ach.get('title'):
-                    story.append(Paragraph(f"<bullet>•</bullet> <font name='Helvetica-Bold'>{ach['title']}</font>", styles['Bullet']))
+                    story.append(Paragraph(f"<bullet>•</bullet> <font name='Helvetica-Bold'>{escape_markup(ach['title'])}</font>", styles['Bullet']))
                     if ach.get('description'):
-                        story.append(Paragraph(ach['description'], styles['Detail'], bulletText=''))
+                        story.append(TextParagraph(ach['description'], styles['Detail'], bulletText=''))
             story.append(Spacer(1, 10 * mm))
         elif section == 'courses' and resume_data.get('courses'):
             story.append(Paragraph("Courses/Certifications", styles['Heading2']))
             for course in resume_data['courses']:
                 if course.get('title'):
-                    story.append(Paragraph(f"<bullet>•</bullet> <font name='Helvetica-Bold'>{course['title']}</font>", styles['Bullet']))
+                    story.append(Paragraph(f"<bullet>•</bullet> <font name='Helvetica-Bold'>{escape_markup(course['title'])}</font>", styles['Bullet']))
                     if course.get('description'):
-                        story.append(Paragraph(course['description'], styles['Detail'], bulletText=''))
+                        story.append(TextParagraph(course['description'], styles['Detail'], bulletText=''))
             story.append(Spacer(1, 10 * mm))
 
-    doc.build(story)
+    build_document(doc, story, context, fit_to_pages=resume_data.get('fit_to_pages'))
     buffer.seek(0)
     return buffer
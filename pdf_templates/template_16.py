@@ -1,18 +1,21 @@
 import io
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, gray
-
-def generate_pdf(data):
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
-                            rightMargin=0.75*inch, leftMargin=0.75*inch,
-                            topMargin=0.75*inch, bottomMargin=0.75*inch)
-
-    styles = getSampleStyleSheet()
-
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 16'
+PREVIEW_IMAGE = 'images/modern_preview.png'
+
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Custom Styles ---
     styles.add(ParagraphStyle(name='NameHeader',
                               fontName='Helvetica-Bold',
@@ -59,11 +62,21 @@ def generate_pdf(data):
                               parent=styles['Normal'],
                               leftIndent=0.25*inch))
 
+
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                            rightMargin=0.75*inch, leftMargin=0.75*inch,
+                            topMargin=0.75*inch, bottomMargin=0.75*inch)
+
+    styles = get_styles()
+
     story = []
 
     # --- Personal Details ---
     if data.get('full_name'):
-        story.append(Paragraph(data['full_name'].upper(), styles['NameHeader']))
+        story.append(TextParagraph(data['full_name'].upper(), styles['NameHeader']))
 
     contact_info = []
     if data.get('email'): contact_info.append(data['email'])
@@ -71,14 +84,14 @@ def generate_pdf(data):
     if data.get('linkedin'): contact_info.append(f"LinkedIn: {data['linkedin']}")
     if data.get('github'): contact_info.append(f"GitHub: {data['github']}")
     if contact_info:
-        story.append(Paragraph(" | ".join(contact_info), styles['ContactHeader']))
+        story.append(TextParagraph(" | ".join(contact_info), styles['ContactHeader']))
 
     story.append(HRFlowable(width="100%", thickness=0.5, color=gray, spaceBefore=0.1*inch, spaceAfter=0.1*inch))
 
     # --- Summary ---
     if data.get('summary'):
         story.append(Paragraph("Summary", styles['SectionTitle']))
-        story.append(Paragraph(data['summary'], styles['Normal']))
+        story.append(TextParagraph(data['summary'], styles['Normal']))
         story.append(Spacer(1, 0.1*inch))
 
     # --- Professional Experience ---
@@ -87,17 +100,15 @@ def generate_pdf(data):
         story.append(Paragraph("Professional Experience", styles['SectionTitle']))
         for exp in experiences:
             if exp.get('title') and exp.get('company'):
-                story.append(Paragraph(exp['title'], styles['JobTitle']))
-                story.append(Paragraph(f"{exp['company']} | {exp.get('dates', 'N/A')}", styles['CompanyDate']))
+                story.append(TextParagraph(exp['title'], styles['JobTitle']))
+                story.append(TextParagraph(f"{exp['company']} | {exp.get('dates', 'N/A')}", styles['CompanyDate']))
                 if exp.get('description'):
                     # Basic handling for bullet points (assuming user types '-' or similar)
-                    desc_lines = exp['description'].split('\n')
-                    for line in desc_lines:
-                        line = line.strip()
-                        if line.startswith(('-', '*', '•')):
-                            story.append(Paragraph(line, styles['BulletPoint'], bulletText=line[0]))
-                        elif line:
-                             story.append(Paragraph(line, styles['NormalIndented']))
+                    for line in exp.description_lines:
+                        if line.marker:
+                            story.append(TextParagraph(line.text, styles['BulletPoint'], bulletText=line.marker))
+                        else:
+                             story.append(TextParagraph(line.text, styles['NormalIndented']))
                 story.append(Spacer(1, 0.15*inch))
 
     # --- Education ---
@@ -106,24 +117,24 @@ def generate_pdf(data):
         story.append(Paragraph("Education", styles['SectionTitle']))
         for edu in education_entries:
             if edu.get('degree') and edu.get('institution'):
-                story.append(Paragraph(edu['degree'], styles['JobTitle']))
-                story.append(Paragraph(f"{edu['institution']} | {edu.get('edu_dates', 'N/A')}", styles['CompanyDate']))
+                story.append(TextParagraph(edu['degree'], styles['JobTitle']))
+                story.append(TextParagraph(f"{edu['institution']} | {edu.get('edu_dates', 'N/A')}", styles['CompanyDate']))
                 if edu.get('edu_details'):
-                    story.append(Paragraph(edu['edu_details'], styles['NormalIndented']))
+                    story.append(TextParagraph(edu['edu_details'], styles['NormalIndented']))
                 story.append(Spacer(1, 0.1*inch))
 
     # --- Skills ---
     if data.get('skills'):
         story.append(Paragraph("Skills", styles['SectionTitle']))
-        story.append(Paragraph(data['skills'], styles['Normal'])) # Assuming comma-separated
+        story.append(TextParagraph(', '.join(data.skill_list), styles['Normal']))
         story.append(Spacer(1, 0.1*inch))
 
     # --- Hobbies ---
     if data.get('hobbies'):
         story.append(Paragraph("Hobbies", styles['SectionTitle']))
-        story.append(Paragraph(data['hobbies'], styles['Normal']))
+        story.append(TextParagraph(', '.join(data.hobby_list), styles['Normal']))
         story.append(Spacer(1, 0.1*inch))
 
-    doc.build(story)
+    build_document(doc, story, context, fit_to_pages=data.get('fit_to_pages'))
     buffer.seek(0)
     return buffer
@@ -2,13 +2,22 @@ import io
 import os # Import os for path handling
 
 from reportlab.lib.pagesizes import letter
-from reportlab.platypus import Paragraph, Spacer, HRFlowable, KeepTogether, Image, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import Paragraph, Spacer, HRFlowable, KeepTogether, Table, TableStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, gray, black, white
 from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER
 from reportlab.platypus.frames import Frame
 from reportlab.platypus import BaseDocTemplate, PageTemplate
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .assets import AssetImage, load_image_asset
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 2'
+PREVIEW_IMAGE = 'images/modern_preview.png'
 
 class TwoColumnDocument(BaseDocTemplate):
     """
@@ -50,10 +59,8 @@ class TwoColumnDocument(BaseDocTemplate):
             [PageTemplate(id='TwoColumn', frames=[frame1, frame2])]
         )
 
-# Define a mapping for section icons
-# IMPORTANT: Ensure these image files exist at the specified relative paths
-# For example, if your script is in 'my_project/' and icons are in 'my_project/static/images/template_02/',
-# this path will work.
+# Section icons, resolved against the project root (see assets.py).
+# Sections whose icon file is missing get a plain title.
 BASE_ICON_PATH = 'static/images/template_02/'
 SECTION_ICONS = {
     'personal': os.path.join(BASE_ICON_PATH, 'personal.png'),
@@ -69,13 +76,28 @@ SECTION_ICONS = {
     'references': os.path.join(BASE_ICON_PATH, 'references.png'),
     'projects': os.path.join(BASE_ICON_PATH, 'projects.png'),
 }
+ICON_SIZE = 0.18*inch
 
-def generate_pdf(data):
-    """Generates a two-column resume PDF using ReportLab from the given data."""
-    buffer = io.BytesIO()
-    doc = TwoColumnDocument(buffer) # Use the custom two-column document template
-    styles = getSampleStyleSheet()
 
+def section_title(title, styles, section_key_for_icon, paragraph_class=TextParagraph):
+    """Section title with its icon, or just the title if the icon is not available."""
+    icon = load_image_asset(SECTION_ICONS.get(section_key_for_icon))
+    if icon is None:
+        return paragraph_class(title, styles['SectionTitle'])
+    return Table([[
+        AssetImage(icon, width=ICON_SIZE, height=ICON_SIZE),
+        paragraph_class(title, styles['SectionTitle'])
+    ]], colWidths=[0.25*inch, None], hAlign='LEFT', style=TableStyle([
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (0,0), 0),
+        ('RIGHTPADDING', (0,0), (0,0), 0.1*inch),
+        ('TOPPADDING', (0,0), (-1,-1), 0),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 0),
+    ]))
+
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Custom Styles ---
     # Adjusted MainTitle for "CURRÍCULO VITAE"
     styles.add(ParagraphStyle(name='MainTitle', fontName='Helvetica-Bold', fontSize=26, leading=30, alignment=TA_LEFT, spaceAfter=0.2 * inch))
@@ -101,6 +123,14 @@ def generate_pdf(data):
     styles.add(ParagraphStyle(name='NormalJustified', parent=styles['Normal'], alignment=TA_JUSTIFY, splitLongWords=True,))
     styles.add(ParagraphStyle(name='PersonalDetails', parent=styles['Normal'], alignment=TA_LEFT, spaceAfter=0.04 * inch, splitLongWords=True,))
 
+
+def generate_pdf(data, context=None):
+    """Generates a two-column resume PDF using ReportLab from the given data."""
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    doc = TwoColumnDocument(buffer) # Use the custom two-column document template
+    styles = get_styles()
+
     story = [] # This list will hold all the flowables for the PDF
 
     # --- Main Title ---
@@ -110,22 +140,11 @@ def generate_pdf(data):
     personal_details_elements = [] # Collect elements for KeepTogether
     
     # Section title with icon
-    personal_details_elements.append(
-        Table([[
-            Image(SECTION_ICONS.get('personal', ''), width=0.18*inch, height=0.18*inch),
-            Paragraph("Detalhes Pessoais", styles['SectionTitle'])
-        ]], colWidths=[0.25*inch, None], hAlign='LEFT', style=TableStyle([
-            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-            ('LEFTPADDING', (0,0), (0,0), 0),
-            ('RIGHTPADDING', (0,0), (0,0), 0.1*inch),
-            ('TOPPADDING', (0,0), (-1,-1), 0),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-        ]))
-    )
+    personal_details_elements.append(section_title("Detalhes Pessoais", styles, 'personal', Paragraph))
 
     if data.get('full_name'):
         # Name with greenish background box
-        personal_details_elements.append(Paragraph(data['full_name'].upper(), styles['NameBoxParagraph']))
+        personal_details_elements.append(TextParagraph(data['full_name'].upper(), styles['NameBoxParagraph']))
         
     contact_info_parts = []
     if data.get('email'): contact_info_parts.append(f"Email: {data['email']}")
@@ -136,7 +155,7 @@ def generate_pdf(data):
     if data.get('address'): contact_info_parts.append(f"Endereço: {data['address']}")
 
     if contact_info_parts:
-        personal_details_elements.append(Paragraph(" | ".join(contact_info_parts), styles['ContactHeader']))
+        personal_details_elements.append(TextParagraph(" | ".join(contact_info_parts), styles['ContactHeader']))
 
     additional_personal_details = []
     if data.get('birth_date'): additional_personal_details.append(f"Data de Nascimento: {data['birth_date']}")
@@ -150,7 +169,7 @@ def generate_pdf(data):
 
     if additional_personal_details:
         for detail in additional_personal_details:
-            personal_details_elements.append(Paragraph(detail, styles['PersonalDetails']))
+            personal_details_elements.append(TextParagraph(detail, styles['PersonalDetails']))
 
     personal_details_elements.append(Spacer(1, 0.1 * inch))
     personal_details_elements.append(HRFlowable(width="100%", thickness=0.5, color=gray, spaceBefore=0.1 * inch, spaceAfter=0.1 * inch))
@@ -161,32 +180,18 @@ def generate_pdf(data):
     # --- Section Ordering ---
     section_order = data.get('section_order', ['summary', 'experience', 'education', 'achievements', 'courses', 'skills', 'hobbies', 'languages', 'additional_info', 'references', 'projects'])
 
-    # Add content for all sections to the single 'story' list
-    for section_key in section_order:
-        # Create a helper function to add section title with icon
+    def build_section(section_key):
+        """Flowables for one section."""
+        story = []
+
         def add_section_title(title_text, section_key_for_icon):
-            icon_path = SECTION_ICONS.get(section_key_for_icon, '')
-            # Check if icon file exists to avoid errors and fallback if not
-            if icon_path and os.path.exists(icon_path):
-                return Table([[
-                    Image(icon_path, width=0.18*inch, height=0.18*inch),
-                    Paragraph(title_text, styles['SectionTitle'])
-                ]], colWidths=[0.25*inch, None], hAlign='LEFT', style=TableStyle([
-                    ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                    ('LEFTPADDING', (0,0), (0,0), 0),
-                    ('RIGHTPADDING', (0,0), (0,0), 0.1*inch),
-                    ('TOPPADDING', (0,0), (-1,-1), 0),
-                    ('BOTTOMPADDING', (0,0), (-1,-1), 0),
-                ]))
-            else:
-                # Fallback to just the paragraph if icon not found
-                return Paragraph(title_text, styles['SectionTitle'])
+            return section_title(title_text, styles, section_key_for_icon)
 
 
         if section_key == 'summary':
             if data.get('summary'):
                 story.append(add_section_title("Resumo", 'summary'))
-                story.append(Paragraph(data['summary'], styles['NormalJustified']))
+                story.append(TextParagraph(data['summary'], styles['NormalJustified']))
                 story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'experience':
@@ -196,7 +201,7 @@ def generate_pdf(data):
                 for exp in experiences:
                     exp_block = [] # Elements for a single experience entry
                     if exp.get('title') and exp.get('company'):
-                        exp_block.append(Paragraph(exp['title'], styles['JobTitle']))
+                        exp_block.append(TextParagraph(exp['title'], styles['JobTitle']))
                         company_date_str = f"{exp['company']}"
                         if exp.get('start_date'):
                             company_date_str += f" | {exp.get('start_date')}"
@@ -206,15 +211,13 @@ def generate_pdf(data):
                             if exp.get("is_present"):
                                 company_date_str += " - Presente"
 
-                        exp_block.append(Paragraph(company_date_str, styles['CompanyDate']))
+                        exp_block.append(TextParagraph(company_date_str, styles['CompanyDate']))
                         if exp.get('description'):
-                            desc_lines = exp['description'].split('\n')
-                            for line in desc_lines:
-                                line = line.strip()
-                                if line.startswith(('-', '*', '•')):
-                                    exp_block.append(Paragraph(line, styles['BulletPoint'], bulletText=line[0]))
-                                elif line:
-                                    exp_block.append(Paragraph(line, styles['NormalIndented']))
+                            for line in exp.description_lines:
+                                if line.marker:
+                                    exp_block.append(TextParagraph(line.text, styles['BulletPoint'], bulletText=line.marker))
+                                else:
+                                    exp_block.append(TextParagraph(line.text, styles['NormalIndented']))
                         exp_block.append(Spacer(1, 0.15 * inch))
                     story.append(KeepTogether(exp_block)) # Keep each experience block together
 
@@ -225,7 +228,7 @@ def generate_pdf(data):
                 for edu in education_entries:
                     edu_block = [] # Elements for a single education entry
                     if edu.get('degree') and edu.get('institution'):
-                        edu_block.append(Paragraph(edu['degree'], styles['JobTitle']))
+                        edu_block.append(TextParagraph(edu['degree'], styles['JobTitle']))
                         edu_dates_str = f"{edu['institution']}"
                         if edu.get('start_date'):
                             edu_dates_str += f" | {edu.get('start_date')}"
@@ -234,10 +237,10 @@ def generate_pdf(data):
                         else:
                             if edu.get("is_present"):
                                 edu_dates_str += " - Presente" 
-                        edu_block.append(Paragraph(edu_dates_str, styles['CompanyDate']))
+                        edu_block.append(TextParagraph(edu_dates_str, styles['CompanyDate']))
 
                         if edu.get('edu_details'):
-                            edu_block.append(Paragraph(edu['edu_details'], styles['NormalIndented']))
+                            edu_block.append(TextParagraph(edu['edu_details'], styles['NormalIndented']))
                         edu_block.append(Spacer(1, 0.1 * inch))
                     story.append(KeepTogether(edu_block)) # Keep each education entry together
 
@@ -248,9 +251,9 @@ def generate_pdf(data):
                 for achievement in key_achievements:
                     achievement_block = [] # Elements for a single achievement entry
                     if achievement.get('title'):
-                        achievement_block.append(Paragraph(achievement['title'], styles['JobTitle']))
+                        achievement_block.append(TextParagraph(achievement['title'], styles['JobTitle']))
                         if achievement.get('description'):
-                            achievement_block.append(Paragraph(achievement['description'], styles['NormalIndented']))
+                            achievement_block.append(TextParagraph(achievement['description'], styles['NormalIndented']))
                         achievement_block.append(Spacer(1, 0.1 * inch))
                     story.append(KeepTogether(achievement_block)) # Keep each achievement together
 
@@ -261,22 +264,22 @@ def generate_pdf(data):
                 for course in courses:
                     course_block = [] # Elements for a single course entry
                     if course.get('title'):
-                        course_block.append(Paragraph(course['title'], styles['JobTitle']))
+                        course_block.append(TextParagraph(course['title'], styles['JobTitle']))
                         if course.get('description'):
-                            course_block.append(Paragraph(course['description'], styles['NormalIndented']))
+                            course_block.append(TextParagraph(course['description'], styles['NormalIndented']))
                         course_block.append(Spacer(1, 0.1 * inch))
                     story.append(KeepTogether(course_block)) # Keep each course entry together
 
         elif section_key == 'skills':
             if data.get('skills'):
                 story.append(add_section_title("Habilidades", 'skills'))
-                story.append(Paragraph(data['skills'], styles['NormalJustified']))
+                story.append(TextParagraph(', '.join(data.skill_list), styles['NormalJustified']))
                 story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'hobbies':
             if data.get('hobbies'):
                 story.append(add_section_title("Hobbies", 'hobbies'))
-                story.append(Paragraph(data['hobbies'], styles['NormalJustified']))
+                story.append(TextParagraph(', '.join(data.hobby_list), styles['NormalJustified']))
                 story.append(Spacer(1, 0.1 * inch))
 
         elif section_key == 'languages':
@@ -312,9 +315,9 @@ def generate_pdf(data):
                 for info in additional_info:
                     info_block = []
                     if info.get('title'):
-                        info_block.append(Paragraph(info['title'], styles['JobTitle']))
+                        info_block.append(TextParagraph(info['title'], styles['JobTitle']))
                         if info.get('description'):
-                            info_block.append(Paragraph(info['description'], styles['NormalIndented']))
+                            info_block.append(TextParagraph(info['description'], styles['NormalIndented']))
                         info_block.append(Spacer(1, 0.1 * inch))
                     story.append(KeepTogether(info_block))
 
@@ -325,12 +328,12 @@ def generate_pdf(data):
                 for ref in references:
                     ref_block = []
                     if ref.get('name'):
-                        ref_block.append(Paragraph(ref['name'], styles['JobTitle']))
-                        ref_block.append(Paragraph(f"{ref.get('title', 'N/A')}", styles['CompanyDate']))
+                        ref_block.append(TextParagraph(ref['name'], styles['JobTitle']))
+                        ref_block.append(TextParagraph(f"{ref.get('title', 'N/A')}", styles['CompanyDate']))
                         if ref.get('phone'):
-                            ref_block.append(Paragraph(f"Telefone: {ref['phone']}", styles['NormalIndented']))
+                            ref_block.append(TextParagraph(f"Telefone: {ref['phone']}", styles['NormalIndented']))
                         if ref.get('description'):
-                            ref_block.append(Paragraph(ref['description'], styles['NormalIndented']))
+                            ref_block.append(TextParagraph(ref['description'], styles['NormalIndented']))
                         ref_block.append(Spacer(1, 0.1 * inch))
                     story.append(KeepTogether(ref_block))
 
@@ -341,15 +344,20 @@ def generate_pdf(data):
                 for project in projects:
                     project_block = []
                     if project.get('title'):
-                        project_block.append(Paragraph(project['title'], styles['JobTitle']))
+                        project_block.append(TextParagraph(project['title'], styles['JobTitle']))
                         if project.get('description'):
-                            project_block.append(Paragraph(project['description'], styles['NormalIndented']))
+                            project_block.append(TextParagraph(project['description'], styles['NormalIndented']))
                         if project.get('dates'):
-                            project_block.append(Paragraph(f"Datas: {project['dates']}", styles['CompanyDate']))
+                            project_block.append(TextParagraph(f"Datas: {project['dates']}", styles['CompanyDate']))
                         project_block.append(Spacer(1, 0.1 * inch))
                     story.append(KeepTogether(project_block))
+        return story
+
+    # Add content for all sections to the single 'story' list
+    for section_key in section_order:
+        story.extend(build_section(section_key))
 
     # Build the PDF document with the generated story
-    doc.build(story)
+    build_document(doc, story, context)
     buffer.seek(0)
     return buffer
\ No newline at end of file
@@ -1,10 +1,18 @@
 import io
 from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, FrameBreak, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white, gray
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.pagesizes import letter
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 3'
+PREVIEW_IMAGE = 'images/modern_preview.png'
 
 # Color palette matching the template image
 COLOR_SIDEBAR_BG = HexColor('#2C5282')  # Dark blue sidebar
@@ -61,17 +69,9 @@ class ModernTwoColumnDocTemplate(BaseDocTemplate):
         
         canvas.restoreState()
 
-def generate_pdf(data):
-    buffer = io.BytesIO()
-    
-    doc = ModernTwoColumnDocTemplate(
-        buffer, pagesize=letter,
-        leftMargin=0, rightMargin=0.5*inch,
-        topMargin=0.5*inch, bottomMargin=0.5*inch
-    )
-    
-    styles = getSampleStyleSheet()
-    
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # Define custom styles for sidebar
     styles.add(ParagraphStyle(
         name='SidebarName',
@@ -197,13 +197,26 @@ def generate_pdf(data):
         spaceAfter=0.03*inch,
         alignment=TA_LEFT
     ))
+
+
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    
+    doc = ModernTwoColumnDocTemplate(
+        buffer, pagesize=letter,
+        leftMargin=0, rightMargin=0.5*inch,
+        topMargin=0.5*inch, bottomMargin=0.5*inch
+    )
+    
+    styles = get_styles()
     
     # Build sidebar content
     sidebar_story = []
     
     # Name
     if data.get('full_name'):
-        sidebar_story.append(Paragraph(data['full_name'].upper(), styles['SidebarName']))
+        sidebar_story.append(TextParagraph(data['full_name'].upper(), styles['SidebarName']))
     
     # Key Achievements
     key_achievements = data.get('key_achievements', [])
@@ -211,9 +224,9 @@ def generate_pdf(data):
         sidebar_story.append(Paragraph("KEY ACHIEVEMENTS", styles['SidebarSectionTitle']))
         for achievement in key_achievements:
             if achievement.get('title'):
-                sidebar_story.append(Paragraph(f"🔧 {achievement['title']}", styles['SidebarText']))
+                sidebar_story.append(TextParagraph(f"🔧 {achievement['title']}", styles['SidebarText']))
                 if achievement.get('description'):
-                    sidebar_story.append(Paragraph(achievement['description'], styles['SidebarText']))
+                    sidebar_story.append(TextParagraph(achievement['description'], styles['SidebarText']))
                 sidebar_story.append(Spacer(1, 0.1*inch))
     
     # Certification/Courses
@@ -222,18 +235,18 @@ def generate_pdf(data):
         sidebar_story.append(Paragraph("CERTIFICATION", styles['SidebarSectionTitle']))
         for course in courses:
             if course.get('title'):
-                sidebar_story.append(Paragraph(course['title'], styles['SidebarText']))
+                sidebar_story.append(TextParagraph(course['title'], styles['SidebarText']))
                 if course.get('description'):
-                    sidebar_story.append(Paragraph(course['description'], styles['SidebarText']))
+                    sidebar_story.append(TextParagraph(course['description'], styles['SidebarText']))
                 sidebar_story.append(Spacer(1, 0.05*inch))
     
     # Skills
     if data.get('skills'):
         sidebar_story.append(Paragraph("SKILLS", styles['SidebarSectionTitle']))
-        skills_list = [skill.strip() for skill in data['skills'].split(',')]
+        skills_list = data.skill_list
         for skill in skills_list[:10]:  # Limit to first 10 skills
             if skill:
-                sidebar_story.append(Paragraph(f"• {skill}", styles['SidebarBullet']))
+                sidebar_story.append(TextParagraph(f"• {skill}", styles['SidebarBullet']))
     
     # Languages
     languages = data.get('languages', [])
@@ -242,22 +255,22 @@ def generate_pdf(data):
         for lang in languages:
             if lang.get('name'):
                 level = lang.get('level', 'Conversational')
-                sidebar_story.append(Paragraph(f"{lang['name']}: {level}", styles['SidebarText']))
+                sidebar_story.append(TextParagraph(f"{lang['name']}: {level}", styles['SidebarText']))
     
     # Hobbies/Passions
     if data.get('hobbies'):
         sidebar_story.append(Paragraph("PASSIONS", styles['SidebarSectionTitle']))
-        hobbies_list = [hobby.strip() for hobby in data['hobbies'].split(',')]
+        hobbies_list = data.hobby_list
         for hobby in hobbies_list[:5]:  # Limit to first 5 hobbies
             if hobby:
-                sidebar_story.append(Paragraph(f"🌟 {hobby}", styles['SidebarText']))
+                sidebar_story.append(TextParagraph(f"🌟 {hobby}", styles['SidebarText']))
     
     # Build main content
     main_story = []
     
     # Title and contact info
     if data.get('title_subtitle'):
-        main_story.append(Paragraph(data['title_subtitle'], styles['MainTitle']))
+        main_story.append(TextParagraph(data['title_subtitle'], styles['MainTitle']))
     
     # Contact information
     contact_info = []
@@ -266,12 +279,12 @@ def generate_pdf(data):
     if data.get('location'): contact_info.append(f"📍 {data['location']}")
     
     if contact_info:
-        main_story.append(Paragraph(" | ".join(contact_info), styles['ContactInfo']))
+        main_story.append(TextParagraph(" | ".join(contact_info), styles['ContactInfo']))
     
     # Summary
     if data.get('summary'):
         main_story.append(Paragraph("SUMMARY", styles['MainSectionTitle']))
-        main_story.append(Paragraph(data['summary'], styles['MainText']))
+        main_story.append(TextParagraph(data['summary'], styles['MainText']))
         main_story.append(Spacer(1, 0.1*inch))
     
     # Experience
@@ -280,7 +293,7 @@ def generate_pdf(data):
         main_story.append(Paragraph("EXPERIENCE", styles['MainSectionTitle']))
         for exp in experiences:
             if exp.get('title') and exp.get('company'):
-                main_story.append(Paragraph(exp['title'], styles['JobTitle']))
+                main_story.append(TextParagraph(exp['title'], styles['JobTitle']))
                 
                 # Company and dates
                 company_info = exp['company']
@@ -298,17 +311,15 @@ def generate_pdf(data):
                 if date_range:
                     company_info += f" | {date_range}"
                 
-                main_story.append(Paragraph(company_info, styles['CompanyDate']))
+                main_story.append(TextParagraph(company_info, styles['CompanyDate']))
                 
                 # Description
                 if exp.get('description'):
-                    desc_lines = exp['description'].split('\n')
-                    for line in desc_lines:
-                        line = line.strip()
-                        if line.startswith(('-', '*', '•')):
-                            main_story.append(Paragraph(f"• {line[1:].strip()}", styles['MainBullet']))
-                        elif line:
-                            main_story.append(Paragraph(line, styles['MainText']))
+                    for line in exp.description_lines:
+                        if line.marker:
+                            main_story.append(TextParagraph(f"• {line.content}", styles['MainBullet']))
+                        else:
+                            main_story.append(TextParagraph(line.text, styles['MainText']))
                 
                 main_story.append(Spacer(1, 0.15*inch))
     
@@ -318,7 +329,7 @@ def generate_pdf(data):
         main_story.append(Paragraph("EDUCATION", styles['MainSectionTitle']))
         for edu in education_entries:
             if edu.get('degree') and edu.get('institution'):
-                main_story.append(Paragraph(edu['degree'], styles['JobTitle']))
+                main_story.append(TextParagraph(edu['degree'], styles['JobTitle']))
                 
                 # Institution and dates
                 edu_info = edu['institution']
@@ -336,10 +347,10 @@ def generate_pdf(data):
                 if date_range:
                     edu_info += f" | {date_range}"
                 
-                main_story.append(Paragraph(edu_info, styles['CompanyDate']))
+                main_story.append(TextParagraph(edu_info, styles['CompanyDate']))
                 
                 if edu.get('edu_details'):
-                    main_story.append(Paragraph(edu['edu_details'], styles['MainText']))
+                    main_story.append(TextParagraph(edu['edu_details'], styles['MainText']))
                 
                 main_story.append(Spacer(1, 0.1*inch))
     
@@ -350,6 +361,6 @@ def generate_pdf(data):
     full_story.extend(main_story)
     
     # Build the document
-    doc.build(full_story)
+    build_document(doc, full_story, context)
     buffer.seek(0)
     return buffer
\ No newline at end of file
@@ -1,19 +1,22 @@
 import io
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, gray, white
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .styles import template_stylesheet
 
-def generate_pdf(data):
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter,
-                            rightMargin=0.75*inch, leftMargin=0.75*inch,
-                            topMargin=0.75*inch, bottomMargin=0.75*inch)
-
-    styles = getSampleStyleSheet()
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 5 (Professional)'
+PREVIEW_IMAGE = 'images/professional_preview.png'
 
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Custom Styles ---
     styles.add(ParagraphStyle(name='NameHeader',
                               fontName='Helvetica-Bold',
@@ -87,14 +90,24 @@ def generate_pdf(data):
                               textColor=HexColor('#7F8C8D'),
                               spaceAfter=0.1*inch))
 
+
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter,
+                            rightMargin=0.75*inch, leftMargin=0.75*inch,
+                            topMargin=0.75*inch, bottomMargin=0.75*inch)
+
+    styles = get_styles()
+
     story = []
 
     # --- Header Section ---
     if data.get('full_name'):
-        story.append(Paragraph(data['full_name'].upper(), styles['NameHeader']))
+        story.append(TextParagraph(data['full_name'].upper(), styles['NameHeader']))
 
     if data.get('title_subtitle'):
-        story.append(Paragraph(data['title_subtitle'], styles['TitleHeader']))
+        story.append(TextParagraph(data['title_subtitle'], styles['TitleHeader']))
 
     # Contact information
     contact_info = []
@@ -104,7 +117,7 @@ def generate_pdf(data):
     if data.get('location'): contact_info.append(f"📍 {data['location']}")
     
     if contact_info:
-        story.append(Paragraph(" | ".join(contact_info), styles['ContactHeader']))
+        story.append(TextParagraph(" | ".join(contact_info), styles['ContactHeader']))
 
     story.append(HRFlowable(width="100%", thickness=1, color=HexColor('#2980B9'), 
                            spaceBefore=0.1*inch, spaceAfter=0.2*inch))
@@ -117,7 +130,7 @@ def generate_pdf(data):
         if section_key == 'summary':
             if data.get('summary'):
                 story.append(Paragraph("SUMMARY", styles['SectionTitle']))
-                story.append(Paragraph(data['summary'], styles['NormalJustified']))
+                story.append(TextParagraph(data['summary'], styles['NormalJustified']))
                 story.append(Spacer(1, 0.1*inch))
 
         elif section_key == 'experience':
@@ -126,7 +139,7 @@ def generate_pdf(data):
                 story.append(Paragraph("EXPERIENCE", styles['SectionTitle']))
                 for exp in experiences:
                     if exp.get('title') and exp.get('company'):
-                        story.append(Paragraph(exp['title'], styles['JobTitle']))
+                        story.append(TextParagraph(exp['title'], styles['JobTitle']))
                         
                         # Build company/date line
                         company_line = exp['company']
@@ -141,16 +154,14 @@ def generate_pdf(data):
                             elif exp.get('is_present'):
                                 company_line += " - Present"
                         
-                        story.append(Paragraph(company_line, styles['CompanyDate']))
+                        story.append(TextParagraph(company_line, styles['CompanyDate']))
                         
                         if exp.get('description'):
-                            desc_lines = exp['description'].split('\n')
-                            for line in desc_lines:
-                                line = line.strip()
-                                if line.startswith(('-', '*', '•')):
-                                    story.append(Paragraph(f"• {line[1:].strip()}", styles['BulletPoint']))
-                                elif line:
-                                    story.append(Paragraph(line, styles['NormalIndented']))
+                            for line in exp.description_lines:
+                                if line.marker:
+                                    story.append(TextParagraph(f"• {line.content}", styles['BulletPoint']))
+                                else:
+                                    story.append(TextParagraph(line.text, styles['NormalIndented']))
                         story.append(Spacer(1, 0.15*inch))
 
         elif section_key == 'education':
@@ -159,7 +170,7 @@ def generate_pdf(data):
                 story.append(Paragraph("EDUCATION", styles['SectionTitle']))
                 for edu in education_entries:
                     if edu.get('degree') and edu.get('institution'):
-                        story.append(Paragraph(edu['degree'], styles['JobTitle']))
+                        story.append(TextParagraph(edu['degree'], styles['JobTitle']))
                         
                         # Build institution/date line
                         edu_line = edu['institution']
@@ -174,10 +185,10 @@ def generate_pdf(data):
                             elif edu.get('is_present'):
                                 edu_line += " - Present"
                         
-                        story.append(Paragraph(edu_line, styles['CompanyDate']))
+                        story.append(TextParagraph(edu_line, styles['CompanyDate']))
                         
                         if edu.get('edu_details'):
-                            story.append(Paragraph(edu['edu_details'], styles['NormalIndented']))
+                            story.append(TextParagraph(edu['edu_details'], styles['NormalIndented']))
                         story.append(Spacer(1, 0.1*inch))
 
         elif section_key == 'achievements':
@@ -186,9 +197,9 @@ def generate_pdf(data):
                 story.append(Paragraph("KEY ACHIEVEMENTS", styles['SectionTitle']))
                 for achievement in key_achievements:
                     if achievement.get('title'):
-                        story.append(Paragraph(f"🏆 {achievement['title']}", styles['AchievementTitle']))
+                        story.append(TextParagraph(f"🏆 {achievement['title']}", styles['AchievementTitle']))
                         if achievement.get('description'):
-                            story.append(Paragraph(achievement['description'], styles['AchievementDesc']))
+                            story.append(TextParagraph(achievement['description'], styles['AchievementDesc']))
 
         elif section_key == 'courses':
             courses = data.get('courses', [])
@@ -196,16 +207,16 @@ def generate_pdf(data):
                 story.append(Paragraph("COURSES", styles['SectionTitle']))
                 for course in courses:
                     if course.get('title'):
-                        story.append(Paragraph(course['title'], styles['AchievementTitle']))
+                        story.append(TextParagraph(course['title'], styles['AchievementTitle']))
                         if course.get('description'):
-                            story.append(Paragraph(course['description'], styles['AchievementDesc']))
+                            story.append(TextParagraph(course['description'], styles['AchievementDesc']))
 
         elif section_key == 'skills':
             if data.get('skills'):
                 story.append(Paragraph("SKILLS", styles['SectionTitle']))
                 
                 # Create a simple table for skills
-                skills_list = [skill.strip() for skill in data['skills'].split(',')]
+                skills_list = data.skill_list
                 skills_table_data = []
                 row = []
                 
@@ -237,10 +248,10 @@ def generate_pdf(data):
         elif section_key == 'hobbies':
             if data.get('hobbies'):
                 story.append(Paragraph("PASSIONS", styles['SectionTitle']))
-                hobbies_list = [hobby.strip() for hobby in data['hobbies'].split(',')]
+                hobbies_list = data.hobby_list
                 for hobby in hobbies_list:
                     if hobby:
-                        story.append(Paragraph(f"⭐ {hobby}", styles['AchievementDesc']))
+                        story.append(TextParagraph(f"⭐ {hobby}", styles['AchievementDesc']))
                 story.append(Spacer(1, 0.1*inch))
 
         elif section_key == 'languages':
@@ -250,9 +261,9 @@ def generate_pdf(data):
                 for lang in languages:
                     if lang.get('name'):
                         level = lang.get('level', 'Conversational')
-                        story.append(Paragraph(f"{lang['name']}: {level}", styles['AchievementDesc']))
+                        story.append(TextParagraph(f"{lang['name']}: {level}", styles['AchievementDesc']))
                 story.append(Spacer(1, 0.1*inch))
 
-    doc.build(story)
+    build_document(doc, story, context, fit_to_pages=data.get('fit_to_pages'))
     buffer.seek(0)
     return buffer
\ No newline at end of file
@@ -1,12 +1,22 @@
 import io
 import os
 from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Image, FrameBreak, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white, grey
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.utils import ImageReader
+from .images import profile_image_reader
+from .page_forms import page_form
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 6 (With Photo)'
+PREVIEW_IMAGE = 'images/modern_preview.png'
 
 # --- Color Palette matching Ellen Johnson template ---
 COLOR_TEXT_MAIN = HexColor('#333333')
@@ -21,6 +31,8 @@ class PhotoResumeDocTemplate(BaseDocTemplate):
         self.profile_image_path = kwargs.pop('profile_image_path', None)
         self.full_name = kwargs.pop('full_name', '')
         BaseDocTemplate.__init__(self, filename, **kwargs)
+        # Downscaled once and reused on every page instead of embedding the original photo
+        self.profile_image = profile_image_reader(self.profile_image_path)
 
         # Single page layout with photo in top-right
         frame_main = Frame(self.leftMargin, self.bottomMargin,
@@ -31,12 +43,13 @@ class PhotoResumeDocTemplate(BaseDocTemplate):
                                 onPage=self.draw_page_elements)
         self.addPageTemplates([main_page])
 
+    @page_form
     def draw_page_elements(self, canvas, doc):
         """Draw the profile image and any background elements"""
         canvas.saveState()
         
         # Profile Image (Top Right corner)
-        if self.profile_image_path and os.path.exists(self.profile_image_path):
+        if self.profile_image:
             try:
                 # Image dimensions and position
                 img_size = 1.4 * inch
@@ -61,7 +74,7 @@ class PhotoResumeDocTemplate(BaseDocTemplate):
                 canvas.clipPath(path, stroke=0, fill=0)
                 
                 # Draw the image
-                canvas.drawImage(self.profile_image_path, img_x, img_y, 
+                canvas.drawImage(self.profile_image, img_x, img_y, 
                                width=img_size, height=img_size, mask='auto')
                 
                 print(f"Successfully drew profile image at ({img_x}, {img_y})")
@@ -78,25 +91,9 @@ class PhotoResumeDocTemplate(BaseDocTemplate):
         canvas.restoreState()
 
 
-def generate_pdf(data):
-    buffer = io.BytesIO()
-    
-    # Get profile image path from data
-    profile_image_path = data.get('profile_image_path')
-    
-    # Debug: Print image path info
-    print(f"Profile image path: {profile_image_path}")
-    if profile_image_path:
-        print(f"Image exists: {os.path.exists(profile_image_path)}")
-    
-    doc = PhotoResumeDocTemplate(buffer, pagesize=letter,
-                                leftMargin=0.75*inch, rightMargin=0.75*inch,
-                                topMargin=0.75*inch, bottomMargin=0.75*inch,
-                                profile_image_path=profile_image_path,
-                                full_name=data.get('full_name', ''))
-
-    styles = getSampleStyleSheet()
-    
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Define Styles matching Ellen Johnson template ---
     styles.add(ParagraphStyle(name='FullName', fontName='Helvetica-Bold', fontSize=32, 
                               textColor=COLOR_TEXT_HEADER, spaceBefore=0, leading=36, 
@@ -124,6 +121,27 @@ def generate_pdf(data):
     styles.add(ParagraphStyle(name='AchievementDesc', fontName='Helvetica', fontSize=9, 
                               textColor=COLOR_TEXT_MUTED, leading=11, spaceAfter=0.1*inch))
 
+
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    
+    # Get profile image path from data
+    profile_image_path = data.get('profile_image_path')
+    
+    # Debug: Print image path info
+    print(f"Profile image path: {profile_image_path}")
+    if profile_image_path:
+        print(f"Image exists: {os.path.exists(profile_image_path)}")
+    
+    doc = PhotoResumeDocTemplate(buffer, pagesize=letter,
+                                leftMargin=0.75*inch, rightMargin=0.75*inch,
+                                topMargin=0.75*inch, bottomMargin=0.75*inch,
+                                profile_image_path=profile_image_path,
+                                full_name=data.get('full_name', ''))
+
+    styles = get_styles()
+
     # --- Build the story ---
     story = []
     
@@ -133,9 +151,9 @@ def generate_pdf(data):
     # Left side: Name, title, contact info
     header_left_content = []
     if data.get('full_name'):
-        header_left_content.append(Paragraph(data['full_name'].upper(), styles['FullName']))
+        header_left_content.append(TextParagraph(data['full_name'].upper(), styles['FullName']))
     if data.get('title_subtitle'):
-        header_left_content.append(Paragraph(data['title_subtitle'], styles['JobTitleHeader']))
+        header_left_content.append(TextParagraph(data['title_subtitle'], styles['JobTitleHeader']))
     
     # Contact information
     contact_items = []
@@ -143,7 +161,7 @@ def generate_pdf(data):
     if data.get('linkedin'): contact_items.append(f"🔗 {data['linkedin']}")
     if data.get('location'): contact_items.append(f"📍 {data['location']}")
     if contact_items:
-        header_left_content.append(Paragraph("  ".join(contact_items), styles['ContactInfo']))
+        header_left_content.append(TextParagraph("  ".join(contact_items), styles['ContactInfo']))
     
     # Right side: Space for photo (handled by canvas drawing)
     header_right_content = [Spacer(1, 1.6*inch)]  # Space for photo
@@ -170,7 +188,7 @@ def generate_pdf(data):
         if section_key == 'summary':
             if data.get('summary'):
                 story.append(Paragraph('SUMMARY', styles['SectionTitle']))
-                story.append(Paragraph(data['summary'], styles['BodyText']))
+                story.append(TextParagraph(data['summary'], styles['BodyText']))
                 story.append(Spacer(1, 0.1*inch))
 
         elif section_key == 'experience':
@@ -179,7 +197,7 @@ def generate_pdf(data):
                 story.append(Paragraph('EXPERIENCE', styles['SectionTitle']))
                 for exp in experiences:
                     if exp.get('title'):
-                        story.append(Paragraph(exp['title'], styles['JobTitle']))
+                        story.append(TextParagraph(exp['title'], styles['JobTitle']))
                     
                     # Company, location, and dates
                     company_parts = []
@@ -198,17 +216,15 @@ def generate_pdf(data):
                         company_parts.append(date_str)
                     
                     if company_parts:
-                        story.append(Paragraph(" | ".join(company_parts), styles['CompanyDate']))
+                        story.append(TextParagraph(" | ".join(company_parts), styles['CompanyDate']))
                     
                     # Description with bullet points
                     if exp.get('description'):
-                        desc_lines = exp['description'].split('\n')
-                        for line in desc_lines:
-                            line = line.strip()
-                            if line.startswith(('-', '*', '•')):
-                                story.append(Paragraph(f"• {line[1:].strip()}", styles['BulletPoint']))
-                            elif line:
-                                story.append(Paragraph(line, styles['BodyText']))
+                        for line in exp.description_lines:
+                            if line.marker:
+                                story.append(TextParagraph(f"• {line.content}", styles['BulletPoint']))
+                            else:
+                                story.append(TextParagraph(line.text, styles['BodyText']))
                     
                     story.append(Spacer(1, 0.15*inch))
 
@@ -218,7 +234,7 @@ def generate_pdf(data):
                 story.append(Paragraph('EDUCATION', styles['SectionTitle']))
                 for edu in education_entries:
                     if edu.get('degree'):
-                        story.append(Paragraph(edu['degree'], styles['JobTitle']))
+                        story.append(TextParagraph(edu['degree'], styles['JobTitle']))
                     
                     # Institution, location, and dates
                     edu_parts = []
@@ -236,10 +252,10 @@ def generate_pdf(data):
                         edu_parts.append(date_str)
                     
                     if edu_parts:
-                        story.append(Paragraph(" | ".join(edu_parts), styles['CompanyDate']))
+                        story.append(TextParagraph(" | ".join(edu_parts), styles['CompanyDate']))
                     
                     if edu.get('edu_details'):
-                        story.append(Paragraph(edu['edu_details'], styles['BodyText']))
+                        story.append(TextParagraph(edu['edu_details'], styles['BodyText']))
                     
                     story.append(Spacer(1, 0.1*inch))
 
@@ -249,9 +265,9 @@ def generate_pdf(data):
                 story.append(Paragraph('KEY ACHIEVEMENTS', styles['SectionTitle']))
                 for ach in key_achievements:
                     if ach.get('title'):
-                        story.append(Paragraph(f"🏆 {ach['title']}", styles['AchievementTitle']))
+                        story.append(TextParagraph(f"🏆 {ach['title']}", styles['AchievementTitle']))
                         if ach.get('description'):
-                            story.append(Paragraph(ach['description'], styles['AchievementDesc']))
+                            story.append(TextParagraph(ach['description'], styles['AchievementDesc']))
 
         elif section_key == 'courses':
             courses = data.get('courses', [])
@@ -259,14 +275,14 @@ def generate_pdf(data):
                 story.append(Paragraph('CERTIFICATION', styles['SectionTitle']))
                 for course in courses:
                     if course.get('title'):
-                        story.append(Paragraph(course['title'], styles['AchievementTitle']))
+                        story.append(TextParagraph(course['title'], styles['AchievementTitle']))
                         if course.get('description'):
-                            story.append(Paragraph(course['description'], styles['AchievementDesc']))
+                            story.append(TextParagraph(course['description'], styles['AchievementDesc']))
 
         elif section_key == 'skills':
             if data.get('skills'):
                 story.append(Paragraph('SKILLS', styles['SectionTitle']))
-                skills_list = [skill.strip() for skill in data['skills'].split(',')]
+                skills_list = data.skill_list
                 
                 # Create a skills table for better layout
                 skills_table_data = []
@@ -317,19 +333,19 @@ def generate_pdf(data):
                         if level_info:
                             lang_text += f" ({', '.join(level_info)})"
                         
-                        story.append(Paragraph(lang_text, styles['BodyText']))
+                        story.append(TextParagraph(lang_text, styles['BodyText']))
                 story.append(Spacer(1, 0.1*inch))
 
         elif section_key == 'hobbies':
             if data.get('hobbies'):
                 story.append(Paragraph('PASSIONS', styles['SectionTitle']))
-                hobbies_list = [hobby.strip() for hobby in data['hobbies'].split(',')]
+                hobbies_list = data.hobby_list
                 for hobby in hobbies_list:
                     if hobby:
-                        story.append(Paragraph(f"⭐ {hobby}", styles['BodyText']))
+                        story.append(TextParagraph(f"⭐ {hobby}", styles['BodyText']))
                 story.append(Spacer(1, 0.1*inch))
 
     # Build the document
-    doc.build(story)
+    build_document(doc, story, context)
     buffer.seek(0)
     return buffer
\ No newline at end of file
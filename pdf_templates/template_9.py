@@ -2,12 +2,22 @@
 import io
 import os
 from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Image, FrameBreak, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor, black, white, grey, lightgrey
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
 from reportlab.lib.pagesizes import letter
 from reportlab.graphics.shapes import Circle # For potential advanced drawing
+from .images import profile_image_reader
+from .page_forms import page_form
+from .rendering import build_document
+from .resume_model import normalize_resume
+from .text import TextParagraph
+from .styles import template_stylesheet
+
+# Template selection page metadata
+TEMPLATE_NAME = 'Template 9'
+PREVIEW_IMAGE = 'images/modern_preview.png'
 
 # --- Color Palette (approximations) ---
 COLOR_TEXT_MAIN = HexColor('#333333')
@@ -20,6 +30,8 @@ class EliseCarterDocTemplate(BaseDocTemplate):
     def __init__(self, filename, **kwargs):
         self.profile_image_path = kwargs.pop('profile_image_path', None)
         BaseDocTemplate.__init__(self, filename, **kwargs)
+        # Downscaled once and reused on every page instead of embedding the original photo
+        self.profile_image = profile_image_reader(self.profile_image_path)
 
         # Define Frames: Main content slightly wider, right sidebar narrower
         main_col_width = self.width * 0.62 # Main content
@@ -36,11 +48,12 @@ class EliseCarterDocTemplate(BaseDocTemplate):
         main_page = PageTemplate(id='MainPageElise', frames=[frame_main, frame_sidebar], onPage=self.draw_header_and_profile)
         self.addPageTemplates([main_page])
 
+    @page_form
     def draw_header_and_profile(self, canvas, doc):
         canvas.saveState()
         
         # Profile Image (Top Right)
-        if self.profile_image_path and os.path.exists(self.profile_image_path):
+        if self.profile_image:
             try:
                 img_size = 1.3 * inch
                 img_x = doc.width + doc.leftMargin - img_size - (0.1 * inch) # Position from right edge
@@ -53,22 +66,16 @@ class EliseCarterDocTemplate(BaseDocTemplate):
                 path = canvas.beginPath()
                 path.circle(img_x + img_size/2, img_y + img_size/2, img_size/2)
                 canvas.clipPath(path, stroke=0, fill=0)
-                canvas.drawImage(self.profile_image_path, img_x, img_y, width=img_size, height=img_size, mask='auto')
+                canvas.drawImage(self.profile_image, img_x, img_y, width=img_size, height=img_size, mask='auto')
                 canvas.setFillColorRGB(1,1,1) # Reset clipping path by drawing a full page rect or similar
             except Exception as e:
                 print(f"Error drawing Elise Carter profile image: {e}")
         canvas.restoreState()
 
 
-def generate_pdf(data):
-    buffer = io.BytesIO()
-    
-    doc = EliseCarterDocTemplate(buffer, pagesize=letter,
-                                 leftMargin=0.75*inch, rightMargin=0.5*inch, # Asymmetric margins
-                                 topMargin=0.75*inch, bottomMargin=0.75*inch,
-                                 profile_image_path=data.get('profile_image_path'))
-
-    styles = getSampleStyleSheet()
+@template_stylesheet
+def get_styles(styles):
+    """Custom paragraph styles for this template, built once per process and shared by every render."""
     # --- Define Styles ---
     styles.add(ParagraphStyle(name='FullName', fontName='Helvetica-Bold', fontSize=24, textColor=COLOR_TEXT_HEADER, spaceBefore=0, leading=28, alignment=TA_LEFT))
     styles.add(ParagraphStyle(name='JobTitleHeader', fontName='Helvetica', fontSize=11, textColor=COLOR_TEXT_MAIN, spaceAfter=3, leading=14))
@@ -88,53 +95,64 @@ def generate_pdf(data):
     styles.add(ParagraphStyle(name='SidebarSkill', fontName='Helvetica', fontSize=9, textColor=COLOR_TEXT_MAIN, leading=12, spaceAfter=2))
 
 
+def generate_pdf(data, context=None):
+    data = normalize_resume(data)
+    buffer = io.BytesIO()
+    
+    doc = EliseCarterDocTemplate(buffer, pagesize=letter,
+                                 leftMargin=0.75*inch, rightMargin=0.5*inch, # Asymmetric margins
+                                 topMargin=0.75*inch, bottomMargin=0.75*inch,
+                                 profile_image_path=data.get('profile_image_path'))
+
+    styles = get_styles()
+
     # --- Story for Main Column (Left) ---
     story_main = []
     
     # Header section (Name, Title, Contact) - This needs to be at the very top of the flow
     if data.get('full_name'):
-        story_main.append(Paragraph(data['full_name'], styles['FullName']))
+        story_main.append(TextParagraph(data['full_name'], styles['FullName']))
     if data.get('title_subtitle'):
-        story_main.append(Paragraph(data['title_subtitle'], styles['JobTitleHeader']))
+        story_main.append(TextParagraph(data['title_subtitle'], styles['JobTitleHeader']))
     
     contact_items = []
     if data.get('email'): contact_items.append(f"📧 {data['email']}") # Using emoji, ensure font support
     if data.get('linkedin'): contact_items.append(f"🔗 {data['linkedin']}")
     if data.get('location'): contact_items.append(f"📍 {data['location']}")
     if contact_items:
-        story_main.append(Paragraph(" | ".join(contact_items), styles['ContactInfo']))
+        story_main.append(TextParagraph(" | ".join(contact_items), styles['ContactInfo']))
     story_main.append(Spacer(1, 0.2*inch))
 
 
     # SUMMARY
     story_main.append(Paragraph('Summary', styles['MainSectionTitle']))
     if data.get('summary'):
-        story_main.append(Paragraph(data['summary'], styles['MainBodyText']))
+        story_main.append(TextParagraph(data['summary'], styles['MainBodyText']))
     story_main.append(Spacer(1, 0.15*inch))
 
     # EXPERIENCE
     story_main.append(Paragraph('Experience', styles['MainSectionTitle']))
     for exp in data.get('experiences', []):
-        story_main.append(Paragraph(exp['title'], styles['ExpJobTitle']))
+        story_main.append(TextParagraph(exp['title'], styles['ExpJobTitle']))
         date_str = f"{exp.get('start_date','')} - {exp.get('end_date','') if not exp.get('is_present') else 'Present'}"
-        story_main.append(Paragraph(f"{exp['company']} | {date_str} | {exp.get('location','')}", styles['ExpCompanyDate']))
+        story_main.append(TextParagraph(f"{exp['company']} | {date_str} | {exp.get('location','')}", styles['ExpCompanyDate']))
         
         description_text = exp.get('description', '')
         if description_text:
-            points = [p.strip() for p in description_text.split('\n') if p.strip()]
+            points = [line.text for line in exp.description_lines]
             for point in points:
-                story_main.append(Paragraph(point, styles['ExpBullet'], bulletText='-')) # Using '-' as bullet
+                story_main.append(TextParagraph(point, styles['ExpBullet'], bulletText='-')) # Using '-' as bullet
         story_main.append(Spacer(1, 0.1*inch))
     story_main.append(Spacer(1, 0.15*inch))
 
     # EDUCATION
     story_main.append(Paragraph('Education', styles['MainSectionTitle']))
     for edu in data.get('education_entries', []):
-        story_main.append(Paragraph(edu['degree'], styles['EduDegree']))
+        story_main.append(TextParagraph(edu['degree'], styles['EduDegree']))
         date_str = f"{edu.get('start_date','')} - {edu.get('end_date','') if not edu.get('is_present') else 'Present'}"
-        story_main.append(Paragraph(f"{edu['institution']} | {date_str} | {edu.get('edu_location','')}", styles['EduInstitutionDate']))
+        story_main.append(TextParagraph(f"{edu['institution']} | {date_str} | {edu.get('edu_location','')}", styles['EduInstitutionDate']))
         if edu.get('edu_details'):
-            story_main.append(Paragraph(edu['edu_details'], styles['MainBodyText']))
+            story_main.append(TextParagraph(edu['edu_details'], styles['MainBodyText']))
         story_main.append(Spacer(1, 0.1*inch))
 
     # --- Story for Sidebar (Right) ---
@@ -147,8 +165,8 @@ def generate_pdf(data):
     if data.get('strengths'):
         story_sidebar.append(Paragraph('Strengths', styles['SidebarSectionTitle']))
         for item in data['strengths']:
-            story_sidebar.append(Paragraph(item['title'], styles['SidebarItemTitle']))
-            story_sidebar.append(Paragraph(item['description'], styles['SidebarItemDesc']))
+            story_sidebar.append(TextParagraph(item['title'], styles['SidebarItemTitle']))
+            story_sidebar.append(TextParagraph(item['description'], styles['SidebarItemDesc']))
         story_sidebar.append(Spacer(1, 0.15*inch))
 
     # SKILLS
@@ -156,24 +174,24 @@ def generate_pdf(data):
         story_sidebar.append(Paragraph('Skills', styles['SidebarSectionTitle']))
         # Display skills perhaps in a flow, or simple list
         skills_text = ", ".join(data['skills_list_detailed'])
-        story_sidebar.append(Paragraph(skills_text, styles['SidebarSkill'])) # Simple comma list for now
+        story_sidebar.append(TextParagraph(skills_text, styles['SidebarSkill'])) # Simple comma list for now
         story_sidebar.append(Spacer(1, 0.15*inch))
 
     # PROJECTS
     if data.get('projects'):
         story_sidebar.append(Paragraph('Projects', styles['SidebarSectionTitle']))
         for proj in data['projects']:
-            story_sidebar.append(Paragraph(proj['title'], styles['SidebarItemTitle']))
+            story_sidebar.append(TextParagraph(proj['title'], styles['SidebarItemTitle']))
             if proj.get('subtitle'):
-                 story_sidebar.append(Paragraph(proj['subtitle'], styles['SidebarItemDesc'])) # Style as desc
-            story_sidebar.append(Paragraph(proj['description'], styles['SidebarItemDesc']))
+                 story_sidebar.append(TextParagraph(proj['subtitle'], styles['SidebarItemDesc'])) # Style as desc
+            story_sidebar.append(TextParagraph(proj['description'], styles['SidebarItemDesc']))
         story_sidebar.append(Spacer(1, 0.15*inch))
 
     # HOW I SPLIT MY TIME (Simplified List)
     if data.get('how_i_split_my_time'):
         story_sidebar.append(Paragraph('How I Split My Time', styles['SidebarSectionTitle']))
         for item in data['how_i_split_my_time']:
-            story_sidebar.append(Paragraph(f"{item['label']}: {item['activity']}", styles['SidebarItemDesc']))
+            story_sidebar.append(TextParagraph(f"{item['label']}: {item['activity']}", styles['SidebarItemDesc']))
 
     # --- Combine Stories for Build ---
     full_story = []
@@ -181,6 +199,6 @@ def generate_pdf(data):
     full_story.append(FrameBreak()) # Move to the sidebar frame
     full_story.extend(story_sidebar)
 
-    doc.build(full_story)
+    build_document(doc, full_story, context)
     buffer.seek(0)
     return buffer
\ No newline at end of file
@@ -0,0 +1,60 @@
+# pdf_templates/text.py
+"""Paragraphs for user-supplied text, laid out without ReportLab's markup parser.
+
+Paragraph() feeds its text through paraparser (an HTMLParser subclass) even
+when, as with nearly everything typed into the resume form, it contains no
+markup at all; on text-heavy resumes that parsing is a large share of the
+render. It also means a stray '<' or '&' in a job description either breaks
+the render or is silently eaten.
+
+TextParagraph takes the text literally: it builds the single fragment the
+parser would have produced for plain text directly from the style, so layout
+and output are unchanged. Keep Paragraph for template-authored markup, and
+run any user value embedded in such markup through escape_markup().
+"""
+from xml.sax.saxutils import escape
+
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+from reportlab.platypus.paragraph import cleanBlockQuotedText, textTransformFrags
+from reportlab.platypus.paraparser import ParaFrag
+
+_ATTRIBUTE_ENTITIES = {'"': '&quot;', "'": '&#39;'}
+
+
+def escape_markup(value):
+    """Escapes a user value for use inside Paragraph markup (text or a quoted attribute)."""
+    return escape(str(value), _ATTRIBUTE_ENTITIES)
+
+
+def plain_frags(text, style):
+    """The fragment list paraparser produces for `text` without markup, built without parsing."""
+    text = cleanBlockQuotedText(str(text))  # Same whitespace handling as Paragraph
+    if not text:
+        return []
+    frag = ParaFrag()
+    frag.rise = 0
+    frag.greek = 0
+    frag.link = []
+    fontName, frag.bold, frag.italic = ps2tt(style.fontName)
+    frag.fontName = tt2ps(fontName, frag.bold, frag.italic)
+    frag.fontSize = style.fontSize
+    frag.textColor = style.textColor
+    frag.us_lines = []
+    frag.__tag__ = 'para'
+    frag.text = text
+    frags = [frag]
+    textTransformFrags(frags, style)
+    return frags
+
+
+class TextParagraph(Paragraph):
+    """Paragraph whose text is taken literally: no markup, no entities, nothing to escape."""
+
+    def __init__(self, text, style=None, bulletText=None, frags=None, caseSensitive=1, encoding='utf8'):
+        if frags is None:  # Paragraph.split passes ready-made frags for the pieces
+            if style is None:
+                style = ParagraphStyle(name='paragraphImplicitDefaultStyle')  # Paragraph's own default
+            frags = plain_frags(text, style)
+        Paragraph.__init__(self, text, style, bulletText, frags, caseSensitive, encoding)
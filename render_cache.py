@@ -0,0 +1,272 @@
+# render_cache.py
+"""Content-addressed cache for rendered resume output (PDF bytes).
+
+Entries are keyed by a stable hash of the canonicalized resume data, the
+template id and the template's code version (its source, the shared
+pdf_templates modules and the ReportLab version), so an edit to the data, the
+template or the code it renders with produces a new key and stale output is
+never served.
+
+Two tiers:
+  * an in-memory LRU bounded by entry count and total bytes (per process)
+  * an optional on-disk directory bounded by total bytes (oldest files evicted first)
+
+The disk tier can be shared by every worker process on a host. Lookups fall
+back to the file itself, so entries written by other workers are found, and
+each write re-reads the directory's usage under a file lock before evicting,
+so max_disk_bytes bounds the directory as a whole, not each process's view.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are not serialized, the budget is best effort
+    fcntl = None
+
+LOCK_FILE_NAME = '.lock'
+
+
+def canonical_json(value):
+    """Serializes data deterministically (sorted keys, no whitespace) for hashing."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def cache_key(resume_data, template_id, template_version=''):
+    """Returns the hex digest identifying one (data, template, template code) combination."""
+    digest = hashlib.sha256()
+    digest.update(template_id.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(str(template_version).encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(canonical_json(resume_data).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Thread-safe two-tier (memory LRU + optional disk) cache of rendered bytes."""
+
+    def __init__(self, max_entries=256, max_bytes=64 * 1024 * 1024,
+                 disk_dir=None, max_disk_bytes=512 * 1024 * 1024, suffix='.pdf'):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.suffix = suffix
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> bytes, oldest first
+        self._memory_bytes = 0
+        self._disk = OrderedDict()  # key -> file size, least recently used first
+        self._disk_bytes = 0
+
+        self._counters = {
+            'hits': 0,
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0,
+        }
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    # --- Public API ---
+
+    def get(self, key):
+        """Returns cached bytes for `key`, or None on a miss."""
+        data, path = self.lookup(key)
+        if path is None:
+            return data
+        data = self._read_disk(path, key)
+        if data is not None:
+            with self._lock:
+                self._store_memory(key, data)  # Promote so the next hit skips the disk
+        return data
+
+    def lookup(self, key):
+        """Finds `key` without reading disk entries: returns (bytes, None) from memory,
+        (None, file path) from disk, or (None, None) on a miss.
+
+        Lets callers stream a disk hit straight from its file instead of loading it.
+        """
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._counters['hits'] += 1
+                self._counters['memory_hits'] += 1
+                return data, None
+            on_disk = bool(self.disk_dir) and key in self._disk
+            if on_disk:
+                self._disk.move_to_end(key)
+
+        if self.disk_dir and not on_disk:
+            # Possibly written by another worker since this process last read the directory
+            try:
+                size = os.stat(self._path(key)).st_size
+            except OSError:
+                pass
+            else:
+                with self._lock:
+                    if key not in self._disk:
+                        self._disk[key] = size
+                        self._disk_bytes += size
+                on_disk = True
+
+        if on_disk:
+            path = self._path(key)
+            try:
+                os.utime(path)  # Refresh mtime: the LRU order other workers and restarts see
+            except OSError:
+                with self._lock:  # Removed behind our back
+                    size = self._disk.pop(key, None)
+                    if size is not None:
+                        self._disk_bytes -= size
+            else:
+                with self._lock:
+                    self._counters['hits'] += 1
+                    self._counters['disk_hits'] += 1
+                return None, path
+
+        with self._lock:
+            self._counters['misses'] += 1
+        return None, None
+
+    def put(self, key, data):
+        """Stores `data` (bytes) under `key` in memory and, if configured, on disk."""
+        data = bytes(data)
+        with self._lock:
+            self._counters['stores'] += 1
+            self._store_memory(key, data)
+        if self.disk_dir:
+            self._write_disk(key, data)
+
+    def clear(self):
+        """Drops every entry from both tiers (counters are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            disk_keys = list(self._disk)
+            self._disk.clear()
+            self._disk_bytes = 0
+        for key in disk_keys:
+            self._remove_file(key)
+
+    def stats(self):
+        """Hit/miss/eviction counters plus current occupancy, for sizing the cache."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update({
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'disk_enabled': bool(self.disk_dir),
+                'disk_entries': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+                'max_disk_bytes': self.max_disk_bytes,
+            })
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+    # --- Memory tier (caller holds self._lock) ---
+
+    def _store_memory(self, key, data):
+        if len(data) > self.max_bytes:
+            return  # Larger than the whole tier; keep it on disk only
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory and (len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._counters['memory_evictions'] += 1
+
+    # --- Disk tier ---
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key + self.suffix)
+
+    @contextlib.contextmanager
+    def _directory_lock(self):
+        """Serializes usage scans and evictions across every process sharing the directory."""
+        with open(os.path.join(self.disk_dir, LOCK_FILE_NAME), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield  # Closing the file releases the lock
+
+    def _load_disk_index(self):
+        """Builds the LRU index from the files already in the directory."""
+        with self._directory_lock():
+            self._sync_disk()
+
+    def _sync_disk(self):
+        """Re-reads the directory (all workers' files, oldest mtime first), deletes the oldest
+        files until it is within max_disk_bytes and replaces the index with what is left.
+        Caller holds the directory lock."""
+        entries = []
+        with os.scandir(self.disk_dir) as scan:
+            for item in scan:
+                if not item.name.endswith(self.suffix):
+                    continue
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue  # Removed meanwhile
+                entries.append((st.st_mtime, item.name[:-len(self.suffix)], st.st_size))
+        entries.sort()
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        while entries and total > self.max_disk_bytes:
+            _, old_key, size = entries.pop(0)
+            self._remove_file(old_key)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._disk = OrderedDict((key, size) for _, key, size in entries)
+            self._disk_bytes = total
+            self._counters['disk_evictions'] += evicted
+
+    def _read_disk(self, path, key):
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            with self._lock:
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_bytes -= size
+            return None
+
+    def _write_disk(self, key, data):
+        if len(data) > self.max_disk_bytes:
+            return
+        # Write to a temp file and rename so concurrent readers never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            with self._directory_lock():
+                os.replace(tmp_path, self._path(key))
+                self._sync_disk()
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remove_file(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
@@ -0,0 +1,304 @@
+# render_jobs.py
+"""Background PDF rendering on a process pool, so web workers do not block on doc.build.
+
+Jobs are submitted with a template id and a snapshot of the resume data and
+run in separate processes (sidestepping the GIL for ReportLab's pure-Python
+layout). The number of unfinished jobs is capped; past that, submit() raises
+QueueFullError so the caller can answer 429. Each job has a deadline; a job
+still unfinished at its deadline is reported as timed out and its result is
+discarded. A worker process cannot be stopped mid-render, so a timed-out job
+keeps counting against the cap until its process is actually free.
+
+A job submitted with a cache key uses that key as its id. Given a
+status_cache (a RenderCache with a disk tier shared by the web workers), each
+job's status is also written there, so any worker can answer for a job that
+another one accepted; the PDF itself is handed to on_complete, which is
+expected to store it in the shared PDF cache under the same key.
+
+submit_call() runs other work on the same pool and under the same cap
+(gallery thumbnails): the request waits for the result, but the page is
+rendered and drawn in a worker process, not on the request thread.
+"""
+import importlib
+import json
+import multiprocessing
+import secrets
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from page_raster import encode_image, rasterize_first_page
+from pdf_templates.rendering import RenderContext
+
+
+def render_pdf_bytes(template_id, resume_data, deterministic=False):
+    """Renders one resume with pdf_templates.<template_id> and returns the PDF bytes (runs in a worker)."""
+    module = importlib.import_module(f'pdf_templates.{template_id}')
+    context = RenderContext(template_id, deterministic=True) if deterministic else None
+    return module.generate_pdf(resume_data, context=context).getvalue()
+
+
+def render_thumbnail_bytes(template_id, resume_data, width, image_format):
+    """Renders page 1 of a resume and draws it as a `width`-pixel PNG or WebP (runs in a worker).
+
+    Returns (image bytes, RenderContext); the context brings the stage timings and has_more_pages back.
+    """
+    module = importlib.import_module(f'pdf_templates.{template_id}')
+    context = RenderContext(template_id, deterministic=True, first_page_only=True)
+    pdf_bytes = context.render(module.generate_pdf, resume_data).getvalue()
+    context.output_bytes = len(pdf_bytes)
+    with context.span('rasterize'):
+        image_bytes = encode_image(rasterize_first_page(pdf_bytes, width), image_format)
+    return image_bytes, context
+
+
+class QueueFullError(Exception):
+    """Raised by RenderJobManager.submit when the pending-job limit is reached."""
+
+
+class RenderJob:
+    """State of one submitted render."""
+
+    def __init__(self, template_id, cache_key=None, timeout=None):
+        self.id = cache_key or secrets.token_urlsafe(16)
+        self.template_id = template_id
+        self.cache_key = cache_key
+        self.submitted_at = time.time()
+        self.deadline = self.submitted_at + timeout if timeout else None
+        self.finished_at = None
+        self.status = 'queued'  # queued -> running -> done | failed | timeout
+        self.result = None
+        self.error = None
+        self.future = None
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'template_id': self.template_id,
+            'status': self.status,
+            'error': self.error,
+            'submitted_at': self.submitted_at,
+            'finished_at': self.finished_at,
+        }
+
+    def to_record(self):
+        """to_dict() plus what another process needs to resolve the job: its deadline and cache key."""
+        record = self.to_dict()
+        record.update({'deadline': self.deadline, 'cache_key': self.cache_key})
+        return json.dumps(record).encode('utf-8')
+
+    @classmethod
+    def from_record(cls, data):
+        """Rebuilds a job (without its future or result) from a to_record() written by any process."""
+        record = json.loads(data)
+        job = cls(record['template_id'], cache_key=record.get('cache_key'))
+        job.id = record['id']
+        for field in ('status', 'error', 'submitted_at', 'finished_at', 'deadline'):
+            setattr(job, field, record.get(field))
+        return job
+
+
+class RenderJobManager:
+    """Owns the worker pool and the table of jobs for this web process."""
+
+    def __init__(self, max_workers=None, max_pending=32, timeout=60, result_ttl=600, on_complete=None,
+                 deterministic=False, status_cache=None):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.result_ttl = result_ttl
+        # Called as on_complete(job) after a successful render; it takes over job.result, which the job then drops
+        self.on_complete = on_complete
+        self.deterministic = deterministic  # Passed to render_pdf_bytes
+        self.status_cache = status_cache  # Shared job status records; None keeps jobs local to this process
+
+        self._lock = threading.Lock()
+        self._executor = None  # Created on first use so importing the app does not fork workers
+        self._jobs = {}
+        self._calls = set()  # Futures of submit_call() work, while unfinished
+
+    @property
+    def executor(self):
+        with self._lock:
+            if self._executor is None:
+                # Spawned, not forked: the web process has other threads whose held locks a fork would copy
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def submit(self, template_id, resume_data, cache_key=None):
+        """Queues a render and returns its RenderJob; raises QueueFullError when at capacity.
+
+        A render of the same cache key that this process is still running is returned instead of a new one.
+        """
+        job, = self.submit_all([(template_id, resume_data, cache_key)]).values()
+        return job
+
+    def submit_all(self, renders):
+        """Queues several (template_id, resume_data, cache_key) renders, all or none.
+
+        Returns {future: job}, ready for concurrent.futures.as_completed(). Raises QueueFullError, having
+        queued nothing, unless every render fits under max_pending.
+        """
+        self._cleanup()
+        executor = self.executor
+        submitted = {}
+        new_jobs = []
+        with self._lock:
+            to_queue = []
+            for template_id, resume_data, cache_key in renders:
+                job = self._jobs.get(cache_key) if cache_key else None
+                if job is not None and job.status in ('queued', 'running') and job.future is not None:
+                    submitted[job.future] = job  # Already rendering
+                else:
+                    to_queue.append((template_id, resume_data, cache_key))
+            pending = self._pending()
+            if pending + len(to_queue) > self.max_pending:
+                raise QueueFullError(f"{pending} render jobs pending, {len(to_queue)} more requested "
+                                     f"(limit {self.max_pending})")
+            for template_id, resume_data, cache_key in to_queue:
+                job = RenderJob(template_id, cache_key=cache_key, timeout=self.timeout)
+                self._publish(job)
+                job.future = executor.submit(render_pdf_bytes, template_id, resume_data, self.deterministic)
+                self._jobs[job.id] = job
+                submitted[job.future] = job
+                new_jobs.append(job)
+        for job in new_jobs:
+            job.future.add_done_callback(lambda future, job=job: self._finish(job, future))
+        return submitted
+
+    def submit_call(self, fn, *args):
+        """Runs fn(*args) in the pool for a caller that waits for it itself (no job record); returns its future.
+
+        Counts against max_pending until it finishes; raises QueueFullError when at capacity.
+        """
+        executor = self.executor
+        with self._lock:
+            pending = self._pending()
+            if pending >= self.max_pending:
+                raise QueueFullError(f"{pending} render jobs pending (limit {self.max_pending})")
+            future = executor.submit(fn, *args)
+            self._calls.add(future)
+        future.add_done_callback(self._forget_call)
+        return future
+
+    def add_completed(self, template_id, cache_key):
+        """Registers a render whose PDF is already stored under `cache_key` (a cache hit) as a finished job."""
+        self._cleanup()
+        job = RenderJob(template_id, cache_key=cache_key)
+        job.status = 'done'
+        job.finished_at = job.submitted_at
+        with self._lock:
+            self._jobs[job.id] = job
+        self._publish(job)
+        return job
+
+    def get(self, job_id):
+        """Returns the job with its status refreshed, or None if unknown or expired.
+
+        Jobs this process accepted come from its own table; others from their status record, if shared.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is not None:
+            self._refresh(job)
+            return job
+        if self.status_cache is None:
+            return None
+        record = self.status_cache.get(job_id)
+        if record is None:
+            return None
+        job = RenderJob.from_record(record)
+        if job.finished_at is not None and job.finished_at < time.time() - self.result_ttl:
+            return None
+        if job.status in ('queued', 'running') and job.deadline and time.time() > job.deadline:
+            # The accepting worker has not recorded the timeout yet (it does so when polled)
+            job.status = 'timeout'
+            job.error = f"Render did not finish within {self.timeout} seconds"
+            job.finished_at = job.deadline
+        return job
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        counts = {}
+        for job in jobs:
+            self._refresh(job)
+            counts[job.status] = counts.get(job.status, 0) + 1
+        with self._lock:
+            pending = self._pending()
+        return {'jobs': counts, 'pending': pending, 'max_pending': self.max_pending, 'timeout': self.timeout}
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # --- Internals ---
+
+    def _pending(self):
+        """Jobs occupying or waiting for a worker process (caller holds self._lock).
+
+        Counted by their futures, not their status: a timed-out render keeps its process busy until it ends.
+        """
+        jobs = sum(1 for job in self._jobs.values() if job.future is not None and not job.future.done())
+        return jobs + sum(1 for future in self._calls if not future.done())
+
+    def _forget_call(self, future):
+        with self._lock:
+            self._calls.discard(future)
+
+    def _publish(self, job):
+        if self.status_cache is not None:
+            self.status_cache.put(job.id, job.to_record())
+
+    def _refresh(self, job):
+        if job.status in ('done', 'failed', 'timeout'):
+            return
+        future = job.future  # None once the render has ended
+        if job.deadline and time.time() > job.deadline:
+            job.status = 'timeout'
+            job.error = f"Render did not finish within {self.timeout} seconds"
+            job.finished_at = time.time()
+            if future is not None:
+                future.cancel()  # Only effective if it has not reached a worker yet
+            self._publish(job)
+        elif future is not None and future.running():
+            job.status = 'running'
+
+    def _finish(self, job, future):
+        try:
+            self._record_outcome(job, future)
+        finally:
+            with self._lock:
+                job.future = None  # The future holds the PDF too; whoever waits on it has their own reference
+
+    def _record_outcome(self, job, future):
+        if job.status == 'timeout' or future.cancelled():
+            return
+        job.finished_at = time.time()
+        error = future.exception()
+        if error is not None:
+            job.status = 'failed'
+            job.error = f"{type(error).__name__}: {error}"
+        else:
+            job.result = future.result()
+            if self.on_complete is not None:
+                self.on_complete(job)
+                job.result = None  # Stored by on_complete; the job table keeps only the status
+            job.status = 'done'  # Only now, so a poll that sees it finds the stored PDF
+        self._publish(job)
+
+    def _cleanup(self):
+        """Forgets finished jobs (and any PDFs they hold) older than result_ttl.
+
+        Timed-out jobs stay while their render is still running, so they keep counting against max_pending.
+        """
+        cutoff = time.time() - self.result_ttl
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff
+                       and (job.future is None or job.future.done())]
+            for job_id in expired:
+                del self._jobs[job_id]
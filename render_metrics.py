@@ -0,0 +1,126 @@
+# render_metrics.py
+"""Minimal Prometheus-style metrics for resume rendering (text exposition format 0.0.4).
+
+Metrics live in the process that records them: with several web workers,
+each one serves its own /metrics and the scraper aggregates.
+"""
+import threading
+
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PAGE_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 50)
+BYTE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, documentation, labelnames=(), buckets=TIME_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}  # label values -> [bucket counts..., sum, count]
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def expose(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        names = self.labelnames + ('le',)
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f"{self.name}_bucket{_format_labels(names, key + (bound,))} {count}")
+                lines.append(f"{self.name}_bucket{_format_labels(names, key + ('+Inf',))} {series[-1]}")
+                lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(series[-2])}")
+                lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {series[-1]}")
+        return lines
+
+
+class RenderMetrics:
+    """The metrics recorded by the app, plus the /metrics text rendering."""
+
+    def __init__(self, prefix='resume'):
+        self.renders = Counter(f'{prefix}_renders_total', 'PDF renders by template and outcome (ok, error, cached).',
+                               ('template', 'status'))
+        self.stage_seconds = Histogram(f'{prefix}_render_stage_seconds',
+                                       'Time spent per render stage (story, layout, serialize, ...).',
+                                       ('template', 'stage'))
+        self.pages = Histogram(f'{prefix}_render_pages', 'Pages per rendered PDF.', ('template',), PAGE_BUCKETS)
+        self.input_bytes = Histogram(f'{prefix}_render_input_bytes', 'Size of the resume data rendered (JSON bytes).',
+                                     ('template',), BYTE_BUCKETS)
+        self.output_bytes = Histogram(f'{prefix}_render_output_bytes', 'Size of the rendered PDF.',
+                                      ('template',), BYTE_BUCKETS)
+        self.form_parse_seconds = Histogram(f'{prefix}_form_parse_seconds', 'Time to parse the resume form submission.')
+        self.form_bytes = Histogram(f'{prefix}_form_bytes', 'Size of the resume form submission.', (), BYTE_BUCKETS)
+        self._metrics = [self.renders, self.stage_seconds, self.pages, self.input_bytes, self.output_bytes,
+                         self.form_parse_seconds, self.form_bytes]
+
+    def observe_render(self, context, status='ok'):
+        """Records one render's RenderContext."""
+        template = context.template_id or ''
+        self.renders.inc(template=template, status=status)
+        for stage, seconds in context.spans.items():
+            self.stage_seconds.observe(seconds, template=template, stage=stage)
+        if status != 'ok':
+            return
+        if context.pages is not None:
+            self.pages.observe(context.pages, template=template)
+        if context.input_bytes is not None:
+            self.input_bytes.observe(context.input_bytes, template=template)
+        if context.output_bytes is not None:
+            self.output_bytes.observe(context.output_bytes, template=template)
+
+    def observe_form_parse(self, seconds, form_bytes=None):
+        self.form_parse_seconds.observe(seconds)
+        if form_bytes is not None:
+            self.form_bytes.observe(form_bytes)
+
+    def expose(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
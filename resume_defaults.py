@@ -0,0 +1,115 @@
+# resume_defaults.py
+"""Sample resume data and the default section layout.
+
+Kept apart from app.py so that scripts (batch_render.py, the benchmarks) can
+use them without importing the Flask app and its start-up side effects.
+"""
+from types import MappingProxyType
+
+
+SAMPLE_RESUME_DATA = {
+    'full_name': 'Maeve Delaney',
+    'title_subtitle': 'Strategic Sourcing Leader | Procurement Specialist | Team Management',
+    'email': 'help@enhancv.com',
+    'phone': '+1-(234)-555-1234',
+    'linkedin': 'linkedin.com/in/maevedelaney',
+    'location': 'Charlotte, North Carolina',
+    'id_number': '123-45-6789',  # New field
+    'nationality': 'American',
+    'birth_date': '1985-03-15',
+    'gender': 'Female',
+    'website': 'https://maevedelaney.com',
+    'address': '123 Main St, Charlotte, NC 28202',
+    'profile_image_path': 'static/images/sample_profile.jpg', # Ensure this image exists
+
+    'summary': 'Dynamic procurement specialist with over 5 years of experience in strategic sourcing and team management. Highly skilled in supply chain optimization and developing category strategies. Proven leader with an MBA and a solid track record in transformative sourcing initiatives, delivering significant cost savings and operational efficiencies.',
+
+    'key_achievements': [
+        {'title': 'Implemented Supplier Performance Management System', 'description': 'Successfully introduced a systematic approach to evaluating and improving supplier performance, elevating efficiency by 10%.'},
+        {'title': 'Managed $500M Indirect Spend Portfolio', 'description': 'Directed strategic allocation and cost-saving initiatives across diverse departments, optimizing the company\'s substantial indirect spend.'},
+        {'title': 'Achieved 15% Annual Cost Savings', 'description': 'Strategized and executed a category management plan for medical supplies that slashed annual costs significantly.'}
+    ],
+    'courses': [
+        {'title': 'Certified Professional in Supply Management', 'description': 'Intensive course covering strategic sourcing and supply chain management, provided by the Institute for Supply Management.'}
+    ],
+    'experiences': [
+        {
+            'title': 'Senior Sourcing Manager',
+            'company': 'Premier Inc.',
+            'location': 'Charlotte, NC',
+            'start_date': '2018-06', # YYYY-MM
+            'end_date': '',          # Empty if present
+            'is_present': True,
+            'description': '- Developed and executed category strategy for medical supplies, reducing annual costs by 15% through strategic supplier consolidation.\n- Led cross-functional teams in the successful negotiation of complex service contracts, yielding a 20% improvement in service level agreements.\n- Implemented a supplier performance management system, enhancing supplier quality and compliance, and resulting in a 10% increase in supplier scorecard performance.' # Newline separated points
+        },
+        {
+            'title': 'Category Manager',
+            'company': 'Honeywell',
+            'location': 'Fort Mill, SC',
+            'start_date': '2015-01',
+            'end_date': '2018-05',
+            'is_present': False,
+            'description': '- Executed multi-year growth plans for the electronics category, delivering a sustained 10% year-over-year cost reduction.\n- Conducted extensive market trends analysis leading to the early identification of cost-saving opportunities.'
+        },
+    ],
+    'education_entries': [
+        {
+            'degree': 'Master of Business Administration',
+            'institution': 'Duke University',
+            'edu_location': 'Durham, NC',
+            'start_date': '2007-01', # YYYY-MM
+            'end_date': '2009-01',   # YYYY-MM
+            'is_present': False,
+            'edu_details': 'Relevant coursework in strategic finance and operations management.'
+        },
+        {
+            'degree': 'Bachelor of Science in Supply Chain Management',
+            'institution': 'North Carolina State University',
+            'edu_location': 'Raleigh, NC',
+            'start_date': '2003-01',
+            'end_date': '2007-01',
+            'is_present': False,
+            'edu_details': 'Graduated with Honors.'
+        }
+    ],
+    'languages': [
+        {
+            'name': 'English',
+            'level': 'Native',
+            'reading': 'Native',
+            'writing': 'Native',
+            'speaking': 'Native'
+        },
+        {
+            'name': 'Spanish',
+            'level': 'Intermediate',
+            'reading': 'Good',
+            'writing': 'Basic',
+            'speaking': 'Good'
+        }
+    ],
+    'skills': 'Strategic Sourcing, Supply Chain Management, Team Leadership, Contract Negotiation, Cost Reduction, Supplier Management',
+    'hobbies': 'Photography, Hiking, Reading, Cooking',
+    'custom_fields': [],  # New field for custom sections
+    # section_order will be added dynamically
+}
+
+# Define the sections that can be reordered and their display names
+# NOTE: Adjust keys based on how they are handled in your templates (e.g., modern template has left/right col sections)
+# Read-only and shared by every request; app.sections_for() adds a resume's custom sections.
+REORDERABLE_SECTIONS = MappingProxyType({
+    'summary': 'Professional Summary',
+    'experience': 'Professional Experience',
+    'education': 'Education',
+    'achievements': 'Key Achievements',
+    'courses': 'Courses',
+    'skills': 'Skills',
+    'hobbies': 'Hobbies',
+    'languages': 'Languages',
+    'additional_info': 'Additional Information',
+    'references': 'References',
+    'projects': 'Projects',
+})
+
+# Define a default order - adjust based on common preference
+DEFAULT_SECTION_ORDER = list(REORDERABLE_SECTIONS.keys())
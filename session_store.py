@@ -0,0 +1,242 @@
+# session_store.py
+"""Server-side Flask sessions: the cookie only carries an opaque session id.
+
+Flask's default session serializes everything (the whole resume_data dict)
+into a signed cookie, so every request ships and re-verifies a payload that
+grows with the resume. ServerSideSessionInterface keeps the data in a
+pluggable SessionStore instead:
+
+  * MemorySessionStore - in-process LRU, for single-process deployments and development
+  * SQLiteSessionStore - a local SQLite file shared by all workers on one host
+  * RedisSessionStore  - any client exposing Redis' get/setex/expire/delete
+
+Every backend expires sessions `ttl` seconds after their last use.
+"""
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+
+SID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{32,128}$')
+
+
+# --- Stores ---
+
+class SessionStore:
+    """Interface every session backend implements. Payloads are opaque bytes."""
+
+    def load(self, sid):
+        """Returns the stored payload for `sid`, or None if it is unknown or expired."""
+        raise NotImplementedError
+
+    def save(self, sid, payload, ttl):
+        """Stores `payload` for `sid`, expiring `ttl` seconds from now."""
+        raise NotImplementedError
+
+    def touch(self, sid, ttl):
+        """Pushes the expiry of an existing session `ttl` seconds into the future."""
+        raise NotImplementedError
+
+    def delete(self, sid):
+        raise NotImplementedError
+
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU with TTL; sessions are lost on restart and not shared between processes."""
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # sid -> (expires_at, payload), least recently used first
+
+    def load(self, sid):
+        with self._lock:
+            entry = self._entries.get(sid)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[sid]
+                return None
+            self._entries.move_to_end(sid)
+            return entry[1]
+
+    def save(self, sid, payload, ttl):
+        with self._lock:
+            self._entries.pop(sid, None)
+            self._entries[sid] = (time.time() + ttl, payload)
+            self._evict()
+
+    def touch(self, sid, ttl):
+        with self._lock:
+            entry = self._entries.pop(sid, None)
+            if entry is not None:
+                self._entries[sid] = (time.time() + ttl, entry[1])
+
+    def delete(self, sid):
+        with self._lock:
+            self._entries.pop(sid, None)
+
+    def _evict(self):
+        # The TTL is the same for every session, so LRU order is also expiry order
+        now = time.time()
+        while self._entries:
+            sid, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at >= now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[sid]
+
+
+class SQLiteSessionStore(SessionStore):
+    """Sessions in a local SQLite file (WAL mode), shared by every worker process on the host."""
+
+    PURGE_EVERY = 200  # Writes between sweeps of expired rows
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._writes = 0
+        with self._connection() as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS sessions ('
+                         'sid TEXT PRIMARY KEY, payload BLOB NOT NULL, expires_at REAL NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at)')
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def load(self, sid):
+        row = self._connection().execute(
+            'SELECT payload FROM sessions WHERE sid = ? AND expires_at >= ?', (sid, time.time())).fetchone()
+        return bytes(row[0]) if row else None
+
+    def save(self, sid, payload, ttl):
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute('INSERT OR REPLACE INTO sessions (sid, payload, expires_at) VALUES (?, ?, ?)',
+                         (sid, sqlite3.Binary(payload), now + ttl))
+            self._writes += 1
+            if self._writes % self.PURGE_EVERY == 0:
+                conn.execute('DELETE FROM sessions WHERE expires_at < ?', (now,))
+
+    def touch(self, sid, ttl):
+        with self._connection() as conn:
+            conn.execute('UPDATE sessions SET expires_at = ? WHERE sid = ?', (time.time() + ttl, sid))
+
+    def delete(self, sid):
+        with self._connection() as conn:
+            conn.execute('DELETE FROM sessions WHERE sid = ?', (sid,))
+
+
+class RedisSessionStore(SessionStore):
+    """Sessions in Redis (or any client with compatible get/setex/expire/delete); Redis handles expiry."""
+
+    def __init__(self, client, prefix='resume-session:'):
+        self.client = client
+        self.prefix = prefix
+
+    def load(self, sid):
+        return self.client.get(self.prefix + sid)
+
+    def save(self, sid, payload, ttl):
+        self.client.setex(self.prefix + sid, int(ttl), payload)
+
+    def touch(self, sid, ttl):
+        self.client.expire(self.prefix + sid, int(ttl))
+
+    def delete(self, sid):
+        self.client.delete(self.prefix + sid)
+
+
+def create_session_store(backend, sqlite_path=None, redis_url=None, max_entries=10000):
+    """Builds the store named by `backend` ('memory', 'sqlite' or 'redis')."""
+    if backend == 'memory':
+        return MemorySessionStore(max_entries=max_entries)
+    if backend == 'sqlite':
+        return SQLiteSessionStore(sqlite_path)
+    if backend == 'redis':
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("SESSION_BACKEND=redis requires the 'redis' package (pip install redis)")
+        return RedisSessionStore(redis.Redis.from_url(redis_url or 'redis://localhost:6379/0'))
+    raise ValueError(f"Unknown session backend '{backend}' (expected memory, sqlite or redis)")
+
+
+# --- Flask Integration ---
+
+class ServerSideSession(SecureCookieSession):
+    """Session dict whose contents live in a SessionStore under `sid`."""
+
+    def __init__(self, initial=None, sid=None, new=False):
+        super().__init__(initial)
+        self.sid = sid
+        self.new = new
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Keeps session data in `store`; the cookie holds only a random, unguessable session id."""
+
+    serializer = TaggedJSONSerializer()
+    session_class = ServerSideSession
+
+    def __init__(self, store, ttl=24 * 60 * 60):
+        self.store = store
+        self.ttl = ttl
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid and SID_PATTERN.match(sid):
+            payload = self.store.load(sid)
+            if payload is not None:
+                try:
+                    data = self.serializer.loads(payload.decode('utf-8'))
+                    return self.session_class(data, sid=sid)
+                except ValueError:
+                    app.logger.warning("Discarding unreadable server-side session payload.")
+        return self.session_class(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+        secure = self.get_cookie_secure(app)
+        samesite = self.get_cookie_samesite(app)
+        httponly = self.get_cookie_httponly(app)
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        # An emptied session is removed from the store; an empty new one is never stored
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path, secure=secure,
+                                       samesite=samesite, httponly=httponly)
+                response.vary.add('Cookie')
+            return
+
+        if session.modified or session.new:
+            payload = self.serializer.dumps(dict(session)).encode('utf-8')
+            self.store.save(session.sid, payload, self.ttl)
+        elif app.config['SESSION_REFRESH_EACH_REQUEST']:
+            self.store.touch(session.sid, self.ttl)
+
+        if session.new or self.should_set_cookie(app, session):
+            response.set_cookie(name, session.sid, expires=self.get_expiration_time(app, session),
+                                httponly=httponly, domain=domain, path=path, secure=secure,
+                                samesite=samesite)
+            response.vary.add('Cookie')
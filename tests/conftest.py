@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)  # Top-level modules and packages import as they do when app.py runs
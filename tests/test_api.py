@@ -0,0 +1,122 @@
+# tests/test_api.py
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault('SESSION_BACKEND', 'memory')  # No sessions file for the tests
+
+import pytest
+from PIL import Image
+
+import app as app_module
+from resume_defaults import SAMPLE_RESUME_DATA
+
+
+@pytest.fixture
+def client():
+    return app_module.app.test_client()
+
+
+def problems(response):
+    assert response.status_code == 400
+    return response.get_json()['problems']
+
+
+def test_unknown_template_is_404(client):
+    assert client.post('/api/render/template_999', json={}).status_code == 404
+
+
+@pytest.mark.parametrize('body', [b'not json', b'[1, 2]', b'"text"'])
+def test_body_must_be_a_json_object(client, body):
+    response = client.post('/api/render/template_1', data=body, content_type='application/json')
+    assert problems(response) == ["The request body must be a JSON object"]
+
+
+def test_field_types_and_lengths_are_checked(client):
+    response = client.post('/api/render/template_1', json={
+        'full_name': 'x' * 201,
+        'email': 5,
+        'skills': ['Python', 7],
+        'fit_to_pages': 11,
+        'experiences': [{'company': 'No title'}, 'not an object', {'title': 'T', 'is_present': 'yes'}],
+        'custom_fields': [{'title': 'Extra', 'section_key': 3}],
+        'education_entries': {},
+    })
+    assert problems(response) == [
+        "'full_name' is longer than 200 characters",
+        "'email' must be a string",
+        "'skills[1]' must be a string",
+        "'fit_to_pages' must be a page count from 1 to 10",
+        "'experiences[0].title' is required",
+        "'experiences[1]' must be an object",
+        "'experiences[2].is_present' must be true or false",
+        "'education_entries' must be a list",
+        "'custom_fields[0].section_key' must be a string",
+    ]
+
+
+@pytest.mark.parametrize('section_order, expected', [
+    ('summary', ["'section_order' must be a list of section keys"]),
+    (['summary', 3], ["'section_order' must be a list of section keys"]),
+    (['summary', 'nonsense'], ["'section_order' has unknown section 'nonsense'"]),
+])
+def test_section_order_must_name_known_sections(client, section_order, expected):
+    response = client.post('/api/render/template_1', json={'full_name': 'A', 'section_order': section_order})
+    assert problems(response) == expected
+
+
+@pytest.mark.parametrize('path', [
+    'app.py',
+    'static/../app.py',
+    '../static/images/classic_preview.png',
+    '/etc/passwd',
+    'static/images/\0.png',
+    7,
+])
+def test_image_paths_must_stay_under_static(client, path):
+    response = client.post('/api/render/template_1', json={'full_name': 'A', 'profile_image_path': path})
+    assert problems(response) == ["'profile_image_path' must name a file under static/"]
+
+
+def test_image_paths_resolve_from_the_project_root(client, tmp_path, monkeypatch):
+    # From another working directory, 'static/...' still means the project's static folder,
+    # and a look-alike 'static' folder there does not make an outside path pass
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'static').mkdir()
+    assert app_module._api_resume_problems({'profile_image_path': 'static/images/classic_preview.png'}) == []
+    assert app_module._api_resume_problems({'profile_image_path': str(tmp_path / 'static' / 'x.png')}) == [
+        "'profile_image_path' must name a file under static/"]
+
+
+def test_valid_resume_renders(client, monkeypatch):
+    monkeypatch.chdir(app_module.app.root_path)
+    data = dict(SAMPLE_RESUME_DATA, profile_image_path='static/images/classic_preview.png')
+    response = client.post('/api/render/template_1', json=data)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert response.data.startswith(b'%PDF-')
+
+
+@pytest.fixture
+def thread_pool(monkeypatch):
+    """Runs the render pool's work on threads, so the tests do not spawn worker processes."""
+    monkeypatch.setattr(app_module.render_jobs, '_executor', ThreadPoolExecutor(max_workers=2))
+    app_module.thumbnail_cache.clear()
+
+
+def test_thumbnails_are_drawn_in_the_render_pool(client, thread_pool):
+    response = client.get('/preview/template_1.webp?width=200')
+    assert response.status_code == 200
+    assert response.mimetype == 'image/webp'
+    assert response.headers['X-Has-More-Pages'] in ('true', 'false')
+    assert 'rasterize;dur=' in response.headers['Server-Timing']
+    assert Image.open(io.BytesIO(response.data)).width == 200
+    cached = client.get('/preview/template_1.webp?width=200')  # Served from the thumbnail cache
+    assert cached.data == response.data and 'Server-Timing' not in cached.headers
+
+
+def test_thumbnails_back_off_when_the_render_pool_is_full(client, thread_pool, monkeypatch):
+    monkeypatch.setattr(app_module.render_jobs, 'max_pending', 0)
+    response = client.get('/preview/template_1.png')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
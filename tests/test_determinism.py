@@ -0,0 +1,71 @@
+# tests/test_determinism.py
+"""Deterministic renders of the same data and template must be byte-identical.
+
+Downloads are cached and served under the cache key as a strong ETag, which
+is only accurate if a re-render produces exactly the same bytes, in this
+process or in any other worker.
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.resume_fixtures import ROOT_DIR, make_resume
+from pdf_templates.registry import discover_templates
+from pdf_templates.rendering import RenderContext
+
+TEMPLATES = discover_templates()
+
+
+def render(template_id, data):
+    with contextlib.redirect_stdout(io.StringIO()):  # Templates print debugging output
+        context = RenderContext(template_id, deterministic=True)
+        return TEMPLATES[template_id].generator(dict(data), context=context).getvalue()
+
+
+@pytest.mark.parametrize('n_experiences, with_photo', [(1, False), (20, True)])
+@pytest.mark.parametrize('template_id', list(TEMPLATES))
+def test_deterministic_render_is_byte_identical(template_id, n_experiences, with_photo, monkeypatch):
+    monkeypatch.chdir(ROOT_DIR)  # Image paths in resume data are relative to the project root
+    data = make_resume(n_experiences, with_photo=with_photo)
+    first = render(template_id, data)
+    assert first.startswith(b'%PDF')
+    assert render(template_id, data) == first
+
+
+# Renders every template in a fresh interpreter and prints {template_id: sha256 of the PDF}
+RENDER_ALL_SCRIPT = """
+import contextlib, hashlib, io, json, sys
+sys.path.insert(0, {root!r})
+from benchmarks.resume_fixtures import make_resume
+from pdf_templates.registry import discover_templates
+from pdf_templates.rendering import RenderContext
+digests = {{}}
+data = make_resume(5, with_photo=True)
+for template_id, entry in discover_templates().items():
+    with contextlib.redirect_stdout(io.StringIO()):
+        pdf = entry.generator(dict(data), context=RenderContext(template_id, deterministic=True)).getvalue()
+    digests[template_id] = hashlib.sha256(pdf).hexdigest()
+print(json.dumps(digests))
+"""
+
+
+def render_in_new_process(hash_seed):
+    # A different hash seed per process changes the iteration order of sets of strings, as it does between workers
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed))
+    result = subprocess.run([sys.executable, '-c', RENDER_ALL_SCRIPT.format(root=ROOT_DIR)], cwd=ROOT_DIR,
+                            env=env, capture_output=True, text=True, timeout=300, check=True)
+    return json.loads(result.stdout)
+
+
+def test_renders_in_separate_processes_are_byte_identical(monkeypatch):
+    monkeypatch.chdir(ROOT_DIR)
+    data = make_resume(5, with_photo=True)
+    here = {template_id: hashlib.sha256(render(template_id, data)).hexdigest() for template_id in TEMPLATES}
+    assert render_in_new_process(1) == here
+    assert render_in_new_process(2) == here
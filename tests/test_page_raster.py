@@ -0,0 +1,66 @@
+# tests/test_page_raster.py
+import contextlib
+import io
+
+import pytest
+from PIL import Image
+from reportlab.lib.colors import HexColor
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+from benchmarks.resume_fixtures import ROOT_DIR, make_resume
+from page_raster import encode_image, rasterize_first_page
+from pdf_templates.registry import discover_templates
+from pdf_templates.rendering import RenderContext
+
+TEMPLATES = discover_templates()
+
+
+def first_page_pdf(template_id, data):
+    with contextlib.redirect_stdout(io.StringIO()):  # Templates print debugging output
+        context = RenderContext(template_id, deterministic=True, first_page_only=True)
+        return TEMPLATES[template_id].generator(dict(data), context=context).getvalue()
+
+
+def dark_fraction(image, threshold=200):
+    histogram = image.convert('L').histogram()
+    return sum(histogram[:threshold]) / (image.width * image.height)
+
+
+@pytest.mark.parametrize('template_id', list(TEMPLATES))
+def test_every_template_rasterizes(template_id, monkeypatch):
+    monkeypatch.chdir(ROOT_DIR)  # Image paths in resume data are relative to the project root
+    image = rasterize_first_page(first_page_pdf(template_id, make_resume(5, with_photo=True)), 200)
+    assert image.mode == 'RGB'
+    assert image.width == 200
+    assert 1.25 < image.height / image.width < 1.45  # Letter or A4 portrait
+    # Text and rules cover part of the page, but not all of it
+    assert 0.01 < dark_fraction(image) < 0.9
+
+
+def test_shapes_and_text_land_where_they_are_drawn():
+    out = io.BytesIO()
+    pdf = canvas.Canvas(out, pagesize=A4)
+    width, height = A4
+    pdf.setFillColor(HexColor('#ff0000'))
+    pdf.rect(0, height / 2, width / 2, height / 2, stroke=0, fill=1)  # Top-left quarter
+    pdf.setFillColor(HexColor('#000000'))
+    pdf.setFont('Helvetica-Bold', 40)
+    pdf.drawString(width * 0.55, height * 0.25, 'Resume')  # Bottom-right quarter
+    pdf.showPage()
+    pdf.save()
+
+    image = rasterize_first_page(out.getvalue(), 300)
+    assert image.width == 300 and abs(image.height - 300 * height / width) <= 1
+    w, h = image.size
+    assert image.getpixel((w // 4, h // 4)) == (255, 0, 0)
+    assert image.getpixel((3 * w // 4, h // 4)) == (255, 255, 255)
+    assert dark_fraction(image.crop((w // 2, h // 2, w, h))) > 0.01
+    assert dark_fraction(image.crop((0, h // 2 + 2, w // 2, h))) == 0  # Past the red quarter's anti-aliased edge
+
+
+@pytest.mark.parametrize('image_format, pil_format', [('png', 'PNG'), ('webp', 'WEBP')])
+def test_encode_image(image_format, pil_format):
+    image = Image.new('RGB', (120, 170), (255, 255, 255))
+    decoded = Image.open(io.BytesIO(encode_image(image, image_format)))
+    assert (decoded.format, decoded.size) == (pil_format, (120, 170))
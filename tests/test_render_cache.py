@@ -0,0 +1,126 @@
+# tests/test_render_cache.py
+import os
+
+import pytest
+
+import render_cache
+from render_cache import RenderCache, cache_key
+
+
+def keys(n):
+    return [cache_key({'n': i}, 'template_1') for i in range(n)]
+
+
+def disk_files(path, suffix='.pdf'):
+    return sorted(name for name in os.listdir(path) if name.endswith(suffix))
+
+
+def age(cache, key, seconds_ago):
+    path = cache._path(key)
+    mtime = os.stat(path).st_mtime - seconds_ago
+    os.utime(path, (mtime, mtime))
+
+
+def test_cache_key_depends_on_data_template_and_version():
+    data = {'full_name': 'A', 'skills': 'x'}
+    assert cache_key(data, 't1', 'v1') == cache_key(dict(reversed(list(data.items()))), 't1', 'v1')
+    assert len({cache_key(data, 't1', 'v1'), cache_key(data, 't2', 'v1'),
+                cache_key(data, 't1', 'v2'), cache_key({'full_name': 'B'}, 't1', 'v1')}) == 4
+
+
+def test_memory_tier_evicts_least_recently_used_entry():
+    cache = RenderCache(max_entries=2)
+    a, b, c = keys(3)
+    cache.put(a, b'a')
+    cache.put(b, b'b')
+    assert cache.get(a) == b'a'  # Now b is the least recently used
+    cache.put(c, b'c')
+    assert cache.get(b) is None
+    assert cache.get(a) == b'a' and cache.get(c) == b'c'
+    assert cache.stats()['memory_evictions'] == 1
+
+
+def test_memory_tier_keeps_within_byte_budget():
+    cache = RenderCache(max_entries=100, max_bytes=25)
+    for key in keys(4):
+        cache.put(key, b'x' * 10)
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2 and stats['memory_bytes'] == 20
+    cache.put(keys(5)[-1], b'x' * 26)  # Larger than the whole tier: not kept in memory
+    assert cache.stats()['memory_bytes'] == 20
+
+
+def test_disk_tier_evicts_oldest_files_beyond_byte_budget(tmp_path):
+    cache = RenderCache(max_entries=0, max_bytes=0, disk_dir=str(tmp_path), max_disk_bytes=30)
+    first, second, third, fourth = keys(4)
+    for seconds_ago, key in ((30, first), (20, second), (10, third)):
+        cache.put(key, b'x' * 10)
+        age(cache, key, seconds_ago)
+    assert cache.get(first) == b'x' * 10  # Refreshes its mtime
+    cache.put(fourth, b'x' * 10)
+    assert disk_files(tmp_path) == sorted(f'{key}.pdf' for key in (first, third, fourth))
+    assert cache.stats()['disk_bytes'] == 30
+
+
+def test_disk_budget_covers_files_from_every_process(tmp_path):
+    # Two caches on one directory stand in for two worker processes
+    worker_a = RenderCache(disk_dir=str(tmp_path), max_disk_bytes=40)
+    worker_b = RenderCache(disk_dir=str(tmp_path), max_disk_bytes=40)
+    a_keys, b_keys = keys(6)[:3], keys(6)[3:]
+    for key_a, key_b in zip(a_keys, b_keys):
+        worker_a.put(key_a, b'a' * 10)
+        worker_b.put(key_b, b'b' * 10)
+    assert sum(os.path.getsize(tmp_path / name) for name in disk_files(tmp_path)) <= 40
+    assert worker_a.stats()['disk_bytes'] <= 40 and worker_b.stats()['disk_bytes'] <= 40
+
+
+def test_disk_entries_written_by_another_process_are_found(tmp_path):
+    reader = RenderCache(disk_dir=str(tmp_path))
+    writer = RenderCache(disk_dir=str(tmp_path))
+    key = keys(1)[0]
+    writer.put(key, b'%PDF shared')
+    data, path = reader.lookup(key)
+    assert data is None and path == reader._path(key)
+    assert reader.get(key) == b'%PDF shared'
+
+
+def test_disk_index_is_rebuilt_on_start(tmp_path):
+    key = keys(1)[0]
+    RenderCache(disk_dir=str(tmp_path)).put(key, b'%PDF kept')
+    restarted = RenderCache(disk_dir=str(tmp_path))
+    assert restarted.stats()['disk_entries'] == 1
+    assert restarted.get(key) == b'%PDF kept'
+
+
+def test_disk_writes_are_atomic(tmp_path, monkeypatch):
+    cache = RenderCache(disk_dir=str(tmp_path))
+    key = keys(1)[0]
+    cache.put(key, b'%PDF old')
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(render_cache.os, 'replace', failing_replace)
+    cache.put(key, b'%PDF new')
+    monkeypatch.undo()
+    # The old file is untouched and no partial or temporary file is left behind
+    with open(cache._path(key), 'rb') as f:
+        assert f.read() == b'%PDF old'
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
+
+
+def test_clear_removes_both_tiers(tmp_path):
+    cache = RenderCache(disk_dir=str(tmp_path))
+    for key in keys(3):
+        cache.put(key, b'x')
+    cache.clear()
+    assert disk_files(tmp_path) == []
+    assert all(cache.get(key) is None for key in keys(3))
+
+
+@pytest.mark.skipif(render_cache.fcntl is None, reason="needs fcntl")
+def test_directory_lock_file_is_not_an_entry(tmp_path):
+    cache = RenderCache(disk_dir=str(tmp_path))
+    cache.put(keys(1)[0], b'x')
+    assert render_cache.LOCK_FILE_NAME in os.listdir(tmp_path)
+    assert cache.stats()['disk_entries'] == 1
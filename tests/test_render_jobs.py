@@ -0,0 +1,108 @@
+# tests/test_render_jobs.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import render_jobs
+from render_cache import RenderCache, cache_key
+from render_jobs import QueueFullError, RenderJobManager
+
+
+@pytest.fixture
+def release(monkeypatch):
+    """Renders on threads that block until the returned event is set, instead of on a process pool."""
+    event = threading.Event()
+
+    def fake_render(template_id, resume_data, deterministic=False):
+        if not event.wait(5):
+            raise RuntimeError('never released')
+        return f"%PDF {template_id} {resume_data['n']}".encode()
+
+    monkeypatch.setattr(render_jobs, 'render_pdf_bytes', fake_render)
+    yield event
+    event.set()
+
+
+def make_manager(tmp_path=None, **kwargs):
+    status_cache = None
+    if tmp_path is not None:
+        status_cache = RenderCache(max_entries=0, max_bytes=0, disk_dir=str(tmp_path / 'jobs'), suffix='.json')
+    manager = RenderJobManager(status_cache=status_cache, **kwargs)
+    manager._executor = ThreadPoolExecutor(max_workers=4)
+    return manager
+
+
+def wait_for(manager, job_id, status='done'):
+    for _ in range(500):  # The done callback runs just after the future resolves
+        job = manager.get(job_id)
+        if job.status == status:
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} is still {job.status}")
+
+
+def test_job_id_is_the_cache_key_and_result_goes_to_on_complete(release):
+    stored = {}
+    manager = make_manager(on_complete=lambda job: stored.update({job.cache_key: job.result}))
+    key = cache_key({'n': 1}, 'template_1')
+    job = manager.submit('template_1', {'n': 1}, cache_key=key)
+    assert job.id == key
+    assert manager.submit('template_1', {'n': 1}, cache_key=key) is job  # Still running: no second render
+    release.set()
+    wait_for(manager, key)
+    assert stored[key] == b'%PDF template_1 1'
+    assert job.result is None  # Handed over, not kept in the job table
+
+
+def test_status_is_shared_with_other_managers(release, tmp_path):
+    first = make_manager(tmp_path, on_complete=lambda job: None)
+    second = make_manager(tmp_path)
+    key = cache_key({'n': 1}, 'template_1')
+    first.submit('template_1', {'n': 1}, cache_key=key)
+    assert second.get(key).status == 'queued'
+    release.set()
+    seen = wait_for(second, key)
+    assert (seen.status, seen.template_id, seen.cache_key) == ('done', 'template_1', key)
+    assert second.get(cache_key({'n': 2}, 'template_1')) is None
+
+
+def test_other_managers_report_a_timeout_past_the_deadline(release, tmp_path, monkeypatch):
+    first = make_manager(tmp_path, timeout=60)
+    second = make_manager(tmp_path, timeout=60)
+    key = cache_key({'n': 1}, 'template_1')
+    first.submit('template_1', {'n': 1}, cache_key=key)
+    assert second.get(key).status == 'queued'
+    later = time.time() + 61
+    monkeypatch.setattr(render_jobs.time, 'time', lambda: later)
+    assert second.get(key).status == 'timeout'
+
+
+def test_timed_out_renders_still_count_against_max_pending(release):
+    manager = make_manager(max_pending=1, timeout=1, result_ttl=0)
+    job = manager.submit('template_1', {'n': 1}, cache_key=cache_key({'n': 1}, 'template_1'))
+    job.deadline = time.time() - 1
+    assert manager.get(job.id).status == 'timeout'
+    with pytest.raises(QueueFullError):  # Its render still occupies the worker, even past result_ttl
+        manager.submit('template_1', {'n': 2}, cache_key=cache_key({'n': 2}, 'template_1'))
+    assert manager.stats()['pending'] == 1
+    release.set()
+    job.future.result(timeout=5)
+    assert manager.submit('template_1', {'n': 2}, cache_key=cache_key({'n': 2}, 'template_1'))
+
+
+def test_submit_all_queues_all_or_nothing(release):
+    manager = make_manager(max_pending=3)
+    renders = [('template_1', {'n': n}, cache_key({'n': n}, 'template_1')) for n in range(3)]
+    pending = manager.submit_all(renders[:2])
+    assert sorted(job.id for job in pending.values()) == sorted(key for _, _, key in renders[:2])
+    with pytest.raises(QueueFullError):
+        manager.submit_all([renders[2], ('template_1', {'n': 3}, cache_key({'n': 3}, 'template_1'))])
+    assert manager.stats()['pending'] == 2  # Nothing from the rejected batch was queued
+    # Renders already in progress are shared, not counted again
+    assert set(manager.submit_all(renders)) >= set(pending)
+    release.set()
+    assert sorted(future.result(timeout=5) for future in pending) == [b'%PDF template_1 0', b'%PDF template_1 1']
+    for _, _, key in renders:
+        assert wait_for(manager, key).future is None  # Finished jobs let go of the future and its PDF
@@ -0,0 +1,112 @@
+# tests/test_session_store.py
+import pytest
+from flask import Flask, session
+
+import session_store
+from session_store import MemorySessionStore, ServerSideSessionInterface, SQLiteSessionStore
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'memory':
+        return MemorySessionStore()
+    return SQLiteSessionStore(str(tmp_path / 'sessions.sqlite3'))
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_store.time, 'time', clock.time)
+    return clock
+
+
+def test_round_trip(store):
+    store.save('sid-1', b'{"resume_data": {}}', ttl=60)
+    assert store.load('sid-1') == b'{"resume_data": {}}'
+    store.save('sid-1', b'updated', ttl=60)
+    assert store.load('sid-1') == b'updated'
+    assert store.load('unknown') is None
+
+
+def test_sessions_expire_after_ttl(store, clock):
+    store.save('sid-1', b'payload', ttl=60)
+    clock.now += 59
+    assert store.load('sid-1') == b'payload'
+    clock.now += 2
+    assert store.load('sid-1') is None
+
+
+def test_touch_extends_expiry(store, clock):
+    store.save('sid-1', b'payload', ttl=60)
+    clock.now += 50
+    store.touch('sid-1', ttl=60)
+    clock.now += 50
+    assert store.load('sid-1') == b'payload'
+    store.touch('unknown', ttl=60)
+    assert store.load('unknown') is None
+
+
+def test_delete(store):
+    store.save('sid-1', b'payload', ttl=60)
+    store.delete('sid-1')
+    assert store.load('sid-1') is None
+    store.delete('sid-1')  # Deleting twice is harmless
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemorySessionStore(max_entries=2)
+    store.save('a', b'1', ttl=60)
+    store.save('b', b'2', ttl=60)
+    store.load('a')
+    store.save('c', b'3', ttl=60)
+    assert store.load('b') is None
+    assert store.load('a') == b'1' and store.load('c') == b'3'
+
+
+def test_sqlite_sessions_are_shared_between_store_instances(tmp_path):
+    # Each worker process opens its own store on the same file
+    path = str(tmp_path / 'sessions.sqlite3')
+    SQLiteSessionStore(path).save('sid-1', b'payload', ttl=60)
+    assert SQLiteSessionStore(path).load('sid-1') == b'payload'
+
+
+def test_flask_session_survives_across_app_instances(tmp_path):
+    path = str(tmp_path / 'sessions.sqlite3')
+
+    def make_app():
+        app = Flask(__name__)
+        app.secret_key = 'test'
+        app.session_interface = ServerSideSessionInterface(SQLiteSessionStore(path))
+
+        @app.route('/set')
+        def set_value():
+            session['resume_data'] = {'full_name': 'Maeve Delaney'}
+            return ''
+
+        @app.route('/get')
+        def get_value():
+            return session.get('resume_data', {}).get('full_name', '')
+
+        @app.route('/clear')
+        def clear_value():
+            session.clear()
+            return ''
+
+        return app
+
+    first, second = make_app().test_client(), make_app().test_client()
+    first.get('/set')
+    sid = first.get_cookie('session').value
+    assert len(sid) >= 32 and 'Maeve' not in sid  # The cookie carries only the id
+    second.set_cookie('session', sid)
+    assert second.get('/get').get_data(as_text=True) == 'Maeve Delaney'
+    second.get('/clear')
+    assert first.get('/get').get_data(as_text=True) == ''
@@ -0,0 +1,82 @@
+# warmup.py
+"""Startup warm-up: render sample data through chosen templates before a worker takes traffic.
+
+A fresh worker loads ReportLab's platypus modules, font metrics, Pillow and
+each template's code (and builds its stylesheet) on the first render that
+needs them, so the first downloads after a deploy or scale-up are far slower
+than steady state. WarmUp does those first renders itself, in a background
+thread, and reports readiness only once they are done. A template that fails
+to render is logged and reported but does not hold readiness back.
+
+Nothing runs at import: the app starts the warm-up on its first request (the
+readiness probe's, usually), so it runs in the serving process even when the
+app is imported before workers fork (gunicorn --preload) and never in scripts
+that merely import the app.
+"""
+import os
+import threading
+import time
+
+from pdf_templates.rendering import RenderContext
+
+
+class WarmUp:
+    """Renders `sample_data` once through each template in `template_ids` ('all', a list, or comma-separated)."""
+
+    def __init__(self, registry, template_ids, sample_data, logger=None):
+        self.registry = registry
+        self.template_ids = template_ids
+        self.sample_data = sample_data
+        self.logger = logger
+        self.started_at = None
+        self.finished_at = None
+        self.results = {}  # template id -> seconds, or the error message
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._started_in = None  # Pid of the process whose thread runs the warm-up
+
+    @property
+    def ready(self):
+        return self._done.is_set()
+
+    def start(self):
+        """Runs the warm-up in a daemon thread, once per process; returns immediately."""
+        if self._started_in == os.getpid():
+            return
+        with self._lock:
+            if self._started_in == os.getpid():
+                return
+            self._started_in = os.getpid()  # A forked child has no thread: it starts its own
+            if not self.template_ids:
+                self.run()  # Nothing to render: ready before the request that started it is answered
+                return
+            threading.Thread(target=self.run, name='template-warmup', daemon=True).start()
+
+    def run(self):
+        self.started_at = time.time()
+        try:
+            for entry in self.registry.warm_up(self.template_ids):  # Imports; skips unknown ids
+                self._render(entry)
+        finally:
+            self.finished_at = time.time()
+            self._done.set()
+        if self.logger is not None:
+            self.logger.info(f"Warm-up finished in {self.finished_at - self.started_at:.2f}s: {self.results}")
+
+    def _render(self, entry):
+        template_id = entry.id
+        start = time.perf_counter()
+        try:
+            entry.generator(dict(self.sample_data), context=RenderContext(template_id, deterministic=True)).close()
+            self.results[template_id] = round(time.perf_counter() - start, 3)
+        except Exception as e:
+            self.results[template_id] = f"{type(e).__name__}: {' '.join(str(e).split())}"[:300]
+            if self.logger is not None:
+                self.logger.warning(f"Warm-up render of {template_id} failed: {self.results[template_id]}")
+
+    def status(self):
+        return {
+            'ready': self.ready,
+            'templates': self.results,
+            'seconds': round(self.finished_at - self.started_at, 3) if self.finished_at else None,
+        }
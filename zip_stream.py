@@ -0,0 +1,42 @@
+# zip_stream.py
+"""Builds a ZIP archive incrementally, yielding its bytes as entries are added.
+
+zipfile.ZipFile can write to an unseekable stream (it then records sizes in
+data descriptors), so the archive is produced front to back and only the
+entry being added is ever held in memory.
+"""
+import time
+import zipfile
+
+
+class _ChunkSink:
+    """Write-only, unseekable file object collecting what ZipFile writes until it is drained."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def stream_zip(entries):
+    """Yields the bytes of a ZIP containing `entries`, an iterable of (name, bytes) pairs.
+
+    Entries are stored uncompressed: PDF page streams are already compressed.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for name, data in entries:
+            info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            info.external_attr = 0o644 << 16
+            archive.writestr(info, data)
+            yield from sink.drain()
+    yield from sink.drain()  # Central directory, written on close